@@ -1,29 +1,190 @@
+import io
+import os
+from collections import OrderedDict
 from pathlib import Path
 
 import pygame
 
+from core.asset_pack import PACK_FILENAME, open_asset_pack
+from core.texture_atlas import atlas_group, build_texture_atlas
+
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-_IMAGE_CACHE = {}
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# 解码/缩放后的图像按 (路径, 尺寸) 缓存，按字节数做 LRU 淘汰。
+_IMAGE_CACHE = OrderedDict()
+_IMAGE_CACHE_BYTES = 0
+_UNSET = object()
+_ASSET_PACK = _UNSET
+# 图集目录 -> TextureAtlas；目录内没有可打包的图时记为 None。
+_ATLASES = {}
+_SOUND_CACHE = {}
+# 经本模块（及缩放金字塔）新建的图像 Surface 总数，帧分析据此统计绘制期间的分配。
+_IMAGE_ALLOCATIONS = 0
 
 
 def project_path(*parts):
     return PROJECT_ROOT.joinpath(*parts)
 
 
-def load_image_if_exists(path, size=None):
-    asset_path = Path(path)
+def get_asset_pack():
+    """首次使用时打开 assets/asset_pack.bin；不存在时返回 None。"""
+    global _ASSET_PACK
+    if _ASSET_PACK is _UNSET:
+        _ASSET_PACK = open_asset_pack(project_path("assets", PACK_FILENAME))
+    return _ASSET_PACK
+
+
+def set_asset_pack(pack):
+    """替换当前资源包（None 表示禁用），并清空已缓存的图像。"""
+    global _ASSET_PACK
+    _ASSET_PACK = pack
+    _ATLASES.clear()
+    clear_image_cache()
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def count_image_allocation(count=1):
+    global _IMAGE_ALLOCATIONS
+    _IMAGE_ALLOCATIONS += count
+
+
+def image_allocations():
+    """进程启动以来解码、缩放、复制或逐帧合成出的图像 Surface 总数。"""
+    return _IMAGE_ALLOCATIONS
+
+
+def image_cache_bytes():
+    return _IMAGE_CACHE_BYTES
+
+
+def clear_image_cache():
+    global _IMAGE_CACHE_BYTES
+    _IMAGE_CACHE.clear()
+    _IMAGE_CACHE_BYTES = 0
+
+
+def _cache_image(cache_key, image):
+    global _IMAGE_CACHE_BYTES
+    image_bytes = surface_bytes(image)
+    if image_bytes > IMAGE_CACHE_MAX_BYTES:
+        return
+    while _IMAGE_CACHE and _IMAGE_CACHE_BYTES + image_bytes > IMAGE_CACHE_MAX_BYTES:
+        _key, evicted = _IMAGE_CACHE.popitem(last=False)
+        _IMAGE_CACHE_BYTES -= surface_bytes(evicted)
+    _IMAGE_CACHE[cache_key] = image
+    _IMAGE_CACHE_BYTES += image_bytes
+
+
+def _pack_key(asset_path):
+    try:
+        return asset_path.relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return None
+
+
+def _decode_image(asset_path):
+    pack = get_asset_pack()
+    if pack is not None:
+        key = _pack_key(asset_path)
+        if key is not None and key in pack:
+            return pack.load_surface(key)
     if not asset_path.exists():
         return None
+    return pygame.image.load(str(asset_path))
 
-    cache_key = (str(asset_path.resolve()), size)
-    if cache_key in _IMAGE_CACHE:
-        return _IMAGE_CACHE[cache_key].copy()
 
-    image = pygame.image.load(str(asset_path))
-    if pygame.display.get_surface() is not None:
+def get_texture_atlas(directory):
+    """首次访问某个图集目录时解码其中全部 PNG 并合并为一张图集。"""
+    directory = Path(directory)
+    if directory not in _ATLASES:
+        images = {}
+        for image_path in sorted(directory.glob("*.png")):
+            image = _decode_image(image_path)
+            if image is not None:
+                images[image_path.name] = image
+        _ATLASES[directory] = build_texture_atlas(images) if images else None
+    return _ATLASES[directory]
+
+
+def _load_source_image(asset_path):
+    group = atlas_group(asset_path, PROJECT_ROOT)
+    if group is not None:
+        atlas = get_texture_atlas(group)
+        if atlas is not None and asset_path.name in atlas:
+            atlas.ensure_display_format()
+            return atlas.subsurface(asset_path.name)
+    return _decode_image(asset_path)
+
+
+def load_image_if_exists(path, size=None, mutable=False):
+    """返回缓存中的共享 Surface，调用方只能读取/blit；需要在图像上绘制时传 mutable=True 取副本。"""
+    asset_path = Path(os.path.abspath(path))
+    cache_key = (str(asset_path), size)
+    image = _IMAGE_CACHE.get(cache_key)
+    if image is not None:
+        _IMAGE_CACHE.move_to_end(cache_key)
+        if mutable:
+            count_image_allocation()
+            return image.copy()
+        return image
+
+    image = _load_source_image(asset_path)
+    if image is None:
+        return None
+    count_image_allocation(2 if mutable else 1)
+    # 图集子图已随图集整体转换过格式，直接共享其像素。
+    if pygame.display.get_surface() is not None and image.get_parent() is None:
         image = image.convert_alpha()
     if size:
         image = pygame.transform.smoothscale(image, size)
-    _IMAGE_CACHE[cache_key] = image
-    return image.copy()
+    _cache_image(cache_key, image)
+    return image.copy() if mutable else image
+
+
+def is_image_cached(path, size=None):
+    return (os.path.abspath(path), size) in _IMAGE_CACHE
+
+
+def decode_image_pixels(path, size=None):
+    """可在后台线程调用：解码并缩放图像，返回 (RGBA 字节, 尺寸)；不读写任何缓存。"""
+    image = _decode_image(Path(os.path.abspath(path)))
+    if image is None:
+        return None
+    if size:
+        image = pygame.transform.smoothscale(image, size)
+    return pygame.image.tobytes(image, "RGBA"), image.get_size()
+
+
+def store_decoded_image(path, size, pixels, pixel_size):
+    """主线程调用：把后台解码好的像素转换为显示格式并放入图像缓存。"""
+    cache_key = (os.path.abspath(path), size)
+    image = _IMAGE_CACHE.get(cache_key)
+    if image is not None:
+        return image
+    image = pygame.image.frombytes(pixels, pixel_size, "RGBA")
+    count_image_allocation()
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    _cache_image(cache_key, image)
+    return image
+
+
+def load_sound_if_exists(path, data=None):
+    """按路径缓存音效；data 为后台预读的文件内容时直接从内存创建。"""
+    key = os.path.abspath(path)
+    if key in _SOUND_CACHE:
+        return _SOUND_CACHE[key]
+    if not pygame.mixer.get_init():
+        return None
+    if data is None:
+        if not os.path.exists(key):
+            return None
+        sound = pygame.mixer.Sound(key)
+    else:
+        sound = pygame.mixer.Sound(file=io.BytesIO(data))
+    _SOUND_CACHE[key] = sound
+    return sound
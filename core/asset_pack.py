@@ -0,0 +1,122 @@
+import json
+import mmap
+import struct
+from pathlib import Path
+
+import pygame
+
+
+PACK_MAGIC = b"VSAP"
+PACK_VERSION = 1
+PACK_FILENAME = "asset_pack.bin"
+PACK_ALIGNMENT = 16
+PACK_SOURCE_DIRS = (
+    ("assets", "ui"),
+    ("assets", "branding"),
+)
+PACK_GAME_ASSET_GLOB = "games/*/*/assets/objects"
+# 1024px 级别的品牌原图只用于打包图标，解码后体积过大，保留为 PNG。
+PACK_MAX_DIMENSION = 256
+
+# magic(4) + version(u16) + reserved(u16) + index_length(u32)
+_HEADER = struct.Struct("<4sHHI")
+
+
+def _align(value, alignment=PACK_ALIGNMENT):
+    return (value + alignment - 1) // alignment * alignment
+
+
+def pack_key(path, root):
+    """资源在包内的键：相对项目根目录的 posix 路径。"""
+    return Path(path).relative_to(root).as_posix()
+
+
+def iter_pack_sources(root):
+    root = Path(root)
+    directories = [root.joinpath(*parts) for parts in PACK_SOURCE_DIRS]
+    directories.extend(sorted(root.glob(PACK_GAME_ASSET_GLOB)))
+    for directory in directories:
+        if not directory.is_dir():
+            continue
+        for image_path in sorted(directory.glob("*.png")):
+            yield image_path
+
+
+def build_asset_pack(root, output_path):
+    """把 PNG 预解码为 RGBA 像素块并连同索引写入单个文件，返回写入的条目数。"""
+    root = Path(root)
+    entries = {}
+    blocks = []
+    offset = 0
+    for image_path in iter_pack_sources(root):
+        image = pygame.image.load(str(image_path))
+        if max(image.get_size()) > PACK_MAX_DIMENSION:
+            continue
+        pixels = pygame.image.tobytes(image, "RGBA")
+        width, height = image.get_size()
+        entries[pack_key(image_path, root)] = {"offset": offset, "width": width, "height": height}
+        padded_length = _align(len(pixels))
+        blocks.append(pixels + b"\0" * (padded_length - len(pixels)))
+        offset += padded_length
+
+    index_bytes = json.dumps({"version": PACK_VERSION, "entries": entries}, sort_keys=True).encode("utf-8")
+    data_start = _align(_HEADER.size + len(index_bytes))
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as handle:
+        handle.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(index_bytes)))
+        handle.write(index_bytes)
+        handle.write(b"\0" * (data_start - _HEADER.size - len(index_bytes)))
+        for block in blocks:
+            handle.write(block)
+    return len(entries)
+
+
+class AssetPack:
+    """以内存映射方式读取资源包，按需从像素块创建 Surface。"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            # ACCESS_COPY 让 frombuffer 拿到可写视图，写入只落在进程私有页上。
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, _reserved, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"Unsupported asset pack: {self.path}")
+        index = json.loads(self._map[_HEADER.size:_HEADER.size + index_length].decode("utf-8"))
+        self._data_start = _align(_HEADER.size + index_length)
+        self._entries = index.get("entries", {})
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def load_surface(self, key):
+        entry = self._entries.get(key)
+        if entry is None or self._map is None:
+            return None
+        width = int(entry["width"])
+        height = int(entry["height"])
+        start = self._data_start + int(entry["offset"])
+        view = memoryview(self._map)[start:start + width * height * 4]
+        return pygame.image.frombuffer(view, (width, height), "RGBA")
+
+    def close(self):
+        # 仍被 Surface 引用的映射不能立即关闭，交给垃圾回收释放。
+        self._map = None
+
+
+def open_asset_pack(path):
+    """资源包缺失或损坏时返回 None，调用方回退到逐文件加载。"""
+    path = Path(path)
+    if not path.is_file():
+        return None
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError, struct.error):
+        return None
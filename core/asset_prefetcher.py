@@ -0,0 +1,104 @@
+import logging
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+
+from core import asset_loader
+
+
+logger = logging.getLogger(__name__)
+
+
+def _read_sound_bytes(path):
+    path = Path(path)
+    return path.read_bytes() if path.is_file() else None
+
+
+class AssetPrefetcher:
+    """按游戏的资源清单在后台线程解码图像、读取音效；主线程只做最后的格式转换与入缓存。"""
+
+    MAX_WORKERS = 1
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._executor = None
+        # (类型, 路径, 尺寸) -> Future；同一资源在多个游戏间只解码一次。
+        self._jobs = {}
+        self._game_jobs = {}
+
+    def _ensure_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="asset-prefetch")
+        return self._executor
+
+    def _manifest(self, game_id):
+        registry = getattr(self.manager, "game_registry", None)
+        game = registry.get_game(game_id) if registry is not None and game_id else None
+        return getattr(game, "assets", None)
+
+    def prefetch(self, game_ids):
+        """按给定顺序提交各游戏尚未缓存的资源，已提交过的游戏会被跳过。"""
+        for game_id in game_ids:
+            if game_id in self._game_jobs:
+                continue
+            manifest = self._manifest(game_id)
+            if not manifest:
+                continue
+            keys = []
+            for path, size in manifest.images:
+                path = str(asset_loader.project_path(path))
+                size = tuple(size) if size else None
+                if asset_loader.is_image_cached(path, size):
+                    continue
+                keys.append(self._submit(("image", str(path), size), asset_loader.decode_image_pixels, path, size))
+            for path in manifest.sounds:
+                path = str(asset_loader.project_path(path))
+                keys.append(self._submit(("sound", str(path), None), _read_sound_bytes, path))
+            self._game_jobs[game_id] = keys
+
+    def _submit(self, key, func, *args):
+        if key not in self._jobs:
+            self._jobs[key] = self._ensure_executor().submit(func, *args)
+        return key
+
+    def pending(self):
+        return len(self._jobs)
+
+    def step(self, budget_seconds=0.002):
+        """把已完成的后台结果交给缓存，单帧最多占用 budget_seconds。"""
+        started = time.perf_counter()
+        for key in [key for key, future in self._jobs.items() if future.done()]:
+            self._finish(key)
+            if time.perf_counter() - started >= budget_seconds:
+                break
+
+    def flush(self, game_id):
+        """进入游戏前等待该游戏剩余的资源，保证第一帧就能命中缓存。"""
+        for key in self._game_jobs.pop(game_id, ()):
+            if key in self._jobs:
+                self._finish(key)
+
+    def _finish(self, key):
+        future = self._jobs.pop(key)
+        kind, path, size = key
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as error:
+            logger.warning("Asset prefetch failed for %s: %s", path, error)
+            return
+        if result is None:
+            return
+        if kind == "image":
+            pixels, pixel_size = result
+            asset_loader.store_decoded_image(path, size, pixels, pixel_size)
+        else:
+            asset_loader.load_sound_if_exists(path, data=result)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._jobs.clear()
+        self._game_jobs.clear()
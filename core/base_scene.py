@@ -1,45 +1,23 @@
-import os
-import pygame
-from core.app_paths import get_resource_path
+from core.font_pool import CHINESE_FONT_SCALE, adjust_font_size, get_shared_font
+from core.quality_governor import QUALITY_HIGH
 
 
 class BaseScene:
-    CHINESE_FONT_SCALE = 0.88
+    CHINESE_FONT_SCALE = CHINESE_FONT_SCALE
+    # 置为 True 后由 SceneManager.update_scene 以固定步长多次调用 fixed_update。
+    FIXED_TIMESTEP = False
+    # 不处理 MOUSEMOTION 的场景运行时主循环在 SDL 层屏蔽该事件；处理它的场景需置为 True。
+    HANDLES_MOUSEMOTION = False
 
     def __init__(self, manager):
         self.manager = manager
-        self._font_cache = {}
         self._font_language_marker = self.manager.settings.get("language", "en-US")
 
-    def _get_chinese_font_path(self):
-        font_path = get_resource_path("assets", "SimHei.ttf")
-        return font_path if os.path.exists(font_path) else None
-
     def create_font(self, size, bold=False, italic=False):
-        """根据当前语言创建字体；中文优先使用项目内置 TTF。"""
+        """根据当前语言获取共享字体；中文优先使用项目内置 TTF。"""
         language = self.manager.settings.get("language", "en-US")
-        adjusted_size = size
-        if language == "zh-CN":
-            adjusted_size = max(10, int(round(size * self.CHINESE_FONT_SCALE)))
-
-        cache_key = (language, adjusted_size, bold, italic)
-        if cache_key in self._font_cache:
-            return self._font_cache[cache_key]
-
-        font = None
-        if language == "zh-CN":
-            font_path = self._get_chinese_font_path()
-            if font_path:
-                font = pygame.font.Font(font_path, adjusted_size)
-            else:
-                font = pygame.font.SysFont("SimHei", adjusted_size)
-        else:
-            font = pygame.font.SysFont(None, adjusted_size)
-
-        font.set_bold(bold)
-        font.set_italic(italic)
-        self._font_cache[cache_key] = font
-        return font
+        adjusted_size = adjust_font_size(language, size, self.CHINESE_FONT_SCALE)
+        return get_shared_font(language, adjusted_size, bold, italic)
 
     def refresh_fonts_if_needed(self):
         """仅在语言切换时刷新字体引用，避免每帧重复刷新。"""
@@ -215,6 +193,25 @@ class BaseScene:
             surface = font.render(fitted, True, color)
             screen.blit(surface, (column_x, row_y))
 
+    def quality_tier(self):
+        """当前画质档位；没有画质调节器时视为最高档。"""
+        quality = getattr(self.manager, "quality", None)
+        return QUALITY_HIGH if quality is None else quality.tier
+
+    def quality_at_least(self, tier):
+        return self.quality_tier() >= tier
+
+    def mark_stimulus_onset(self, label=None):
+        """新刺激出现时调用，延迟统计开启时返回带呈现时刻的记录，否则返回 None。"""
+        latency = getattr(self.manager, "latency", None)
+        if latency is None:
+            return None
+        return latency.stimulus_onset(label)
+
+    def interpolation_alpha(self):
+        """固定步长场景绘制时在上一模拟步与当前步之间的插值比例。"""
+        return max(0.0, min(1.0, float(getattr(self.manager, "interpolation_alpha", 1.0))))
+
     def frame_scale(self, clamp=3.0):
         scale = float(getattr(self.manager, "frame_scale", 1.0))
         return max(0.25, min(clamp, scale))
@@ -243,6 +240,9 @@ class BaseScene:
     def update(self):
         pass
 
+    def fixed_update(self, dt):
+        self.update()
+
     def draw(self, screen):
         pass
 
@@ -0,0 +1,220 @@
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import tracemalloc
+from datetime import datetime
+
+import pygame
+
+from core import asset_loader, e_generator, scale_pyramid
+from core.app_paths import get_user_data_dir
+from core.frame_profiler import active_scene_path
+from core.scene_prewarmer import estimate_surface_bytes
+from games.common import particles
+
+
+CAPTURE_FORMAT = "visionseed-diagnostics"
+CAPTURE_VERSION = 1
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 40
+TOP_SURFACE_OWNERS = 20
+TRACEMALLOC_FRAMES = 8
+# 进程级的 Surface 缓存，统计内存时逐个列出占用。
+MODULE_CACHES = (
+    ("asset_loader._IMAGE_CACHE", lambda: asset_loader._IMAGE_CACHE),
+    ("asset_loader._ATLASES", lambda: asset_loader._ATLASES),
+    ("scale_pyramid._PYRAMIDS", lambda: scale_pyramid._PYRAMIDS),
+    ("e_generator._OPTOTYPE_CACHE", lambda: e_generator._OPTOTYPE_CACHE),
+    ("particles._DOT_SPRITES", lambda: particles._DOT_SPRITES),
+)
+
+
+def _scene_chain(scene):
+    chain = []
+    while scene is not None and all(scene is not item for item in chain):
+        chain.append(scene)
+        scene = getattr(scene, "active_game_scene", None) or getattr(scene, "current_scene", None)
+    return chain
+
+
+def surface_owners(manager, limit=TOP_SURFACE_OWNERS):
+    """按 Surface 字节数列出模块缓存与当前场景链上各属性的占用，从大到小排列。"""
+    owners = []
+    for name, getter in MODULE_CACHES:
+        cache = getter()
+        owners.append({"owner": name, "bytes": estimate_surface_bytes(cache, max_depth=3), "entries": len(cache)})
+    for scene in _scene_chain(manager.get_scene()):
+        for attr, value in vars(scene).items():
+            if value is manager:
+                continue
+            size = estimate_surface_bytes(value, skip=(manager, scene))
+            if size:
+                entry = {"owner": f"{type(scene).__name__}.{attr}", "bytes": size}
+                if hasattr(value, "__len__"):
+                    entry["entries"] = len(value)
+                owners.append(entry)
+    owners.sort(key=lambda item: item["bytes"], reverse=True)
+    return owners[:limit]
+
+
+class DiagnosticsService:
+    """现场排查用的 cProfile / tracemalloc 采集；未启用时不在主循环中产生任何开销。
+
+    每次采集写出一个 JSON 清单（运行环境、当前场景、帧统计、Surface 占用与热点摘要），
+    并附带原始的 .prof / .tracemalloc 文件，两次采集可以直接对比。
+    """
+
+    def __init__(self, manager, output_dir=None):
+        self.manager = manager
+        self.output_dir = output_dir
+        self._cpu_profile = None
+        self._cpu_started_at = None
+        self._last_snapshot = None
+        self._last_snapshot_name = None
+        self._owns_tracing = False
+
+    @property
+    def cpu_profiling(self):
+        return self._cpu_profile is not None
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def _directory(self):
+        directory = self.output_dir or os.path.join(get_user_data_dir(), "diagnostics")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def _capture_name(self, kind):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        return f"{stamp}-{kind}"
+
+    def _manifest(self, kind, started_at=None):
+        manager = self.manager
+        clock = getattr(manager, "clock", None)
+        quality = getattr(manager, "quality", None)
+        profiler = getattr(manager, "profiler", None)
+        latency = getattr(manager, "latency", None)
+        return {
+            "format": CAPTURE_FORMAT,
+            "version": CAPTURE_VERSION,
+            "kind": kind,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": started_at,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frame_index": getattr(clock, "frame_index", None),
+            "scene": active_scene_path(manager.get_scene()),
+            "screen_size": list(manager.screen_size) if getattr(manager, "screen_size", None) else None,
+            "quality": quality.name if quality is not None else None,
+            "frame_profile": profiler.stats() if profiler is not None else {},
+            "latency": latency.report() if latency is not None and latency.enabled else {},
+            "surface_owners": surface_owners(manager),
+        }
+
+    def _write_manifest(self, name, manifest):
+        path = os.path.join(self._directory(), f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return path
+
+    def start_cpu_profile(self):
+        if self._cpu_profile is not None:
+            return
+        self._cpu_profile = cProfile.Profile()
+        self._cpu_started_at = datetime.now().isoformat(timespec="seconds")
+        self._cpu_profile.enable()
+
+    def stop_cpu_profile(self):
+        """停止 cProfile 并写出 .prof 与清单，返回清单路径；未在采集时返回 None。"""
+        profile = self._cpu_profile
+        if profile is None:
+            return None
+        profile.disable()
+        self._cpu_profile = None
+        name = self._capture_name("cpu")
+        prof_path = os.path.join(self._directory(), f"{name}.prof")
+        profile.dump_stats(prof_path)
+
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        top_functions = []
+        for func in stats.fcn_list[:TOP_FUNCTIONS]:
+            calls, primitive_calls, tottime, cumtime, _callers = stats.stats[func]
+            filename, line, function = func
+            top_functions.append(
+                {
+                    "function": f"{filename}:{line}({function})",
+                    "calls": calls,
+                    "primitive_calls": primitive_calls,
+                    "tottime": tottime,
+                    "cumtime": cumtime,
+                }
+            )
+        manifest = self._manifest("cpu", started_at=self._cpu_started_at)
+        manifest["files"] = {"pstats": os.path.basename(prof_path)}
+        manifest["total_time"] = stats.total_tt
+        manifest["top_functions"] = top_functions
+        return self._write_manifest(name, manifest)
+
+    def toggle_cpu_profile(self):
+        if self.cpu_profiling:
+            return self.stop_cpu_profile()
+        self.start_cpu_profile()
+        return None
+
+    def start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._owns_tracing = True
+
+    def capture_memory(self):
+        """未开启 tracemalloc 时先开启并返回 None；之后每次调用写出一份快照与清单。
+
+        清单中的 growth 是相对上一份快照的增量，便于定位持续增长的分配点。
+        """
+        if not tracemalloc.is_tracing():
+            self.start_tracing()
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        name = self._capture_name("memory")
+        snapshot_path = os.path.join(self._directory(), f"{name}.tracemalloc")
+        snapshot.dump(snapshot_path)
+
+        manifest = self._manifest("memory")
+        manifest["files"] = {"snapshot": os.path.basename(snapshot_path)}
+        manifest["traced_current"] = current
+        manifest["traced_peak"] = peak
+        manifest["top_allocations"] = [
+            {"trace": str(stat.traceback[0]), "size": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+        ]
+        if self._last_snapshot is not None:
+            manifest["compared_to"] = self._last_snapshot_name
+            manifest["growth"] = [
+                {"trace": str(stat.traceback[0]), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in snapshot.compare_to(self._last_snapshot, "lineno")[:TOP_ALLOCATIONS]
+            ]
+        self._last_snapshot = snapshot
+        self._last_snapshot_name = name
+        return self._write_manifest(name, manifest)
+
+    def shutdown(self):
+        """退出前把仍在进行的采集落盘，返回写出的清单路径。"""
+        paths = []
+        if self.cpu_profiling:
+            paths.append(self.stop_cpu_profile())
+        if self._owns_tracing and tracemalloc.is_tracing():
+            paths.append(self.capture_memory())
+            tracemalloc.stop()
+        self._owns_tracing = False
+        self._last_snapshot = None
+        return paths
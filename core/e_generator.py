@@ -1,51 +1,91 @@
+import math
+
+import numpy as np
 import pygame
 
 
+# 标准 E 视标为 5x5 笔画网格；每个输出像素用 SUPERSAMPLE² 个子采样求面积覆盖率。
+E_GRID = 5
+SUPERSAMPLE = 8
+E_DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+_OPTOTYPE_CACHE = {}
+
+
+def _e_mask(x, y, direction):
+    """x、y 为 5x5 网格坐标；返回落在 E 笔画内的布尔掩码。"""
+    inside = (x >= 0) & (x < E_GRID) & (y >= 0) & (y < E_GRID)
+    if direction in ("LEFT", "RIGHT"):
+        spine = x < 1 if direction == "RIGHT" else x >= E_GRID - 1
+        bars = np.floor(y) % 2 == 0
+    else:
+        spine = y >= E_GRID - 1 if direction == "UP" else y < 1
+        bars = np.floor(x) % 2 == 0
+    return inside & (spine | bars)
+
+
+def render_optotype(size, direction, color=(255, 255, 255)):
+    """按真实（可为小数）尺寸渲染 E 字：高分辨率采样后按面积平均成 alpha。"""
+    size = max(0.5, float(size))
+    canvas = max(1, int(math.ceil(size - 1e-6)))
+    offset = (canvas - size) / 2.0
+    samples = (np.arange(canvas * SUPERSAMPLE, dtype=np.float64) + 0.5) / SUPERSAMPLE
+    grid = (samples - offset) * (E_GRID / size)
+    mask = _e_mask(grid[:, None], grid[None, :], direction)
+    coverage = mask.reshape(canvas, SUPERSAMPLE, canvas, SUPERSAMPLE).mean(axis=(1, 3))
+
+    surface = pygame.Surface((canvas, canvas), pygame.SRCALPHA)
+    surface.fill((*color[:3], 0))
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    alpha[:] = np.rint(coverage * 255).astype(np.uint8)
+    del alpha
+    return surface
+
+
 class EGenerator:
     """E字生成器，用于创建不同方向和大小的E字"""
-    
+
+    @staticmethod
+    def optotype(size, direction="RIGHT", color=(255, 255, 255)):
+        """
+        返回缓存的E字表面（共享只读，不要在上面绘制）
+
+        Args:
+            size (float): E字的尺寸，可为小数
+            direction (str): 方向 ("UP", "DOWN", "LEFT", "RIGHT")
+            color (tuple): 笔画颜色
+
+        Returns:
+            pygame.Surface: E字表面
+        """
+        key = (round(float(size), 3), direction, tuple(color[:3]))
+        surface = _OPTOTYPE_CACHE.get(key)
+        if surface is None:
+            surface = render_optotype(size, direction, color)
+            _OPTOTYPE_CACHE[key] = surface
+        return surface
+
+    @staticmethod
+    def prebake(sizes, colors=((255, 255, 255),)):
+        """预先渲染给定尺寸的四个方向"""
+        for size in sizes:
+            for color in colors:
+                for direction in E_DIRECTIONS:
+                    EGenerator.optotype(size, direction, color)
+
     @staticmethod
     def create_e_surface(size, direction):
         """
-        创建指定大小和方向的E字表面
-        
+        创建指定大小和方向的E字表面（可修改的副本）
+
         Args:
             size (int): E字的尺寸
             direction (str): 方向 ("UP", "DOWN", "LEFT", "RIGHT")
-            
+
         Returns:
             pygame.Surface: E字表面
         """
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        thickness = size // 5
-        bar = size
-
-        if direction == "RIGHT":
-            pygame.draw.rect(surface, (255, 255, 255), (0, 0, thickness, size))
-            pygame.draw.rect(surface, (255, 255, 255), (0, 0, bar, thickness))
-            pygame.draw.rect(surface, (255, 255, 255), (0, size//2 - thickness//2, bar, thickness))
-            pygame.draw.rect(surface, (255, 255, 255), (0, size - thickness, bar, thickness))
-
-        elif direction == "LEFT":
-            pygame.draw.rect(surface, (255, 255, 255), (size - thickness, 0, thickness, size))
-            pygame.draw.rect(surface, (255, 255, 255), (0, 0, bar, thickness))
-            pygame.draw.rect(surface, (255, 255, 255), (0, size//2 - thickness//2, bar, thickness))
-            pygame.draw.rect(surface, (255, 255, 255), (0, size - thickness, bar, thickness))
-
-        elif direction == "UP":
-            pygame.draw.rect(surface, (255, 255, 255), (0, size - thickness, size, thickness))
-            pygame.draw.rect(surface, (255, 255, 255), (0, 0, thickness, bar))
-            pygame.draw.rect(surface, (255, 255, 255), (size//2 - thickness//2, 0, thickness, bar))
-            pygame.draw.rect(surface, (255, 255, 255), (size - thickness, 0, thickness, bar))
-
-        elif direction == "DOWN":
-            pygame.draw.rect(surface, (255, 255, 255), (0, 0, size, thickness))
-            pygame.draw.rect(surface, (255, 255, 255), (0, 0, thickness, bar))
-            pygame.draw.rect(surface, (255, 255, 255), (size//2 - thickness//2, 0, thickness, bar))
-            pygame.draw.rect(surface, (255, 255, 255), (size - thickness, 0, thickness, bar))
+        return EGenerator.optotype(size, direction).copy()
 
-        return surface
-    
     @staticmethod
     def draw_e(screen, center_pos, size, direction="RIGHT"):
         """
@@ -57,6 +97,6 @@ class EGenerator:
             size (int): E字尺寸
             direction (str): 方向，默认为"RIGHT"
         """
-        e_surface = EGenerator.create_e_surface(size, direction)
+        e_surface = EGenerator.optotype(size, direction)
         rect = e_surface.get_rect(center=center_pos)
         screen.blit(e_surface, rect)
\ No newline at end of file
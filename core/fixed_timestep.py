@@ -0,0 +1,29 @@
+class FixedTimestep:
+    """固定步长累加器：把可变的帧间隔换算成若干个等长的模拟子步。
+
+    alpha 为累加器中剩余不足一步的时间占比，绘制时用它在上一步与当前步之间插值。
+    """
+
+    def __init__(self, step_seconds, max_substeps=5):
+        self.step_seconds = float(step_seconds)
+        self.max_substeps = max(1, int(max_substeps))
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def advance(self, delta_seconds):
+        """累加本帧时间并返回需要执行的子步数；积压超过上限时丢弃多余时间，避免越跑越慢。"""
+        if self.step_seconds <= 0:
+            self.alpha = 1.0
+            return 1
+        self.accumulator += max(0.0, float(delta_seconds))
+        steps = int(self.accumulator / self.step_seconds)
+        if steps > self.max_substeps:
+            steps = self.max_substeps
+            self.accumulator = self.step_seconds * steps
+        self.accumulator -= steps * self.step_seconds
+        self.alpha = max(0.0, min(1.0, self.accumulator / self.step_seconds))
+        return steps
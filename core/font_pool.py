@@ -0,0 +1,116 @@
+import os
+import time
+
+import pygame
+
+from core.app_paths import get_resource_path
+
+
+CHINESE_FONT_SCALE = 0.88
+COMMON_FONT_SIZES = (16, 18, 20, 22, 24, 26, 28, 30, 48, 54)
+
+_FONT_POOL = {}
+_FONT_PATHS = {}
+_WARMUP_QUEUE = []
+_QUIT_HOOK_REGISTERED = False
+_RENDER_CALLS = 0
+
+
+class _PooledFont(pygame.font.Font):
+    """共享池中的 Font，额外累计 render 调用次数供帧分析使用。"""
+
+    def render(self, *args, **kwargs):
+        global _RENDER_CALLS
+        _RENDER_CALLS += 1
+        return super().render(*args, **kwargs)
+
+
+def render_calls():
+    """进程启动以来共享字体的 render 调用总数。"""
+    return _RENDER_CALLS
+
+
+def adjust_font_size(language, size, scale=CHINESE_FONT_SCALE):
+    """中文字体整体偏大，按比例缩小后再取整。"""
+    if language == "zh-CN":
+        return max(10, int(round(size * scale)))
+    return size
+
+
+def resolve_font_path(language):
+    """每种语言只解析一次字体路径；None 表示使用 pygame 内置字体。"""
+    if language in _FONT_PATHS:
+        return _FONT_PATHS[language]
+
+    font_path = None
+    if language == "zh-CN":
+        bundled_path = get_resource_path("assets", "SimHei.ttf")
+        if os.path.exists(bundled_path):
+            font_path = bundled_path
+        else:
+            font_path = pygame.font.match_font("SimHei")
+    _FONT_PATHS[language] = font_path
+    return font_path
+
+
+def _clear_on_quit():
+    global _QUIT_HOOK_REGISTERED
+    _QUIT_HOOK_REGISTERED = False
+    clear_font_pool()
+
+
+def _ensure_quit_hook():
+    # pygame.quit() 之后旧的 Font 对象不可再用，且 register_quit 回调只触发一次。
+    global _QUIT_HOOK_REGISTERED
+    if not _QUIT_HOOK_REGISTERED:
+        pygame.register_quit(_clear_on_quit)
+        _QUIT_HOOK_REGISTERED = True
+
+
+def get_shared_font(language, size, bold=False, italic=False):
+    """按 (language, size, bold, italic) 在进程内共享 Font 对象；size 为调整后的字号。"""
+    cache_key = (language, size, bool(bold), bool(italic))
+    font = _FONT_POOL.get(cache_key)
+    if font is not None:
+        return font
+
+    _ensure_quit_hook()
+    font = _PooledFont(resolve_font_path(language), size)
+    font.set_bold(bool(bold))
+    font.set_italic(bool(italic))
+    _FONT_POOL[cache_key] = font
+    return font
+
+
+def schedule_font_warmup(language, sizes=COMMON_FONT_SIZES, bold=False, italic=False):
+    """登记需要预热的字号，由 warm_pending_fonts 在空闲帧中逐个创建。"""
+    for size in sizes:
+        key = (language, adjust_font_size(language, size), bool(bold), bool(italic))
+        if key not in _FONT_POOL and key not in _WARMUP_QUEUE:
+            _WARMUP_QUEUE.append(key)
+
+
+def warm_pending_fonts(budget_seconds=0.002):
+    """在时间预算内创建排队的字体，返回本次创建的数量。"""
+    if not _WARMUP_QUEUE or not pygame.font.get_init():
+        return 0
+    deadline = time.perf_counter() + max(0.0, float(budget_seconds))
+    created = 0
+    while _WARMUP_QUEUE:
+        language, size, bold, italic = _WARMUP_QUEUE.pop(0)
+        if (language, size, bold, italic) not in _FONT_POOL:
+            get_shared_font(language, size, bold, italic)
+            created += 1
+        if time.perf_counter() >= deadline:
+            break
+    return created
+
+
+def pending_font_warmups():
+    return len(_WARMUP_QUEUE)
+
+
+def clear_font_pool():
+    _FONT_POOL.clear()
+    _FONT_PATHS.clear()
+    _WARMUP_QUEUE.clear()
@@ -0,0 +1,64 @@
+import time
+
+
+class FrameClock:
+    """基于 perf_counter 的单调时钟，每帧采样一次。
+
+    读数与启动时的 time.time() 对齐，因此仍可直接与旧的时间戳相减；
+    之后不受系统校时影响。暂停期间读数停止前进。
+    """
+
+    def __init__(self, source=time.perf_counter, epoch=None):
+        self._source = source
+        self._offset = (time.time() if epoch is None else float(epoch)) - source()
+        self._paused_total = 0.0
+        self._paused_at = None
+        self._frame_time = None
+        self.frame_index = 0
+
+    def live(self):
+        """不经帧采样的实时读数。"""
+        if self._paused_at is not None:
+            return self._paused_at
+        return self._source() + self._offset - self._paused_total
+
+    def now(self):
+        """当前帧的时间戳；主循环尚未开始采样时返回实时读数。"""
+        return self._frame_time if self._frame_time is not None else self.live()
+
+    def tick(self):
+        self._frame_time = self.live()
+        self.frame_index += 1
+        return self._frame_time
+
+    @property
+    def paused(self):
+        return self._paused_at is not None
+
+    def pause(self):
+        if self._paused_at is None:
+            self._paused_at = self.live()
+
+    def resume(self):
+        if self._paused_at is None:
+            return
+        paused_at = self._paused_at
+        self._paused_at = None
+        self._paused_total += self.live() - paused_at
+        if self._frame_time is not None:
+            self._frame_time = paused_at
+
+
+# 全局帧时钟：SceneManager 每帧 tick 一次，场景与会话状态通过 now() 读取。
+FRAME_CLOCK = FrameClock()
+
+
+def now():
+    return FRAME_CLOCK.now()
+
+
+def install(clock):
+    """替换全局帧时钟（例如回放录像时改用录制的时间轴），返回新时钟。"""
+    global FRAME_CLOCK
+    FRAME_CLOCK = clock
+    return clock
@@ -0,0 +1,186 @@
+import os
+import time
+
+import numpy as np
+import pygame
+
+from core import asset_loader, font_pool
+
+
+PHASES = ("events", "update", "draw", "flip")
+HISTORY_FRAMES = 240
+# 设置为正整数时进入无界面日志模式：每隔这么多帧输出一行统计。
+LOG_ENV = "SHIYA_FRAME_PROFILE"
+OVERLAY_WIDTH = 300
+HISTOGRAM_HEIGHT = 48
+# 直方图按 2ms 分桶，最后一桶收纳 50ms 以上的帧。
+HISTOGRAM_BIN_MS = 2.0
+HISTOGRAM_BINS = 25
+
+
+def active_scene_path(scene):
+    """沿 GameHostScene / ETrainingRootScene 等容器找到实际运行的场景，返回类名链。"""
+    names = []
+    seen = set()
+    while scene is not None and id(scene) not in seen:
+        seen.add(id(scene))
+        names.append(type(scene).__name__)
+        scene = getattr(scene, "active_game_scene", None) or getattr(scene, "current_scene", None)
+    return " > ".join(names)
+
+
+class FrameProfiler:
+    """按阶段记录帧耗时的环形缓冲；隐藏且未开日志时 lap() 直接返回。"""
+
+    def __init__(self, capacity=HISTORY_FRAMES, log_every=0):
+        self.capacity = max(1, int(capacity))
+        self.samples = np.zeros((self.capacity, len(PHASES)), dtype=np.float64)
+        self.image_allocs = np.zeros(self.capacity, dtype=np.int32)
+        self.font_renders = np.zeros(self.capacity, dtype=np.int32)
+        self.frames = 0
+        self.visible = False
+        self.log_every = max(0, int(log_every))
+        self.scene_label = ""
+        self._row = None
+        self._last = 0.0
+        self._image_base = 0
+        self._render_base = 0
+        self._font = None
+
+    @classmethod
+    def from_environment(cls, environ=None):
+        value = (environ if environ is not None else os.environ).get(LOG_ENV, "")
+        try:
+            log_every = int(value)
+        except ValueError:
+            log_every = HISTORY_FRAMES if value else 0
+        return cls(log_every=log_every)
+
+    @property
+    def enabled(self):
+        return self.visible or self.log_every > 0
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def close(self):
+        """停止采样。"""
+        self.visible = False
+        self.log_every = 0
+        self._row = None
+
+    def start_frame(self):
+        if not self.enabled:
+            self._row = None
+            return
+        self._row = self.samples[self.frames % self.capacity]
+        self._row[:] = 0.0
+        self._image_base = asset_loader.image_allocations()
+        self._render_base = font_pool.render_calls()
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """把上次 lap 以来的耗时记到 phase 上。"""
+        row = self._row
+        if row is None:
+            return
+        now = time.perf_counter()
+        row[PHASES.index(phase)] += now - self._last
+        self._last = now
+        if phase == "draw":
+            # 只统计场景绘制，叠加层自身的文字不计入。图像分配来自 count_image_allocation()：
+            # asset_loader、缩放金字塔，以及红蓝合成、粒子、刺激纹理等共用绘制辅助和光晕；
+            # 场景自己直接构造的 Surface 不在其中。
+            index = self.frames % self.capacity
+            self.image_allocs[index] = asset_loader.image_allocations() - self._image_base
+            self.font_renders[index] = font_pool.render_calls() - self._render_base
+
+    def end_frame(self, scene=None):
+        if self._row is None:
+            return
+        self._row = None
+        self.frames += 1
+        if scene is not None:
+            self.scene_label = active_scene_path(scene)
+        if self.log_every and self.frames % self.log_every == 0:
+            # 项目没有配置 logging 输出，日志模式直接写标准输出。
+            print(f"[profile] {self.summary_line()}", flush=True)
+
+    def _recent(self):
+        count = min(self.frames, self.capacity)
+        if count == 0:
+            return self.samples[:0], self.image_allocs[:0], self.font_renders[:0]
+        if count < self.capacity:
+            return self.samples[:count], self.image_allocs[:count], self.font_renders[:count]
+        order = np.roll(np.arange(self.capacity), -(self.frames % self.capacity))
+        return self.samples[order], self.image_allocs[order], self.font_renders[order]
+
+    def stats(self):
+        samples, image_allocs, renders = self._recent()
+        if not len(samples):
+            return {}
+        totals = samples.sum(axis=1) * 1000.0
+        p50, p95, p99 = np.percentile(totals, (50, 95, 99))
+        result = {
+            "frames": int(len(samples)),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "image_allocs_per_frame": float(image_allocs.mean()),
+            "font_renders_per_frame": float(renders.mean()),
+        }
+        for index, phase in enumerate(PHASES):
+            result[f"{phase}_ms"] = float(samples[:, index].mean() * 1000.0)
+        return result
+
+    def histogram(self):
+        """最近帧总耗时的分桶计数。"""
+        samples, _image_allocs, _renders = self._recent()
+        totals = samples.sum(axis=1) * 1000.0
+        bins = np.minimum((totals / HISTOGRAM_BIN_MS).astype(np.int64), HISTOGRAM_BINS - 1)
+        return np.bincount(bins, minlength=HISTOGRAM_BINS)
+
+    def summary_line(self):
+        stats = self.stats()
+        if not stats:
+            return "frame profile: no samples"
+        phases = " ".join(f"{phase}={stats[f'{phase}_ms']:.2f}" for phase in PHASES)
+        return (
+            f"frame p50={stats['p50_ms']:.2f} p95={stats['p95_ms']:.2f} p99={stats['p99_ms']:.2f} ms | {phases} | "
+            f"image_allocs={stats['image_allocs_per_frame']:.1f} renders={stats['font_renders_per_frame']:.1f} | {self.scene_label}"
+        )
+
+    def draw(self, screen, quality_name=None):
+        """在左上角绘制统计面板与帧时间直方图；隐藏时不做任何事。"""
+        if not self.visible:
+            return
+        stats = self.stats()
+        if self._font is None:
+            self._font = font_pool.get_shared_font("en-US", 14)
+        lines = [self.scene_label or "-"]
+        if stats:
+            lines.append(f"p50 {stats['p50_ms']:.2f}  p95 {stats['p95_ms']:.2f}  p99 {stats['p99_ms']:.2f} ms")
+            lines.append("  ".join(f"{phase} {stats[f'{phase}_ms']:.2f}" for phase in PHASES))
+            lines.append(f"image allocs {stats['image_allocs_per_frame']:.1f}/f  font.render {stats['font_renders_per_frame']:.1f}/f")
+        if quality_name:
+            lines.append(f"quality {quality_name}")
+        line_height = self._font.get_linesize()
+        panel = pygame.Rect(8, 8, OVERLAY_WIDTH, 12 + line_height * len(lines) + HISTOGRAM_HEIGHT)
+        screen.fill((12, 16, 24), panel)
+        y = panel.y + 6
+        for line in lines:
+            screen.blit(self._font.render(line, True, (226, 236, 248)), (panel.x + 8, y))
+            y += line_height
+        counts = self.histogram()
+        if not counts.any():
+            return
+        bar_width = (OVERLAY_WIDTH - 16) // HISTOGRAM_BINS
+        base_y = panel.bottom - 4
+        peak = int(counts.max())
+        for index, count in enumerate(counts.tolist()):
+            if not count:
+                continue
+            height = max(1, int(count / peak * (HISTOGRAM_HEIGHT - 8)))
+            upper_ms = (index + 1) * HISTOGRAM_BIN_MS
+            color = (112, 208, 138) if upper_ms <= 18.0 else (236, 176, 92) if upper_ms <= 34.0 else (232, 96, 96)
+            screen.fill(color, pygame.Rect(panel.x + 8 + index * bar_width, base_y - height, bar_width - 1, height))
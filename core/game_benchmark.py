@@ -0,0 +1,321 @@
+import math
+import os
+import platform
+import random
+
+import pygame
+
+from config import FPS
+from core import frame_clock
+from games.common.anaglyph import FILTER_LR, FILTER_RL
+
+from .frame_profiler import FrameProfiler
+from .input_events import EventBatch
+
+
+DEFAULT_SIZES = ((900, 700), (1280, 720), (1920, 1080))
+DEFAULT_FILTERS = (FILTER_LR, FILTER_RL)
+DEFAULT_FRAMES = 300
+DEFAULT_WARMUP_FRAMES = 30
+DEFAULT_SEED = 20240601
+START_METHODS = ("_start_game", "_start_match", "_start_session")
+SCRIPT_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE)
+KEY_INTERVAL = 6
+CLICK_INTERVAL = 20
+TIMING_METRICS = ("update_ms", "draw_ms", "p95_ms")
+COUNT_METRICS = ("image_allocs_per_frame", "font_renders_per_frame")
+
+
+def enter_play_state(scene):
+    """绕过首页直接开始一局；返回是否找到入口。"""
+    child_scenes = getattr(scene, "child_scenes", None)
+    if child_scenes is not None and "training" in child_scenes:
+        scene.navigate("training", force_reset=True)
+        return True
+    for name in START_METHODS:
+        start = getattr(scene, name, None)
+        if callable(start):
+            start()
+            return True
+    return False
+
+
+def in_play_state(scene):
+    if getattr(scene, "child_scenes", None) is not None:
+        return getattr(scene, "current_scene_name", None) == "training"
+    play_state = getattr(scene, "STATE_PLAY", None)
+    return play_state is not None and getattr(scene, "state", None) == play_state
+
+
+def scripted_events(frame, size):
+    """第 frame 帧的脚本输入：方向键/空格轮流按下，鼠标在画面中部绕行并定期点击。
+
+    只由帧号决定，与游戏内部的随机数无关，每次运行完全一致。
+    """
+    width, height = size
+    events = []
+    key = SCRIPT_KEYS[(frame // KEY_INTERVAL) % len(SCRIPT_KEYS)]
+    if frame % KEY_INTERVAL == 0:
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+    elif frame % KEY_INTERVAL == KEY_INTERVAL // 2:
+        events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+    # 点击范围限制在中部 60%，避开角落里的返回/设置按钮。
+    pos = (
+        int(width * (0.5 + 0.3 * math.sin(frame * 0.07))),
+        int(height * (0.5 + 0.3 * math.sin(frame * 0.11 + 1.0))),
+    )
+    events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+    if frame % CLICK_INTERVAL == 0:
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1))
+    return events
+
+
+class _SteppedTime:
+    """基准测试用的时间源：只在每帧开始时前进固定的 1/FPS 秒。"""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def __call__(self):
+        return self.value
+
+    def advance(self, seconds):
+        self.value += seconds
+
+
+def _environment_meta():
+    return {
+        "fps": FPS,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+    }
+
+
+def _step(manager, scene, screen, frame, size, frame_ms, game_time, profiler=None):
+    game_time.advance(frame_ms / 1000.0)
+    manager.update_frame_timing(frame_ms)
+    if profiler is not None:
+        profiler.start_frame()
+    scene.handle_events(scripted_events(frame, size))
+    if profiler is not None:
+        profiler.lap("events")
+    manager.update_scene(scene)
+    if profiler is not None:
+        profiler.lap("update")
+    scene.draw(screen)
+    if profiler is not None:
+        profiler.lap("draw")
+        profiler.end_frame(scene)
+
+
+def benchmark_game(
+    manager,
+    game_id,
+    size,
+    filter_direction=None,
+    frames=DEFAULT_FRAMES,
+    warmup_frames=DEFAULT_WARMUP_FRAMES,
+    seed=DEFAULT_SEED,
+):
+    """在 size 窗口下跑一个游戏：先预热 warmup_frames 帧，再统计 frames 帧。
+
+    帧间隔固定为 1/FPS：运行期间换上按帧前进的合成时钟，发球延迟、回合计时等也按帧推进，
+    游戏逻辑的进度与机器快慢无关，只有耗时不同。结束后恢复原时钟。
+    """
+    game = manager.game_registry.get_game(game_id)
+    if game is None:
+        raise KeyError(game_id)
+    screen = pygame.display.set_mode(size)
+    manager.set_screen_size(*size)
+    # 游戏都用全局 random；固定种子保证每次跑的关卡一致，结束后恢复调用方的随机状态。
+    random_state = random.getstate()
+    random.seed(seed)
+    frame_ms = 1000.0 / max(1, FPS)
+    restarts = 0
+    play_frames = 0
+    profiler = FrameProfiler(capacity=frames)
+    previous_clock = frame_clock.FRAME_CLOCK
+    manager_clock = getattr(manager, "clock", previous_clock)
+    game_time = _SteppedTime()
+    manager.clock = frame_clock.install(frame_clock.FrameClock(source=game_time, epoch=previous_clock.now()))
+    try:
+        scene = game.factory(manager)
+        scene.on_resize(*size)
+        if filter_direction is not None and hasattr(scene, "filter_direction"):
+            scene.filter_direction = filter_direction
+        enter_play_state(scene)
+        for frame in range(warmup_frames + frames):
+            if not in_play_state(scene) and enter_play_state(scene):
+                restarts += 1
+            if frame < warmup_frames:
+                _step(manager, scene, screen, frame, size, frame_ms, game_time)
+                continue
+            if frame == warmup_frames:
+                profiler.toggle()
+            _step(manager, scene, screen, frame, size, frame_ms, game_time, profiler)
+            play_frames += int(in_play_state(scene))
+    finally:
+        profiler.close()
+        random.setstate(random_state)
+        frame_clock.install(previous_clock)
+        manager.clock = manager_clock
+
+    stats = profiler.stats()
+    return {
+        "game_id": game_id,
+        "size": list(size),
+        "filter_direction": filter_direction if hasattr(scene, "filter_direction") else None,
+        "frames": stats.get("frames", 0),
+        "play_frames": play_frames,
+        "restarts": restarts,
+        **_timing_fields(stats),
+    }
+
+
+def _timing_fields(stats):
+    return {
+        "update_ms": stats.get("update_ms", 0.0),
+        "draw_ms": stats.get("draw_ms", 0.0),
+        "events_ms": stats.get("events_ms", 0.0),
+        "p50_ms": stats.get("p50_ms", 0.0),
+        "p95_ms": stats.get("p95_ms", 0.0),
+        "image_allocs_per_frame": stats.get("image_allocs_per_frame", 0.0),
+        "font_renders_per_frame": stats.get("font_renders_per_frame", 0.0),
+    }
+
+
+def run_benchmarks(
+    manager,
+    game_ids=None,
+    sizes=DEFAULT_SIZES,
+    filters=DEFAULT_FILTERS,
+    frames=DEFAULT_FRAMES,
+    warmup_frames=DEFAULT_WARMUP_FRAMES,
+    seed=DEFAULT_SEED,
+):
+    """对每个游戏、窗口尺寸、滤光方向组合跑一次，返回可直接写成 JSON 的报告。"""
+    registry = manager.game_registry
+    if game_ids is None:
+        game_ids = sorted(
+            game.game_id
+            for category in registry.get_categories()
+            for game in registry.get_games_by_category(category["id"])
+        )
+    results = []
+    for game_id in game_ids:
+        for size in sizes:
+            for filter_direction in filters or (None,):
+                result = benchmark_game(manager, game_id, tuple(size), filter_direction, frames, warmup_frames, seed)
+                results.append(result)
+                # 不区分左右滤光的游戏每个尺寸只跑一遍。
+                if result["filter_direction"] is None:
+                    break
+    return {
+        "meta": {"frames": frames, "warmup_frames": warmup_frames, "seed": seed, **_environment_meta()},
+        "results": results,
+    }
+
+
+def benchmark_replay(manager, replay):
+    """按录像逐帧重放并统计耗时：事件、帧间隔、帧时钟读数与随机种子都取自录像。
+
+    从录制时的初始场景开始，经 manager 的场景切换进入游戏，与实际运行的路径一致；
+    manager 需已登记顶层场景。窗口缩放按录像里的 VIDEORESIZE 处理，全屏切换等快捷键不重放。
+    结果的 game_id 为 "replay:<文件名>"，可与其他报告一样用 compare_reports 比较。
+    """
+    size = replay.screen_size
+    random_state = random.getstate()
+    random.seed(replay.seed)
+    previous_clock = frame_clock.FRAME_CLOCK
+    manager_clock = getattr(manager, "clock", previous_clock)
+    profiler = FrameProfiler(capacity=max(1, len(replay)))
+    profiler.toggle()
+    try:
+        settings = replay.settings
+        if settings:
+            manager.settings.update(settings)
+            manager.apply_language_preference()
+        manager.clock = frame_clock.install(frame_clock.FrameClock(source=replay.clock_source, epoch=replay.epoch))
+        screen = pygame.display.set_mode(size)
+        manager.set_screen_size(*size)
+        manager.clock.tick()
+        manager.set_scene(replay.initial_scene)
+        while not replay.finished:
+            dt_ms, recorded_events = replay.next_frame()
+            events = EventBatch(recorded_events)
+            manager.update_frame_timing(dt_ms)
+            profiler.start_frame()
+            for event in events.of_type(pygame.VIDEORESIZE):
+                size = tuple(event.size)
+                screen = pygame.display.set_mode(size)
+                manager.set_screen_size(*size)
+                manager.get_scene().on_resize(*size)
+            manager.get_scene().handle_events(events)
+            profiler.lap("events")
+            manager.update_scene()
+            profiler.lap("update")
+            manager.get_scene().draw(screen)
+            profiler.lap("draw")
+            profiler.end_frame(manager.get_scene())
+    finally:
+        profiler.close()
+        random.setstate(random_state)
+        frame_clock.install(previous_clock)
+        manager.clock = manager_clock
+
+    stats = profiler.stats()
+    return {
+        "game_id": f"replay:{os.path.basename(replay.path)}",
+        "size": list(size),
+        "filter_direction": None,
+        "frames": stats.get("frames", 0),
+        "final_scene": profiler.scene_label,
+        **_timing_fields(stats),
+    }
+
+
+def run_replay_benchmarks(manager, replays):
+    """依次重放多个录像，返回与 run_benchmarks 同结构的报告。"""
+    return {
+        "meta": {"replays": [replay.path for replay in replays], **_environment_meta()},
+        "results": [benchmark_replay(manager, replay) for replay in replays],
+    }
+
+
+def _result_key(result):
+    return (result["game_id"], tuple(result["size"]), result.get("filter_direction"))
+
+
+def compare_reports(baseline, current, threshold=0.15, min_ms=0.05, min_count=0.5):
+    """找出 current 相对 baseline 变慢或分配变多的组合。
+
+    耗时需同时超过相对阈值 threshold 与绝对阈值 min_ms 才算回退，避免亚毫秒级噪声误报；
+    每帧图像分配/render 次数超过 min_count 的增量即算回退。
+    """
+    baseline_results = {_result_key(result): result for result in baseline.get("results", [])}
+    regressions = []
+    for result in current.get("results", []):
+        before = baseline_results.get(_result_key(result))
+        if before is None:
+            continue
+        for metric in TIMING_METRICS + COUNT_METRICS:
+            old = float(before.get(metric, 0.0))
+            new = float(result.get(metric, 0.0))
+            if metric in TIMING_METRICS:
+                regressed = new - old > min_ms and new > old * (1.0 + threshold)
+            else:
+                regressed = new - old > min_count
+            if regressed:
+                regressions.append(
+                    {
+                        "game_id": result["game_id"],
+                        "size": result["size"],
+                        "filter_direction": result.get("filter_direction"),
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                    }
+                )
+    return regressions
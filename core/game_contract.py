@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Callable, Protocol, runtime_checkable
+from typing import Callable, Optional, Protocol, Tuple, runtime_checkable
 
 
 @runtime_checkable
@@ -21,6 +21,29 @@ class SceneProtocol(Protocol):
 
 
 GameFactory = Callable[[object], SceneProtocol]
+ImageRequest = Tuple[str, Optional[Tuple[int, int]]]
+
+@dataclass(frozen=True)
+class AssetManifest:
+    """进入游戏前可以预取的资源：images 为 (路径, 目标尺寸或 None)，sounds 为音效路径。
+
+    相对路径以项目根目录为基准，由预取器解析；描述符本身不依赖资源加载模块。
+    """
+
+    images: Tuple[ImageRequest, ...] = ()
+    sounds: Tuple[str, ...] = ()
+
+    def __len__(self):
+        return len(self.images) + len(self.sounds)
+
+
+# 大多数游戏按钮（返回、确认、取消、帮助）实际绘制的图标。
+GAME_BUTTON_ICONS = ("back_arrow_light", "check_dark", "check_light", "cross_light", "question_light")
+
+
+def ui_icon_images(icons, size=(18, 18)):
+    """按钮图标清单；icons 为带明暗后缀的文件名，如 "check_light"。"""
+    return tuple((f"assets/ui/{icon}.png", size) for icon in icons)
 
 
 @dataclass(frozen=True)
@@ -30,3 +53,4 @@ class GameDescriptor:
     name: str
     factory: GameFactory
     name_key: str = ""
+    assets: AssetManifest = AssetManifest()
@@ -0,0 +1,107 @@
+import pygame
+
+
+# 主循环与各场景实际处理的事件；其余类型在 SDL 层直接丢弃，不进入事件队列。
+# TEXTINPUT 保留给 KEYDOWN.unicode（许可证、配置页的文字输入）；
+# WINDOWFOCUSLOST 供 E 字训练在窗口失焦时自动暂停。
+APP_EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWRESTORED,
+) + tuple(
+    event_type for event_type in (getattr(pygame, "WINDOWFOCUSLOST", None),) if event_type is not None
+)
+
+def coalesce_motion(events):
+    """把相邻的 MOUSEMOTION 合并为一个：保留最后的 pos 与 buttons，rel 累加。
+
+    只合并连续的一段，点击等其他事件前后的相对顺序不变。
+    """
+    merged = []
+    for event in events:
+        previous = merged[-1] if merged else None
+        if event.type != pygame.MOUSEMOTION or previous is None or previous.type != pygame.MOUSEMOTION:
+            merged.append(event)
+            continue
+        rel = getattr(event, "rel", (0, 0))
+        previous_rel = getattr(previous, "rel", (0, 0))
+        attrs = dict(event.dict)
+        attrs["rel"] = (previous_rel[0] + rel[0], previous_rel[1] + rel[1])
+        merged[-1] = pygame.event.Event(pygame.MOUSEMOTION, attrs)
+    return merged
+
+
+class EventBatch(list):
+    """一帧的事件：合并鼠标移动后的有序列表，并按类型预先分好组。
+
+    仍是 list，原有逐个遍历事件的场景无需改动；需要时可用 of_type() 直接取某类事件。
+    """
+
+    def __init__(self, events=()):
+        super().__init__(coalesce_motion(events))
+        self._by_type = {}
+        for event in self:
+            self._by_type.setdefault(event.type, []).append(event)
+
+    def of_type(self, *event_types):
+        if len(event_types) == 1:
+            return list(self._by_type.get(event_types[0], ()))
+        return [event for event in self if event.type in event_types]
+
+    def has(self, event_type):
+        return event_type in self._by_type
+
+    @property
+    def mouse_pos(self):
+        """本帧最后一次鼠标移动的位置；没有移动时为 None。"""
+        motions = self._by_type.get(pygame.MOUSEMOTION)
+        return motions[-1].pos if motions else None
+
+
+def handles_mouse_motion(scene):
+    """沿容器场景找到实际运行的场景，看它是否处理 MOUSEMOTION；未声明的场景按需要处理。"""
+    seen = set()
+    while scene is not None and id(scene) not in seen:
+        seen.add(id(scene))
+        child = getattr(scene, "active_game_scene", None) or getattr(scene, "current_scene", None)
+        if child is None:
+            return bool(getattr(scene, "HANDLES_MOUSEMOTION", True))
+        scene = child
+    return True
+
+
+class EventFilter:
+    """按当前场景在 SDL 层放行/屏蔽事件。
+
+    悬停效果读取 pygame.mouse.get_pos()，鼠标状态在事件被屏蔽时照常更新，
+    因此不处理 MOUSEMOTION 的场景可以直接屏蔽它。
+    """
+
+    def __init__(self):
+        self.mouse_motion = None
+
+    def install(self):
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(APP_EVENT_TYPES))
+        self.mouse_motion = False
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    def update(self, scene):
+        wanted = handles_mouse_motion(scene)
+        if wanted == self.mouse_motion:
+            return
+        if wanted:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+        else:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+        self.mouse_motion = wanted
+
+    def uninstall(self):
+        pygame.event.set_allowed(None)
+        self.mouse_motion = None
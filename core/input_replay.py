@@ -0,0 +1,147 @@
+import gzip
+import json
+import time
+
+import pygame
+
+
+REPLAY_FORMAT = "visionseed-replay"
+REPLAY_VERSION = 1
+SPEED_FAST = "fast"
+SPEED_REALTIME = "realtime"
+# 需要随录像一起恢复的设置项；其余设置（许可证、音效等）沿用本机。
+REPLAY_SETTINGS = (
+    "language",
+    "total_questions",
+    "start_level",
+    "session_duration_minutes",
+    "e_training_mode",
+    "adaptive_enabled",
+    "adaptive_cooldown_left",
+)
+
+
+def new_seed():
+    return int(time.time() * 1000) & 0xFFFFFFFF
+
+
+_SKIP = object()
+
+
+def _plain(value):
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, (tuple, list)):
+        items = [_plain(item) for item in value]
+        return _SKIP if any(item is _SKIP for item in items) else items
+    return _SKIP
+
+
+def encode_event(event):
+    """事件转成 [type, {属性}]；window 等无法序列化的属性直接丢弃。"""
+    attrs = {}
+    for key, value in event.dict.items():
+        plain = _plain(value)
+        if plain is not _SKIP:
+            attrs[key] = plain
+    return [event.type, attrs]
+
+
+def decode_event(item):
+    event_type, attrs = item
+    return pygame.event.Event(event_type, {key: tuple(value) if isinstance(value, list) else value for key, value in attrs.items()})
+
+
+class InputRecorder:
+    """逐帧把事件、帧间隔与帧时钟读数写入 gzip 压缩的 JSON 行文件。
+
+    第一行是文件头（随机种子、起始时间、窗口尺寸、初始场景与相关设置），之后每帧一行。
+    """
+
+    def __init__(self, path, seed, epoch, screen_size, initial_scene, settings):
+        self.path = path
+        self.seed = seed
+        self.epoch = float(epoch)
+        self.frames = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        header = {
+            "format": REPLAY_FORMAT,
+            "version": REPLAY_VERSION,
+            "seed": seed,
+            "epoch": self.epoch,
+            "screen_size": list(screen_size),
+            "initial_scene": initial_scene,
+            "settings": {key: settings[key] for key in REPLAY_SETTINGS if key in settings},
+        }
+        self._write(header)
+
+    def _write(self, payload):
+        self._file.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+
+    def record(self, dt_ms, clock_time, events):
+        self._write([dt_ms, clock_time, [encode_event(event) for event in events]])
+        self.frames += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class InputReplay:
+    """读取 InputRecorder 写出的文件，按帧交还事件、帧间隔与帧时钟读数。
+
+    回放时用 clock_source 作为帧时钟的时间源，frame_clock.now() 因此与录制时逐帧一致。
+    直接读取 pygame.mouse / pygame.key 状态的逻辑（多为悬停高亮）不在录像范围内。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        if not lines:
+            raise ValueError(f"empty replay file: {path}")
+        self.header = json.loads(lines[0])
+        if self.header.get("format") != REPLAY_FORMAT or self.header.get("version") != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay file: {path}")
+        self._frames = [json.loads(line) for line in lines[1:] if line]
+        self.index = 0
+        self._clock_time = float(self.header["epoch"])
+
+    @property
+    def seed(self):
+        return self.header["seed"]
+
+    @property
+    def epoch(self):
+        return self.header["epoch"]
+
+    @property
+    def screen_size(self):
+        return tuple(self.header["screen_size"])
+
+    @property
+    def initial_scene(self):
+        return self.header["initial_scene"]
+
+    @property
+    def settings(self):
+        return dict(self.header.get("settings", {}))
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def finished(self):
+        return self.index >= len(self._frames)
+
+    def clock_source(self):
+        return self._clock_time
+
+    def next_frame(self):
+        """返回下一帧的 (dt_ms, events)，并把帧时钟时间源推进到该帧。"""
+        dt_ms, clock_time, events = self._frames[self.index]
+        self.index += 1
+        self._clock_time = clock_time
+        return dt_ms, [decode_event(item) for item in events]
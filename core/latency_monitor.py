@@ -0,0 +1,141 @@
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+
+INPUT_EVENT_TYPES = frozenset((pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN, pygame.JOYBUTTONDOWN))
+METRICS = ("input_to_handled", "input_to_present", "onset_to_present")
+SAMPLE_LIMIT = 2000
+# 两次取事件间隔的上限；窗口最小化等长间隔不计入排队时间估计。
+MAX_POLL_WINDOW = 0.25
+SUMMARY_NOTE = (
+    "lower bound: 'present' is when display.flip returns (compositor and scanout excluded); "
+    "events without timestamp are assumed to arrive mid-way between two polls"
+)
+
+
+class StimulusOnset:
+    """一次刺激出现：onset 为场景逻辑生成刺激的时刻，presented_at 为其首次随 flip 呈现的时刻。"""
+
+    __slots__ = ("label", "onset", "presented_at")
+
+    def __init__(self, label, onset):
+        self.label = label
+        self.onset = onset
+        self.presented_at = None
+
+    @property
+    def presentation_delay(self):
+        return None if self.presented_at is None else self.presented_at - self.onset
+
+
+class LatencyMonitor:
+    """统计输入到画面呈现的延迟，以及刺激生成到呈现的延迟，按游戏分别汇总。
+
+    时间均取 perf_counter；“呈现”指 display.flip 返回的时刻，不含合成器、显示器扫描与响应时间，
+    因此结果是输入到光子延迟的下限。事件带 timestamp（SDL 毫秒时间）时用它推算到达时刻；
+    pygame 2.5/2.6 的事件没有 timestamp，此时事件只能确定在上一次与本次取事件之间到达，
+    按该区间的中点估计，排队等待（含 clock.tick 的睡眠）平均计入一半。
+    未启用时各方法立即返回。
+    """
+
+    def __init__(self, enabled=False, source=time.perf_counter):
+        self.enabled = bool(enabled)
+        self._source = source
+        self._samples = {}
+        self._label = ""
+        self._arrivals = []
+        self._handled_at = None
+        self._onsets = []
+        self._previous_poll = None
+
+    def _arrival_time(self, event, polled_at, ticks, window_start):
+        timestamp = getattr(event, "timestamp", None)
+        if timestamp is None:
+            return (window_start + polled_at) / 2.0
+        return polled_at - max(0.0, (ticks - timestamp) / 1000.0)
+
+    def begin_frame(self, events, label):
+        """记录本帧输入事件的到达时刻；label 通常为当前游戏 id。"""
+        if not self.enabled:
+            return
+        polled_at = self._source()
+        ticks = pygame.time.get_ticks()
+        window_start = polled_at if self._previous_poll is None else max(self._previous_poll, polled_at - MAX_POLL_WINDOW)
+        self._previous_poll = polled_at
+        self._label = label
+        self._arrivals = [
+            self._arrival_time(event, polled_at, ticks, window_start)
+            for event in events
+            if event.type in INPUT_EVENT_TYPES
+        ]
+        self._handled_at = None
+
+    def mark_handled(self):
+        if self.enabled:
+            self._handled_at = self._source()
+
+    def stimulus_onset(self, label=None):
+        """场景生成新刺激时调用；返回的记录在下一次 mark_presented 时补上呈现时刻。"""
+        if not self.enabled:
+            return None
+        onset = StimulusOnset(label, self._source())
+        self._onsets.append(onset)
+        return onset
+
+    def _append(self, metric, value):
+        bucket = self._samples.setdefault(self._label, {})
+        samples = bucket.get(metric)
+        if samples is None:
+            samples = bucket[metric] = deque(maxlen=SAMPLE_LIMIT)
+        samples.append(value)
+
+    def mark_presented(self):
+        """display.flip 返回后调用，结算本帧的输入与刺激。"""
+        if not self.enabled:
+            return
+        presented_at = self._source()
+        for arrival in self._arrivals:
+            if self._handled_at is not None:
+                self._append("input_to_handled", self._handled_at - arrival)
+            self._append("input_to_present", presented_at - arrival)
+        for onset in self._onsets:
+            onset.presented_at = presented_at
+            self._append("onset_to_present", onset.presentation_delay)
+        self._arrivals = []
+        self._onsets = []
+        self._handled_at = None
+
+    def report(self):
+        """{label: {metric: {count, p50_ms, p95_ms, max_ms}}}"""
+        report = {}
+        for label, bucket in sorted(self._samples.items()):
+            entry = {}
+            for metric in METRICS:
+                samples = bucket.get(metric)
+                if not samples:
+                    continue
+                values = np.fromiter(samples, dtype=np.float64) * 1000.0
+                p50, p95 = np.percentile(values, (50, 95))
+                entry[metric] = {
+                    "count": int(values.size),
+                    "p50_ms": float(p50),
+                    "p95_ms": float(p95),
+                    "max_ms": float(values.max()),
+                }
+            report[label] = entry
+        return report
+
+    def summary_lines(self):
+        lines = []
+        for label, entry in self.report().items():
+            parts = [
+                f"{metric} p50={stats['p50_ms']:.1f} p95={stats['p95_ms']:.1f} n={stats['count']}"
+                for metric, stats in entry.items()
+            ]
+            lines.append(f"{label or '-'}: " + " | ".join(parts))
+        if lines:
+            lines.append(SUMMARY_NOTE)
+        return lines
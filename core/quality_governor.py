@@ -0,0 +1,61 @@
+from collections import deque
+
+
+QUALITY_LOW = 0
+QUALITY_MEDIUM = 1
+QUALITY_HIGH = 2
+QUALITY_NAMES = {QUALITY_LOW: "low", QUALITY_MEDIUM: "medium", QUALITY_HIGH: "high"}
+
+
+class QualityGovernor:
+    """按最近若干帧的帧时间分位数调整画质档位。
+
+    只用于取舍装饰性效果（背景装饰、光晕、震屏、粒子数量），训练刺激本身不受档位影响。
+    连续超出预算时逐级降档，持续宽裕一段时间后再逐级升档，避免来回抖动。
+    """
+
+    WINDOW = 90
+    PERCENTILE = 0.9
+    DOWNGRADE_RATIO = 1.3
+    UPGRADE_RATIO = 1.08
+    UPGRADE_COOLDOWN_FRAMES = 240
+
+    def __init__(self, target_frame_seconds, tier=QUALITY_HIGH):
+        self.target_frame_seconds = float(target_frame_seconds)
+        self.tier = tier
+        self._samples = deque(maxlen=self.WINDOW)
+        self._frames_since_change = 0
+
+    @property
+    def name(self):
+        return QUALITY_NAMES[self.tier]
+
+    def frame_time_percentile(self):
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.PERCENTILE))
+        return ordered[index]
+
+    def record(self, frame_seconds):
+        """记录一帧耗时，返回记录后的档位。"""
+        self._samples.append(max(0.0, float(frame_seconds)))
+        self._frames_since_change += 1
+        if len(self._samples) < self._samples.maxlen:
+            return self.tier
+        percentile = self.frame_time_percentile()
+        if percentile > self.target_frame_seconds * self.DOWNGRADE_RATIO and self.tier > QUALITY_LOW:
+            self._change(self.tier - 1)
+        elif (
+            percentile <= self.target_frame_seconds * self.UPGRADE_RATIO
+            and self.tier < QUALITY_HIGH
+            and self._frames_since_change >= self.UPGRADE_COOLDOWN_FRAMES
+        ):
+            self._change(self.tier + 1)
+        return self.tier
+
+    def _change(self, tier):
+        self.tier = tier
+        # 换档后重新积累样本，让新档位的帧时间决定下一步。
+        self._samples.clear()
+        self._frames_since_change = 0
@@ -0,0 +1,69 @@
+import os
+from bisect import bisect_left
+
+import pygame
+
+from core.asset_loader import count_image_allocation, load_image_if_exists
+
+
+DEFAULT_LEVELS = 8
+# 下落水果尺寸连续变化，按约 4 像素一档预缩放。
+FRUIT_PYRAMID_LEVELS = 14
+_PYRAMIDS = {}
+
+
+def pyramid_sizes(min_size, max_size, levels=DEFAULT_LEVELS):
+    """在 [min_size, max_size] 之间均匀取若干个整数边长，作为缩放金字塔的层级。"""
+    low = max(1, int(min_size))
+    high = max(low, int(max_size))
+    count = max(1, int(levels))
+    if count == 1 or low == high:
+        return (high,)
+    return tuple(sorted({int(round(low + (high - low) * i / (count - 1))) for i in range(count)}))
+
+
+class ScalePyramid:
+    """同一素材预先缩放成固定几档尺寸；运行时取最近一档，不在绘制路径上 smoothscale。"""
+
+    def __init__(self, source, min_size, max_size, levels=DEFAULT_LEVELS):
+        self.sizes = pyramid_sizes(min_size, max_size, levels)
+        self._levels = [pygame.transform.smoothscale(source, (size, size)) for size in self.sizes]
+        count_image_allocation(len(self._levels))
+
+    def __len__(self):
+        return len(self._levels)
+
+    def level_index(self, size):
+        index = bisect_left(self.sizes, size)
+        if index >= len(self.sizes):
+            return len(self.sizes) - 1
+        if index > 0 and size - self.sizes[index - 1] < self.sizes[index] - size:
+            return index - 1
+        return index
+
+    def surface(self, size, exact=False):
+        """返回最接近 size 的层级；exact=True 时从不小于 size 的层级做一次快速缩放。"""
+        size = max(1, int(size))
+        if not exact:
+            return self._levels[self.level_index(size)]
+        index = min(bisect_left(self.sizes, size), len(self.sizes) - 1)
+        level = self._levels[index]
+        if self.sizes[index] == size:
+            return level
+        count_image_allocation()
+        return pygame.transform.scale(level, (size, size))
+
+
+def get_scale_pyramid(path, min_size, max_size, levels=DEFAULT_LEVELS):
+    """按素材路径与尺寸范围共享金字塔；素材不存在时返回 None。"""
+    key = (os.path.abspath(path), int(min_size), int(max_size), int(levels))
+    if key in _PYRAMIDS:
+        return _PYRAMIDS[key]
+    source = load_image_if_exists(path)
+    pyramid = ScalePyramid(source, min_size, max_size, levels) if source is not None else None
+    _PYRAMIDS[key] = pyramid
+    return pyramid
+
+
+def clear_scale_pyramids():
+    _PYRAMIDS.clear()
@@ -6,18 +6,38 @@ from .language_manager import LanguageManager
 from .license_manager import LicenseManager
 from .adaptive_manager import AdaptiveManager
 from .game_registry import GameRegistry
+from .latency_monitor import LatencyMonitor
+from .asset_prefetcher import AssetPrefetcher
+from .fixed_timestep import FixedTimestep
+from .frame_clock import FRAME_CLOCK
+from .frame_profiler import FrameProfiler
+from .quality_governor import QualityGovernor
+from .scene_prewarmer import ScenePrewarmer
 
 
 class SceneManager:
     def __init__(self):
         self.scene = None
         self.scenes = {}
+        self.scene_factories = {}
         self.screen_size = None
         self.active_category = None
         self.active_game_id = None
         self.target_frame_seconds = 1.0 / max(1, FPS)
         self.delta_seconds = self.target_frame_seconds
         self.frame_scale = 1.0
+        # 单调帧时钟，每帧在 update_frame_timing 中采样一次，场景经 frame_clock.now() 读取。
+        self.clock = FRAME_CLOCK
+        # 声明 FIXED_TIMESTEP 的场景按固定步长推进，绘制时读取 interpolation_alpha 插值。
+        self.fixed_timestep = FixedTimestep(self.target_frame_seconds)
+        self.interpolation_alpha = 1.0
+        self._pending_fixed_steps = 1
+        # 根据实测帧时间给出画质档位，场景据此取舍装饰性效果。
+        self.quality = QualityGovernor(self.target_frame_seconds)
+        # F3 切换的帧分析叠加层；设置 SHIYA_FRAME_PROFILE 时无界面定期写日志。
+        self.profiler = FrameProfiler.from_environment()
+        # 输入到呈现的延迟统计，默认关闭，由 --latency 开启。
+        self.latency = LatencyMonitor()
 
         self.settings = {
             "total_questions": DEFAULT_TOTAL_QUESTIONS,
@@ -54,6 +74,8 @@ class SceneManager:
         self.license_manager = LicenseManager()
         self.adaptive_manager = AdaptiveManager()
         self.game_registry = GameRegistry()
+        self.scene_prewarmer = ScenePrewarmer(self)
+        self.asset_prefetcher = AssetPrefetcher(self)
 
     def update_frame_timing(self, dt_ms):
         dt_seconds = max(0.0, float(dt_ms) / 1000.0)
@@ -61,6 +83,31 @@ class SceneManager:
             dt_seconds = self.target_frame_seconds
         self.delta_seconds = min(0.05, dt_seconds)
         self.frame_scale = self.delta_seconds / self.target_frame_seconds if self.target_frame_seconds > 0 else 1.0
+        self._pending_fixed_steps = self.fixed_timestep.advance(dt_seconds)
+        self.clock.tick()
+        self.quality.record(dt_seconds)
+
+    def update_scene(self, scene=None):
+        """推进场景一帧：普通场景调用一次 update()，固定步长场景执行累加出的 fixed_update 子步。"""
+        scene = scene if scene is not None else self.scene
+        if scene is None:
+            return
+        if not getattr(scene, "FIXED_TIMESTEP", False):
+            self.interpolation_alpha = 1.0
+            scene.update()
+            return
+        steps = self._pending_fixed_steps
+        step_seconds = self.fixed_timestep.step_seconds
+        delta_seconds, frame_scale = self.delta_seconds, self.frame_scale
+        # 子步内 frame_scale 固定，原有按 frame_scale 缩放的逻辑因此与帧率无关。
+        self.delta_seconds = step_seconds
+        self.frame_scale = step_seconds / self.target_frame_seconds if self.target_frame_seconds > 0 else 1.0
+        try:
+            for _ in range(steps):
+                scene.fixed_update(step_seconds)
+        finally:
+            self.delta_seconds, self.frame_scale = delta_seconds, frame_scale
+        self.interpolation_alpha = self.fixed_timestep.alpha
 
     def apply_sound_preference(self):
         """将当前偏好中的音效开关应用到音效管理器。"""
@@ -131,14 +178,30 @@ class SceneManager:
 
         return result
 
-    def register(self, name, scene):
+    def register(self, name, scene=None, factory=None):
+        """登记场景实例；传入 factory 时推迟到首次 set_scene 再构建。"""
+        if factory is not None:
+            self.scene_factories[name] = factory
+            self.scenes.pop(name, None)
+            return
+        self.scenes[name] = scene
+
+    def _resolve_scene(self, name):
+        scene = self.scenes.get(name)
+        if scene is not None:
+            return scene
+        factory = getattr(self, "scene_factories", {}).pop(name, None)
+        if factory is None:
+            raise KeyError(name)
+        scene = factory(self)
         self.scenes[name] = scene
+        return scene
 
     def set_screen_size(self, width, height):
         self.screen_size = (width, height)
 
     def set_scene(self, name):
-        self.scene = self.scenes[name]
+        self.scene = self._resolve_scene(name)
 
         if self.screen_size:
             on_resize = getattr(self.scene, "on_resize", None)
@@ -0,0 +1,141 @@
+import logging
+import types
+from collections import OrderedDict
+
+import pygame
+
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_surface_bytes(root, max_depth=4, skip=()):
+    """粗略统计对象图中 Surface 占用的像素内存（同一对象只计一次）；skip 中的对象不展开。"""
+    seen = {id(item) for item in skip}
+    total = 0
+    stack = [(root, 0)]
+    while stack:
+        value, depth = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, pygame.Surface):
+            total += value.get_width() * value.get_height() * value.get_bytesize()
+            continue
+        if depth >= max_depth or isinstance(value, (type, types.ModuleType)):
+            continue
+        if isinstance(value, dict):
+            children = list(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            children = list(value)
+        elif hasattr(value, "__dict__"):
+            children = list(vars(value).values())
+        else:
+            continue
+        stack.extend((child, depth + 1) for child in children)
+    return total
+
+
+class ScenePrewarmer:
+    """利用菜单页的空闲帧提前构建推荐游戏场景，进入游戏时直接取用。"""
+
+    DEFAULT_MAX_SCENES = 2
+    DEFAULT_MAX_BYTES = 48 * 1024 * 1024
+    IDLE_FRAMES_BEFORE_START = 12
+    # 上一帧已经明显超时时不做预热，避免进一步拖慢菜单。
+    FRAME_HEADROOM_RATIO = 1.25
+
+    def __init__(self, manager, max_scenes=DEFAULT_MAX_SCENES, max_bytes=DEFAULT_MAX_BYTES):
+        self.manager = manager
+        self.max_scenes = max(0, int(max_scenes))
+        self.max_bytes = max(0, int(max_bytes))
+        self._pending = []
+        self._ready = OrderedDict()
+        self._ready_bytes = {}
+        self._idle_frames = 0
+
+    @property
+    def total_bytes(self):
+        return sum(self._ready_bytes.values())
+
+    def schedule(self, game_ids):
+        """按优先级登记要预热的游戏；已预热的场景保留，超出上限时先淘汰最旧的。"""
+        wanted = []
+        for game_id in game_ids:
+            if game_id and game_id not in wanted:
+                wanted.append(game_id)
+        wanted = wanted[: self.max_scenes]
+        self._pending = [game_id for game_id in wanted if game_id not in self._ready]
+        self._idle_frames = 0
+        for game_id in wanted:
+            if game_id in self._ready:
+                self._ready.move_to_end(game_id)
+
+    def cancel(self):
+        """取消尚未开始的预热任务，已构建的场景保留。"""
+        self._pending = []
+        self._idle_frames = 0
+
+    def clear(self):
+        self.cancel()
+        self._ready.clear()
+        self._ready_bytes.clear()
+
+    def is_ready(self, game_id):
+        return game_id in self._ready
+
+    def take(self, game_id):
+        """取出预热好的场景；没有时返回 None。"""
+        scene = self._ready.pop(game_id, None)
+        self._ready_bytes.pop(game_id, None)
+        return scene
+
+    def _has_frame_headroom(self):
+        target = float(getattr(self.manager, "target_frame_seconds", 0.0) or 0.0)
+        delta = float(getattr(self.manager, "delta_seconds", target) or 0.0)
+        return target <= 0 or delta <= target * self.FRAME_HEADROOM_RATIO
+
+    def step(self):
+        """每帧最多构建一个场景；返回本次是否完成了预热。"""
+        if not self._pending:
+            return False
+        self._idle_frames += 1
+        if self._idle_frames < self.IDLE_FRAMES_BEFORE_START or not self._has_frame_headroom():
+            return False
+
+        game_id = self._pending.pop(0)
+        scene = self._build(game_id)
+        if scene is None:
+            return False
+
+        scene_bytes = estimate_surface_bytes(scene, skip=(self.manager,))
+        while self._ready and (len(self._ready) >= self.max_scenes or self.total_bytes + scene_bytes > self.max_bytes):
+            evicted_id, _scene = self._ready.popitem(last=False)
+            self._ready_bytes.pop(evicted_id, None)
+        if len(self._ready) >= self.max_scenes or scene_bytes > self.max_bytes:
+            return False
+        self._ready[game_id] = scene
+        self._ready_bytes[game_id] = scene_bytes
+        return True
+
+    def _build(self, game_id):
+        registry = getattr(self.manager, "game_registry", None)
+        game = registry.get_game(game_id) if registry is not None else None
+        if game is None:
+            return None
+        try:
+            scene = game.factory(self.manager)
+            screen_size = getattr(self.manager, "screen_size", None)
+            if screen_size:
+                on_resize = getattr(scene, "on_resize", None)
+                if callable(on_resize):
+                    on_resize(*screen_size)
+                # 离屏绘制一帧，让场景在绘制时才加载的图片和缓存提前就绪。
+                scene.draw(pygame.Surface(screen_size))
+            # 场景可选的 prewarm() 钩子，用于更重的预计算（如图案预烘焙）。
+            prewarm = getattr(scene, "prewarm", None)
+            if callable(prewarm):
+                prewarm()
+        except Exception as e:
+            logger.warning("Prewarming %s failed: %s", game_id, e)
+            return None
+        return scene
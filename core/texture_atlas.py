@@ -0,0 +1,92 @@
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+import pygame
+
+
+# 这些目录中的小图在首次使用时合并为一张图集，按目录（即按游戏）分组。
+ATLAS_GROUP_PATTERNS = (
+    "assets/ui",
+    "games/*/*/assets/objects",
+)
+ATLAS_MAX_WIDTH = 1024
+ATLAS_MAX_SPRITE = 256
+# 精灵之间留 1 像素透明边，避免缩放采样时串色。
+ATLAS_PADDING = 1
+
+
+def atlas_group(asset_path, root):
+    """返回资源所属图集目录；不参与图集时返回 None。"""
+    directory = Path(asset_path).parent
+    try:
+        relative = directory.relative_to(root).as_posix()
+    except ValueError:
+        return None
+    for pattern in ATLAS_GROUP_PATTERNS:
+        if fnmatchcase(relative, pattern):
+            return directory
+    return None
+
+
+def shelf_pack(sizes, max_width=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING):
+    """按高度降序逐行摆放，返回各尺寸的左上角坐标与图集总尺寸。"""
+    order = sorted(range(len(sizes)), key=lambda index: (-sizes[index][1], -sizes[index][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = atlas_width = 0
+    for index in order:
+        width, height = sizes[index]
+        if x > 0 and x + width > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[index] = (x, y)
+        atlas_width = max(atlas_width, x + width)
+        shelf_height = max(shelf_height, height)
+        x += width + padding
+    return positions, (max(1, atlas_width), max(1, y + shelf_height))
+
+
+class TextureAtlas:
+    """一张图集 Surface 加名称到区域的索引；取图时返回共享像素的子 Surface。"""
+
+    def __init__(self, surface, rects):
+        self.surface = surface
+        self.rects = dict(rects)
+        self._subsurfaces = {}
+        self.display_format = False
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def __len__(self):
+        return len(self.rects)
+
+    def ensure_display_format(self):
+        """显示窗口就绪后整体 convert_alpha 一次，而不是逐个精灵转换。"""
+        if self.display_format or pygame.display.get_surface() is None:
+            return
+        self.surface = self.surface.convert_alpha()
+        self._subsurfaces.clear()
+        self.display_format = True
+
+    def subsurface(self, name):
+        rect = self.rects.get(name)
+        if rect is None:
+            return None
+        sprite = self._subsurfaces.get(name)
+        if sprite is None:
+            sprite = self.surface.subsurface(rect)
+            self._subsurfaces[name] = sprite
+        return sprite
+
+
+def build_texture_atlas(images, max_width=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING):
+    """images 为 名称 -> Surface；超过 ATLAS_MAX_SPRITE 的图不打进图集。"""
+    names = [name for name, image in images.items() if max(image.get_size()) <= ATLAS_MAX_SPRITE]
+    sizes = [images[name].get_size() for name in names]
+    positions, atlas_size = shelf_pack(sizes, max(max_width, max((w for w, _h in sizes), default=1)), padding)
+    surface = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    rects = {}
+    for name, size, position in zip(names, sizes, positions):
+        surface.blit(images[name], position)
+        rects[name] = pygame.Rect(position, size)
+    return TextureAtlas(surface, rects)
@@ -1,4 +1,5 @@
-from core.game_contract import GameDescriptor
+from core.asset_loader import project_path
+from core.game_contract import GAME_BUTTON_ICONS, AssetManifest, GameDescriptor, ui_icon_images
 from .scenes.root_scene import CatchFruitScene
 
 
@@ -6,6 +7,13 @@ def create_scene(manager):
     return CatchFruitScene(manager)
 
 
+def _object_images():
+    objects = ("games", "accommodation", "catch_fruit", "assets", "objects")
+    fruits = ("apple", "banana", "orange", "strawberry", "grapes", "watermelon")
+    images = tuple((str(project_path(*objects, f"{name}.png")), None) for name in fruits)
+    return images + ((str(project_path(*objects, "basket.png")), (148, 52)),)
+
+
 def build_descriptor():
     return GameDescriptor(
         game_id="accommodation.catch_fruit",
@@ -13,5 +21,6 @@ def build_descriptor():
         name="Catch Fruit Focus",
         factory=create_scene,
         name_key="game.accommodation.catch_fruit",
+        assets=AssetManifest(images=_object_images() + ui_icon_images(GAME_BUTTON_ICONS)),
     )
 
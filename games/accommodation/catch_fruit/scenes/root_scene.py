@@ -1,14 +1,17 @@
-import time
 from datetime import datetime
 
 import pygame
 
-from core.asset_loader import load_image_if_exists, project_path
+from core import frame_clock
+from core.asset_loader import count_image_allocation, load_image_if_exists, project_path
 from core.base_scene import BaseScene
+from core.quality_governor import QUALITY_MEDIUM
+from core.scale_pyramid import FRUIT_PYRAMID_LEVELS, get_scale_pyramid
 from ..services import CatchFruitBoardService, CatchFruitScoringService, CatchFruitSessionService
 
 
 class CatchFruitScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
@@ -101,7 +104,7 @@ class CatchFruitScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _play_sound(self, method_name):
         sound_manager = getattr(self.manager, "sound_manager", None)
@@ -113,7 +116,7 @@ class CatchFruitScene(BaseScene):
         current_basket_x = self.round_data.get("basket_x") if self.round_data else None
         self.round_data = self.board_service.create_round(self.play_area, self._stage_index(), 3, basket_x=current_basket_x)
         self._sync_round_aliases()
-        self.session.restart_round(time.time())
+        self.session.restart_round(frame_clock.now())
 
     def _sync_round_aliases(self):
         fruits = self.round_data.get("fruits") or []
@@ -279,19 +282,25 @@ class CatchFruitScene(BaseScene):
             screen.blit(basket_surface, basket_surface.get_rect(center=basket.center))
         else:
             pygame.draw.rect(screen, (176, 118, 62), basket, border_radius=14)
+        draw_halo = self.quality_at_least(QUALITY_MEDIUM)
         for fruit in sorted(self.round_data["fruits"], key=lambda item: item["y"]):
-            clarity = self._clarity(fruit)
             size = self._current_size(fruit)
-            halo = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-            pygame.draw.circle(halo, (255, 223, 142, int(150 * (1.0 - clarity))), (halo.get_width() // 2, halo.get_height() // 2), size)
             fruit_center = (int(fruit["x"]), int(fruit["y"]))
-            screen.blit(halo, halo.get_rect(center=fruit_center))
-            fruit_surface = load_image_if_exists(self.board_service.fruit_assets[fruit["fruit_name"]], (size, size))
-            if fruit_surface is not None:
+            if draw_halo:
+                clarity = self._clarity(fruit)
+                halo = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+                count_image_allocation()
+                pygame.draw.circle(halo, (255, 223, 142, int(150 * (1.0 - clarity))), (halo.get_width() // 2, halo.get_height() // 2), size)
+                screen.blit(halo, halo.get_rect(center=fruit_center))
+            pyramid = get_scale_pyramid(
+                self.board_service.fruit_assets[fruit["fruit_name"]], fruit["end_size"], fruit["start_size"], FRUIT_PYRAMID_LEVELS
+            )
+            if pyramid is not None:
+                fruit_surface = pyramid.surface(size)
                 screen.blit(fruit_surface, fruit_surface.get_rect(center=fruit_center))
             else:
                 pygame.draw.circle(screen, (255, 98, 86), fruit_center, size // 2)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.play_area.bottom + 20))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (88, 116, 168), icon_name="back_arrow")
@@ -372,7 +381,7 @@ class CatchFruitScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             frame_scale = self.frame_scale()
             self.session.tick(now)
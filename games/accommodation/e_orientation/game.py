@@ -1,4 +1,4 @@
-from core.game_contract import GameDescriptor
+from core.game_contract import AssetManifest, GameDescriptor, ui_icon_images
 from .scenes.root_scene import ETrainingRootScene
 
 
@@ -6,6 +6,13 @@ def create_scene(manager):
     return ETrainingRootScene(manager)
 
 
+def _ui_icons():
+    # 返回标签与报告页按钮用 18px 图标，配置页按钮用 16px。
+    return ui_icon_images(("back_arrow_dark", "check_dark", "cross_dark")) + ui_icon_images(
+        ("check_light", "home_light", "cross_dark"), size=(16, 16)
+    )
+
+
 def build_descriptor():
     return GameDescriptor(
         game_id="accommodation.e_orientation",
@@ -13,4 +20,5 @@ def build_descriptor():
         name="E Orientation Training",
         factory=create_scene,
         name_key="game.accommodation.e_orientation",
+        assets=AssetManifest(images=_ui_icons()),
     )
@@ -627,8 +627,7 @@ class ConfigScene(BaseScene):
         preview_level = self.hovered_level if self.hovered_level is not None else self.draft_settings["start_level"]
         preview_size = E_SIZE_LEVELS[preview_level - 1]
         distance = max(1.0, round(4.5 - (preview_level - 1) * 0.5, 1))
-        preview_surface = EGenerator.create_e_surface(preview_size, "RIGHT")
-        preview_surface.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        preview_surface = EGenerator.optotype(preview_size, "RIGHT", color=(0, 0, 0))
         preview_rect = preview_surface.get_rect(center=(self.preview_panel_rect.centerx, self.preview_panel_rect.y + 100))
         screen.blit(preview_surface, preview_rect)
 
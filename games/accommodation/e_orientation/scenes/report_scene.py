@@ -1,6 +1,6 @@
 import pygame
 import math
-import time
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from core.ui_theme import PlatformTheme, draw_platform_background
@@ -102,7 +102,7 @@ class ReportScene(BaseScene):
     def on_enter(self):
         self.adaptive_result = self.manager.evaluate_adaptive_level()
         self.prev_session = self.records_service.get_previous_session()
-        self.enter_started_at = time.time()
+        self.enter_started_at = frame_clock.now()
         self.final_result = {
             "correct": int(self.manager.current_result.get("correct", 0)),
             "wrong": int(self.manager.current_result.get("wrong", 0)),
@@ -115,7 +115,7 @@ class ReportScene(BaseScene):
     def _animation_progress(self, now=None):
         if self.enter_started_at <= 0:
             return 1.0
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         elapsed = max(0.0, current - self.enter_started_at)
         return max(0.0, min(1.0, elapsed / self.ENTER_ANIMATION_SECONDS))
 
@@ -300,7 +300,7 @@ class ReportScene(BaseScene):
 
         badge_text = self._result_text(accuracy)
         badge_color = self._accuracy_color(accuracy)
-        pulse = 1.0 + math.sin(time.time() * 6.0) * 0.04 * progress
+        pulse = 1.0 + math.sin(frame_clock.now() * 6.0) * 0.04 * progress
         badge = self.badge_font.render(badge_text, True, badge_color)
         if pulse > 1.0:
             badge = pygame.transform.smoothscale(
@@ -1,4 +1,6 @@
+from config import E_SIZE_LEVELS
 from core.base_scene import BaseScene
+from core.e_generator import EGenerator
 
 from .config_scene import ConfigScene
 from .history_scene import HistoryScene
@@ -67,6 +69,10 @@ class ETrainingRootScene(BaseScene):
     def on_enter(self):
         self.navigate(self.current_scene_name, force_reset=False)
 
+    def prewarm(self):
+        # 训练与配置预览都用黑色 E 字，空闲时预渲染全部等级和方向。
+        EGenerator.prebake(E_SIZE_LEVELS, colors=((0, 0, 0),))
+
     def on_resize(self, width, height):
         if hasattr(self.current_scene, "on_resize"):
             self.current_scene.on_resize(width, height)
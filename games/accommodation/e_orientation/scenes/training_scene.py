@@ -1,74 +1,28 @@
 import logging
 import pygame
 import random
-import time
 from datetime import datetime
+from core import frame_clock
 from core.base_scene import BaseScene
+from core.quality_governor import QUALITY_HIGH, QUALITY_LOW, QUALITY_MEDIUM
 from core.ui_theme import PlatformTheme, draw_chip, draw_chip_label, draw_platform_background
 from ..services import ETrainingRecordsService
 from core.e_generator import EGenerator
 from config import E_SIZE_LEVELS, SCREEN_WIDTH, SCREEN_HEIGHT
+from games.common.particles import ParticleSystem
 
 
 logger = logging.getLogger(__name__)
 
 
-class Particle:
-    """粒子效果类 - 支持火花与扩散环两种反馈。"""
-
-    def __init__(self, x, y, vx, vy, color, lifetime, size, kind="spark"):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = max(1, lifetime)
-        self.size = float(size)
-        self.kind = kind
-        self.gravity = 0.16 if kind == "spark" else 0.0
-        self.drag = 0.96 if kind == "spark" else 1.0
-
-    def update(self):
-        self.lifetime -= 1
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.vx *= self.drag
-        self.vy *= self.drag
-        if self.kind == "ring":
-            self.size += 0.9
-        else:
-            self.size = max(1.0, self.size * 0.985)
-
-    def draw(self, screen, offset=(0, 0)):
-        if self.lifetime <= 0:
-            return
-
-        fade = max(0.0, min(1.0, self.lifetime / self.max_lifetime))
-        color = (
-            int(self.color[0] * fade),
-            int(self.color[1] * fade),
-            int(self.color[2] * fade),
-        )
-        radius = max(1, int(self.size))
-        center = (int(self.x + offset[0]), int(self.y + offset[1]))
-        if self.kind == "ring":
-            width = 2 if radius > 4 else 1
-            pygame.draw.circle(screen, color, center, radius, width)
-        else:
-            pygame.draw.circle(screen, color, center, radius)
-
-    def is_alive(self):
-        return self.lifetime > 0
-
-
 class TrainingScene(BaseScene):
     FINISH_TRANSITION_SECONDS = 1
     FINISH_TRANSITION_AUDIO_PADDING_SECONDS = 0.05
     FINISH_TRANSITION_MIN_SECONDS = 0.35
     FINISH_TRANSITION_MAX_SECONDS = 1.2
     MAX_PARTICLES = 120
+    # 低画质档位按比例减少反馈粒子，并关闭震屏。
+    PARTICLE_COUNT_SCALE = {QUALITY_HIGH: 1.0, QUALITY_MEDIUM: 0.6, QUALITY_LOW: 0.3}
 
     KEY_DIRECTION = {
         pygame.K_UP: "UP",
@@ -98,7 +52,7 @@ class TrainingScene(BaseScene):
         self.max_combo = 0
         self.base_size = E_SIZE_LEVELS[0]
         self.target_direction = "RIGHT"
-        self.surface = EGenerator.create_e_surface(self.base_size, self.target_direction)
+        self.surface = EGenerator.optotype(self.base_size, self.target_direction)
         self.rect = self.surface.get_rect(center=self.center_pos)
         self.is_waiting_for_delay = False
         self.answer_delay_end_time = 0
@@ -112,7 +66,7 @@ class TrainingScene(BaseScene):
         self.shake_offset = (0, 0)
 
         # 粒子效果列表
-        self.particles = []
+        self.particles = ParticleSystem(self.MAX_PARTICLES)
 
         # 保持现有行为：构造后即可进入可用状态
         self.reset()
@@ -155,7 +109,7 @@ class TrainingScene(BaseScene):
         self.combo = 0
         self.max_combo = 0
         self.combo_display_frames = 0
-        self.start_time = time.time()
+        self.start_time = frame_clock.now()
         self.paused_duration_seconds = 0.0
         self.pause_started_at = 0.0
         self.is_paused = False
@@ -169,7 +123,7 @@ class TrainingScene(BaseScene):
         self.base_size = E_SIZE_LEVELS[level_index]
         
         # 时间控制相关属性
-        self.last_change_time = time.time()  # 上次变换时间
+        self.last_change_time = frame_clock.now()  # 上次变换时间
         self.answer_delay_end_time = 0  # 用户回答后的延迟结束时间
         self.is_waiting_for_delay = False  # 是否在等待回答后的延迟
         self.finish_transition_active = False
@@ -201,12 +155,12 @@ class TrainingScene(BaseScene):
         if self.is_paused:
             return
         self.is_paused = True
-        self.pause_started_at = time.time()
+        self.pause_started_at = frame_clock.now()
 
     def _resume_training(self):
         if not self.is_paused:
             return
-        now = time.time()
+        now = frame_clock.now()
         paused_span = max(0.0, now - self.pause_started_at)
         self.paused_duration_seconds += paused_span
         if self.is_waiting_for_delay:
@@ -221,18 +175,14 @@ class TrainingScene(BaseScene):
             self._pause_training()
 
     def _active_elapsed_seconds(self) -> float:
-        now = time.time()
+        now = frame_clock.now()
         paused_now = max(0.0, now - self.pause_started_at) if self.is_paused else 0.0
         elapsed = now - self.start_time - self.paused_duration_seconds - paused_now
         return max(0.0, elapsed)
 
-    def _add_particle(self, particle):
-        self.particles.append(particle)
-        if len(self.particles) > self.MAX_PARTICLES:
-            overflow = len(self.particles) - self.MAX_PARTICLES
-            del self.particles[:overflow]
-
     def _start_screen_shake(self, frames, intensity):
+        if not self.quality_at_least(QUALITY_MEDIUM):
+            return
         self.shake_frames = max(self.shake_frames, frames)
         self.shake_intensity = max(self.shake_intensity, intensity)
 
@@ -250,17 +200,21 @@ class TrainingScene(BaseScene):
             speed = 3.0
             self._start_screen_shake(6, 3)
 
-        for _ in range(count):
-            vx = random.uniform(-speed, speed)
-            vy = random.uniform(-speed - 1.0, -0.4)
-            size = random.uniform(2.0, 4.6)
-            life = random.randint(18, 34)
-            color = base_color if random.random() < 0.7 else accent_color
-            self._add_particle(Particle(x, y, vx, vy, color, life, size, kind="spark"))
+        count = max(1, int(round(count * self.PARTICLE_COUNT_SCALE.get(self.quality_tier(), 1.0))))
+        self.particles.emit(
+            x,
+            y,
+            [random.uniform(-speed, speed) for _ in range(count)],
+            [random.uniform(-speed - 1.0, -0.4) for _ in range(count)],
+            [base_color if random.random() < 0.7 else accent_color for _ in range(count)],
+            [random.randint(18, 34) for _ in range(count)],
+            [random.uniform(2.0, 4.6) for _ in range(count)],
+            kind="spark",
+        )
 
         if is_correct and self.combo >= 3:
             ring_color = (250, 220, 130) if self.combo < 6 else (255, 182, 108)
-            self._add_particle(Particle(x, y, 0.0, 0.0, ring_color, 18, 10.0, kind="ring"))
+            self.particles.emit(x, y, 0.0, 0.0, ring_color, 18, 10.0, kind="ring")
 
     def new_question(self):
         directions = ["UP", "DOWN", "LEFT", "RIGHT"]
@@ -271,9 +225,9 @@ class TrainingScene(BaseScene):
         self.target_direction = random.choice(directions)
         self.previous_direction = self.target_direction
 
-        self.surface = EGenerator.create_e_surface(self.base_size, self.target_direction)
-        self.surface.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        self.surface = EGenerator.optotype(self.base_size, self.target_direction, color=(0, 0, 0))
         self.rect = self.surface.get_rect(center=self.center_pos)
+        self.mark_stimulus_onset("question")
 
     def _save_training_record(self, duration: float, wrong: int):
         """保存训练记录到数据管理器"""
@@ -338,7 +292,7 @@ class TrainingScene(BaseScene):
             self.FINISH_TRANSITION_MIN_SECONDS,
             min(self.FINISH_TRANSITION_MAX_SECONDS, transition_seconds),
         )
-        self.finish_transition_ends_at = time.time() + transition_seconds
+        self.finish_transition_ends_at = frame_clock.now() + transition_seconds
 
     def handle_events(self, events):
         mouse_pos = pygame.mouse.get_pos()
@@ -401,7 +355,7 @@ class TrainingScene(BaseScene):
                     else:
                         # 设置回答后的延迟标志和结束时间（1秒延迟）
                         self.is_waiting_for_delay = True
-                        self.answer_delay_end_time = time.time() + 1.0
+                        self.answer_delay_end_time = frame_clock.now() + 1.0
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # 左键点击
@@ -417,15 +371,12 @@ class TrainingScene(BaseScene):
         if self.is_paused:
             return
 
-        current_time = time.time()
+        current_time = frame_clock.now()
         if self._is_time_mode() and self._active_elapsed_seconds() >= self._session_seconds():
             self._begin_finish_transition()
 
         # 更新粒子效果
-        for particle in self.particles[:]:
-            particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        self.particles.step()
 
         if self.combo_display_frames > 0:
             self.combo_display_frames -= 1
@@ -504,8 +455,7 @@ class TrainingScene(BaseScene):
             screen.blit(combo_text, (self.center_pos[0] - combo_text.get_width() // 2, 72))
         
         # 绘制粒子效果（已经在update中处理了）
-        for particle in self.particles:
-            particle.draw(screen, self.shake_offset)
+        self.particles.draw(screen, self.shake_offset)
         
         # 绘制返回按钮（右上角，强迫症级别的精确位置）
         mouse_pos = pygame.mouse.get_pos()
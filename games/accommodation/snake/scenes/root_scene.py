@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from ..services import SnakeBoardService, SnakeScoringService, SnakeSessionService
 
@@ -25,7 +25,7 @@ class SnakeFocusScene(BaseScene):
         self.board_service = SnakeBoardService()
         self.scoring = SnakeScoringService()
         self.session = SnakeSessionService(self._session_seconds())
-        self.tick_at = time.time()
+        self.tick_at = frame_clock.now()
         self.round_data = {}
         self._refresh_fonts()
         self._build_ui()
@@ -97,7 +97,7 @@ class SnakeFocusScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _start_game(self):
         self.state = self.STATE_PLAY
@@ -105,7 +105,7 @@ class SnakeFocusScene(BaseScene):
         self.session.session_seconds = self._session_seconds()
         self.session.start()
         self.round_data = self.board_service.create_round(self.play_area)
-        self.tick_at = time.time()
+        self.tick_at = frame_clock.now()
 
     def _finish_game(self):
         self.state = self.STATE_RESULT
@@ -210,7 +210,7 @@ class SnakeFocusScene(BaseScene):
             rect = pygame.Rect(inner_board.x + segment[0] * cell + 3, inner_board.y + segment[1] * cell + 3, cell - 6, cell - 6)
             pygame.draw.rect(screen, color, rect, border_radius=8)
         pygame.draw.rect(screen, (176, 204, 176), inner_board, 2, border_radius=10)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, inner_board.bottom + 20))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (88, 116, 168))
@@ -287,7 +287,7 @@ class SnakeFocusScene(BaseScene):
                         self.manager.set_scene("menu")
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             if self.session.is_complete():
@@ -1,10 +1,11 @@
 import math
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
+from games.common.stimulus_textures import StimulusTextureCache
 from ..services import FruitSliceBoardService, FruitSliceScoringService, FruitSliceSessionService
 
 
@@ -25,7 +26,8 @@ class FruitSliceScene(BaseScene):
         self.final_stats = {}
         self.background_mode = "checker"
         self.background_phase = 0.0
-        self.background_switched_at = time.time()
+        self._stimulus_textures = StimulusTextureCache()
+        self.background_switched_at = frame_clock.now()
         self.board_service = FruitSliceBoardService()
         self.scoring = FruitSliceScoringService()
         self.session = FruitSliceSessionService(self._session_seconds())
@@ -83,26 +85,19 @@ class FruitSliceScene(BaseScene):
 
     def _draw_stimulus_background(self, screen):
         clip_rect = self.play_area.inflate(40, 30)
-        pattern_surface = pygame.Surface(clip_rect.size)
         offset = int(self.background_phase * 10) % 26
         if self.background_mode == "checker":
-            cell = 26
-            for row, y in enumerate(range(0, clip_rect.height, cell)):
-                for col, x in enumerate(range(0, clip_rect.width, cell)):
-                    shade = 236 if (row + col) % 2 == 0 else 24
-                    pygame.draw.rect(pattern_surface, (shade, shade, shade), pygame.Rect(x, y, cell, cell))
+            self._stimulus_textures.blit_checker(screen, clip_rect.topleft, clip_rect.size, 26, (236, 236, 236), (24, 24, 24))
         else:
-            stripe = 18
-            for idx, x in enumerate(range(-stripe + offset, clip_rect.width + stripe, stripe)):
-                shade = 242 if idx % 2 == 0 else 28
-                pygame.draw.rect(pattern_surface, (shade, shade, shade), pygame.Rect(x, 0, stripe, clip_rect.height))
-        screen.blit(pattern_surface, clip_rect.topleft)
+            self._stimulus_textures.blit_stripes(
+                screen, clip_rect.topleft, clip_rect.size, 18, (242, 242, 242), (28, 28, 28), shift=offset - 18
+            )
         pygame.draw.rect(screen, (220, 228, 238), clip_rect, 2, border_radius=18)
 
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 0.9
+        self.feedback_until = frame_clock.now() + 0.9
 
     def _new_round(self):
         self.round_data = self.board_service.create_round(self.play_area)
@@ -179,7 +174,7 @@ class FruitSliceScene(BaseScene):
             else:
                 pygame.draw.circle(screen, item["color"], (cx, cy), item["radius"])
                 pygame.draw.arc(screen, (255, 255, 255), pygame.Rect(cx - item["radius"] // 2, cy - 8, item["radius"], item["radius"] // 2), math.pi, math.pi * 2, 3)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.play_area.bottom + 20))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170))
@@ -257,7 +252,7 @@ class FruitSliceScene(BaseScene):
                         self.manager.set_scene("menu")
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             self.background_phase += 0.05 * self.frame_scale()
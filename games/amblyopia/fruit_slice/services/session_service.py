@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class FruitSliceSessionService:
@@ -15,18 +15,18 @@ class FruitSliceSessionService:
         self.round_elapsed = 0.0
 
     def start(self):
-        now = time.time()
+        now = frame_clock.now()
         self.session_started_at = now
         self.round_started_at = now
         self.session_elapsed = 0.0
         self.round_elapsed = 0.0
 
     def restart_round(self):
-        self.round_started_at = time.time()
+        self.round_started_at = frame_clock.now()
         self.round_elapsed = 0.0
 
     def tick(self, now=None):
-        now = time.time() if now is None else now
+        now = frame_clock.now() if now is None else now
         if self.session_started_at:
             self.session_elapsed = now - self.session_started_at
         if self.round_started_at:
@@ -1,4 +1,4 @@
-from core.game_contract import GameDescriptor
+from core.game_contract import GAME_BUTTON_ICONS, AssetManifest, GameDescriptor, ui_icon_images
 from .scenes.root_scene import PrecisionAimScene
 
 
@@ -13,5 +13,6 @@ def build_descriptor():
         name="Precision Aim Target",
         factory=create_scene,
         name_key="game.amblyopia.precision_aim",
+        assets=AssetManifest(images=ui_icon_images(GAME_BUTTON_ICONS)),
     )
 
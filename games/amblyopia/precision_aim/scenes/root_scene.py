@@ -1,19 +1,22 @@
 import math
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
+from games.common.stimulus_textures import StimulusTextureCache, tint_toward_white
 from ..services import PrecisionAimBoardService, PrecisionAimScoringService, PrecisionAimSessionService
 
 
 class PrecisionAimScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
     STATE_RESULT = "result"
+    STIMULUS_PANEL_ALPHA = 48
 
     def __init__(self, manager):
         super().__init__(manager)
@@ -25,8 +28,9 @@ class PrecisionAimScene(BaseScene):
         self.feedback_until = 0.0
         self.final_stats = {}
         self.background_mode = "checker"
-        self.background_switched_at = time.time()
+        self.background_switched_at = frame_clock.now()
         self.background_phase = 0.0
+        self._stimulus_textures = StimulusTextureCache()
         self.previous_anchor_center = None
         self.board_service = PrecisionAimBoardService()
         self.scoring = PrecisionAimScoringService()
@@ -66,7 +70,7 @@ class PrecisionAimScene(BaseScene):
         self.feedback_text = ""
         self.final_stats = {}
         self.background_mode = "checker"
-        self.background_switched_at = time.time()
+        self.background_switched_at = frame_clock.now()
         self.background_phase = 0.0
         self.previous_anchor_center = None
         self.scoring.reset()
@@ -111,7 +115,7 @@ class PrecisionAimScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _play_sound(self, method_name):
         sound_manager = getattr(self.manager, "sound_manager", None)
@@ -127,7 +131,8 @@ class PrecisionAimScene(BaseScene):
             previous_anchor=self.previous_anchor_center,
         )
         self.previous_anchor_center = self.round_data["anchor_center"]
-        self.session.restart_round(time.time())
+        self.session.restart_round(frame_clock.now())
+        self.mark_stimulus_onset("target")
 
     def _start_game(self):
         self.state = self.STATE_PLAY
@@ -201,32 +206,17 @@ class PrecisionAimScene(BaseScene):
     def _draw_stimulus_background(self, screen):
         area = self.play_area.inflate(40, 30)
         clip_rect = area.clip(pygame.Rect(0, 0, self.width, self.height))
-        panel = pygame.Surface(clip_rect.size, pygame.SRCALPHA)
-        panel.fill((255, 255, 255, 48))
-        pattern_surface = pygame.Surface(clip_rect.size, pygame.SRCALPHA)
-        offset = int(math.sin(self.background_phase) * 6)
+        # 半透明白色面板已预先混合进纹理颜色，不再逐帧叠加。
         if self.background_mode == "checker":
-            cell = 26
-            for row, y in enumerate(range(0, clip_rect.height, cell)):
-                for col, x in enumerate(range(0, clip_rect.width, cell)):
-                    shade = 236 if (row + col) % 2 == 0 else 24
-                    wobble = ((row % 2) * 2 - 1) * offset
-                    rect = pygame.Rect(x + wobble, y, cell, cell)
-                    pygame.draw.rect(pattern_surface, (shade, shade, shade), rect)
+            offset = int(math.sin(self.background_phase) * 6)
+            light = tint_toward_white((236, 236, 236), self.STIMULUS_PANEL_ALPHA)
+            dark = tint_toward_white((24, 24, 24), self.STIMULUS_PANEL_ALPHA)
+            self._stimulus_textures.blit_checker(screen, clip_rect.topleft, clip_rect.size, 26, light, dark, row_shifts=(-offset, offset))
         else:
-            stripe = 18
             slide = int(math.sin(self.background_phase) * 10)
-            for idx, x in enumerate(range(-24, clip_rect.width + 24, stripe)):
-                shade = 242 if idx % 2 == 0 else 28
-                points = [
-                    (x + slide, 0),
-                    (x + stripe + slide, 0),
-                    (x + stripe + slide, clip_rect.height),
-                    (x + slide, clip_rect.height),
-                ]
-                pygame.draw.polygon(pattern_surface, (shade, shade, shade), points)
-        pattern_surface.blit(panel, (0, 0))
-        screen.blit(pattern_surface, clip_rect.topleft)
+            light = tint_toward_white((242, 242, 242), self.STIMULUS_PANEL_ALPHA)
+            dark = tint_toward_white((28, 28, 28), self.STIMULUS_PANEL_ALPHA)
+            self._stimulus_textures.blit_stripes(screen, clip_rect.topleft, clip_rect.size, 18, light, dark, shift=slide - 24)
         pygame.draw.rect(screen, (220, 228, 238), clip_rect, 2, border_radius=18)
 
     def _handle_shot(self, x, y):
@@ -338,7 +328,7 @@ class PrecisionAimScene(BaseScene):
                 (72, 132, 208),
             )
             screen.blit(streak, (self.play_area.right - streak.get_width() - 12, self.play_area.y + 12))
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.play_area.bottom + 18))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170), icon_name="back_arrow")
@@ -435,7 +425,7 @@ class PrecisionAimScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             self.background_phase += 0.045 * self.frame_scale()
@@ -2,6 +2,8 @@ import numpy as np
 import pygame
 import pygame.surfarray
 
+from core.asset_loader import count_image_allocation
+
 try:
     import cv2
 except ImportError:
@@ -29,6 +31,7 @@ def apply_filter(base, mode, filter_direction, side, mode_glasses=MODE_GLASSES,
     channel_index = 0 if use_red else 2
     result_rgb[:, :, channel_index] = base_alpha
     result = pygame.Surface(base.get_size(), pygame.SRCALPHA)
+    count_image_allocation()
     pixels_rgb = pygame.surfarray.pixels3d(result)
     pixels_rgb[:] = result_rgb
     del pixels_rgb
@@ -77,6 +80,7 @@ def _bitwise_overlap(left_rgb, right_rgb, overlap_mask):
 def blend_filtered_patterns(canvas_size, left_surface, left_rect, right_surface, right_rect, crop_border=0, use_offset_crop=True):
     left_layer = pygame.Surface(canvas_size, pygame.SRCALPHA)
     right_layer = pygame.Surface(canvas_size, pygame.SRCALPHA)
+    count_image_allocation(2)
     left_layer.blit(left_surface, left_rect)
     right_layer.blit(right_surface, right_rect)
 
@@ -112,6 +116,7 @@ def blend_filtered_patterns(canvas_size, left_surface, left_rect, right_surface,
         _clear_edge_artifacts(output_rgb, output_alpha, crop)
 
     blended = pygame.Surface(canvas_size, pygame.SRCALPHA)
+    count_image_allocation()
     blended_rgb = pygame.surfarray.pixels3d(blended)
     blended_rgb[:] = output_rgb
     del blended_rgb
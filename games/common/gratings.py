@@ -0,0 +1,144 @@
+import math
+
+import numpy as np
+import pygame
+import pygame.surfarray
+
+from core.asset_loader import count_image_allocation
+
+
+MEAN_LUMINANCE = 127.5
+DEFAULT_PHASE_STEPS = 32
+# 刺激背景交替使用的两个斜向朝向（度）。
+GRATING_ORIENTATIONS = (45.0, 135.0)
+
+
+def _wave_axis(orientation):
+    """orientation 为条纹方向（度），0 为竖条纹；返回波矢方向的单位向量。"""
+    theta = math.radians(float(orientation))
+    return math.cos(theta), math.sin(theta)
+
+
+def grating_luminance(size, spatial_frequency, contrast=1.0, orientation=0.0, phase=0.0, origin=(0.0, 0.0)):
+    """生成正弦光栅亮度，数组形状为 (width, height)，与 surfarray 一致。
+
+    spatial_frequency 单位为每像素周期数，contrast 为 Michelson 对比度（0~1）。
+    """
+    width, height = size
+    cos_t, sin_t = _wave_axis(orientation)
+    xs = np.arange(width, dtype=np.float32)[:, None] - np.float32(origin[0])
+    ys = np.arange(height, dtype=np.float32)[None, :] - np.float32(origin[1])
+    projection = xs * np.float32(cos_t) + ys * np.float32(sin_t)
+    carrier = np.sin(np.float32(2.0 * math.pi * spatial_frequency) * projection + np.float32(phase))
+    return np.float32(MEAN_LUMINANCE) * (1.0 + np.float32(max(0.0, min(1.0, contrast))) * carrier)
+
+
+def gabor_luminance(size, spatial_frequency, sigma, contrast=1.0, orientation=0.0, phase=0.0):
+    """生成 Gabor 斑块亮度：以中心为原点的光栅乘以高斯包络，外围回到平均亮度。"""
+    width, height = size
+    center = ((width - 1) / 2.0, (height - 1) / 2.0)
+    xs = np.arange(width, dtype=np.float32)[:, None] - np.float32(center[0])
+    ys = np.arange(height, dtype=np.float32)[None, :] - np.float32(center[1])
+    sigma = max(1e-3, float(sigma))
+    envelope = np.exp(-(xs * xs + ys * ys) / np.float32(2.0 * sigma * sigma))
+    grating = grating_luminance(size, spatial_frequency, contrast, orientation, phase, origin=center)
+    return np.float32(MEAN_LUMINANCE) + (grating - np.float32(MEAN_LUMINANCE)) * envelope
+
+
+def luminance_to_surface(luminance, surface=None):
+    """把亮度数组写入灰阶 Surface；传入 surface 时原地复用。"""
+    values = np.clip(np.rint(luminance), 0, 255).astype(np.uint8)
+    if surface is None:
+        surface = pygame.Surface(values.shape)
+        count_image_allocation()
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[:] = values[:, :, None]
+    del pixels
+    return surface
+
+
+def make_grating_surface(size, spatial_frequency, contrast=1.0, orientation=0.0, phase=0.0):
+    return luminance_to_surface(grating_luminance(size, spatial_frequency, contrast, orientation, phase))
+
+
+def make_gabor_surface(size, spatial_frequency, sigma, contrast=1.0, orientation=0.0, phase=0.0):
+    return luminance_to_surface(gabor_luminance(size, spatial_frequency, sigma, contrast, orientation, phase))
+
+
+def _phase_step(phase, phase_steps):
+    return int(round(float(phase) / (2.0 * math.pi) * phase_steps)) % phase_steps
+
+
+class DriftingGrating:
+    """漂移光栅：只渲染一张沿主轴多出一个周期的纹理，不同相位取不同子区域。
+
+    子区域只沿波矢分量较大的坐标轴整像素平移，该轴上一个周期为 λ/|cosθ| 或 λ/|sinθ|，
+    每平移一像素相位前进 2π/period；斜向光栅不再因 x、y 分别取整而出现相位抖动。
+    """
+
+    def __init__(self, size, spatial_frequency, contrast=1.0, orientation=0.0):
+        self.size = (max(1, int(size[0])), max(1, int(size[1])))
+        self.spatial_frequency = max(1e-4, float(spatial_frequency))
+        self.contrast = contrast
+        self.orientation = orientation
+        self.wavelength = 1.0 / self.spatial_frequency
+        axis = _wave_axis(orientation)
+        self._axis_index = 0 if abs(axis[0]) >= abs(axis[1]) else 1
+        component = axis[self._axis_index]
+        self._direction = 1 if component > 0 else -1
+        self.period = self.wavelength / abs(component)
+        pad = int(math.ceil(self.period))
+        # 波矢分量为负时把纹理原点挪到另一侧，保证所有取样偏移都非负。
+        anchor = [0, 0]
+        padding = [0, 0]
+        padding[self._axis_index] = pad
+        if self._direction < 0:
+            anchor[self._axis_index] = pad
+        self._anchor = tuple(anchor)
+        texture_size = (self.size[0] + padding[0], self.size[1] + padding[1])
+        self.texture = luminance_to_surface(
+            grating_luminance(texture_size, self.spatial_frequency, contrast, orientation, 0.0, origin=self._anchor)
+        )
+        self._frames = {}
+
+    def _shift(self, phase):
+        shift = int(round((float(phase) / (2.0 * math.pi)) % 1.0 * self.period))
+        return 0 if shift >= self.period else shift
+
+    def frame_phase(self, phase):
+        """frame(phase) 实际呈现的相位（量化到主轴上的整像素平移）。"""
+        return 2.0 * math.pi * self._shift(phase) / self.period
+
+    def frame(self, phase):
+        """返回指定相位的画面（纹理子区域，按平移像素缓存，不复制像素）。"""
+        shift = self._shift(phase)
+        frame = self._frames.get(shift)
+        if frame is None:
+            offset = list(self._anchor)
+            offset[self._axis_index] += self._direction * shift
+            frame = self.texture.subsurface(pygame.Rect(offset[0], offset[1], *self.size))
+            self._frames[shift] = frame
+        return frame
+
+
+class DriftingGabor:
+    """漂移 Gabor：包络固定、载波相位变化，按量化相位缓存整帧。"""
+
+    def __init__(self, size, spatial_frequency, sigma, contrast=1.0, orientation=0.0, phase_steps=DEFAULT_PHASE_STEPS):
+        self.size = (max(1, int(size[0])), max(1, int(size[1])))
+        self.spatial_frequency = float(spatial_frequency)
+        self.sigma = float(sigma)
+        self.contrast = contrast
+        self.orientation = orientation
+        self.phase_steps = max(1, int(phase_steps))
+        self._frames = {}
+
+    def frame(self, phase):
+        step = _phase_step(phase, self.phase_steps)
+        frame = self._frames.get(step)
+        if frame is None:
+            # 每个量化相位只渲染一次，之后漂移只是一次 blit。
+            step_phase = 2.0 * math.pi * step / self.phase_steps
+            frame = make_gabor_surface(self.size, self.spatial_frequency, self.sigma, self.contrast, self.orientation, step_phase)
+            self._frames[step] = frame
+        return frame
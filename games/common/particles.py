@@ -0,0 +1,180 @@
+import numpy as np
+import pygame
+
+from core.asset_loader import count_image_allocation
+
+
+# 每种粒子的逐帧参数：(重力, 阻尼, 尺寸倍率, 尺寸增量, 描边宽度；0 表示实心)。
+PARTICLE_KINDS = {
+    "spark": (0.16, 0.96, 0.985, 0.0, 0),
+    "ring": (0.0, 1.0, 1.0, 0.9, 2),
+}
+# 淡出亮度量化级数；每个 (颜色, 半径, 级别) 只渲染一次点精灵。
+FADE_LEVELS = 16
+MIN_SIZE = 1.0
+MAX_DOT_SPRITES = 4096
+
+_DOT_SPRITES = {}
+
+
+def fade_level(lifetime, max_lifetime, levels=FADE_LEVELS):
+    """把剩余寿命比例向上取整到 1..levels，新生粒子保持全亮。"""
+    ratio = np.clip(np.asarray(lifetime, dtype=np.float32) / np.maximum(1.0, max_lifetime), 0.0, 1.0)
+    return np.clip(np.ceil(ratio * levels), 1, levels).astype(np.int32)
+
+
+def dot_sprite(color, radius, level, outline=0, levels=FADE_LEVELS):
+    """返回按淡出级别预先压暗的圆点（或圆环）精灵，圆心位于 (radius, radius)。"""
+    key = (color, radius, level, outline)
+    sprite = _DOT_SPRITES.get(key)
+    if sprite is not None:
+        return sprite
+    if len(_DOT_SPRITES) >= MAX_DOT_SPRITES:
+        _DOT_SPRITES.clear()
+    fade = level / levels
+    shade = tuple(int(channel * fade) for channel in color)
+    sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    count_image_allocation()
+    width = 0 if not outline else (outline if radius > 4 else 1)
+    pygame.draw.circle(sprite, shade, (radius, radius), radius, width)
+    _DOT_SPRITES[key] = sprite
+    return sprite
+
+
+def clear_dot_sprites():
+    _DOT_SPRITES.clear()
+
+
+class ParticleSystem:
+    """结构化数组存储的粒子池：一次向量化 step 推进全部粒子，绘制时批量 blit 预渲染精灵。
+
+    粒子按发射顺序紧凑存放在 [0, len) 中，超出容量时丢弃最早的粒子。
+    """
+
+    def __init__(self, capacity=1200):
+        self.capacity = max(1, int(capacity))
+        self._count = 0
+        self._palette = []
+        self._palette_index = {}
+        self._kinds = list(PARTICLE_KINDS)
+        self._kind_params = np.array([PARTICLE_KINDS[name] for name in self._kinds], dtype=np.float32)
+        n = self.capacity
+        self.x = np.zeros(n, dtype=np.float32)
+        self.y = np.zeros(n, dtype=np.float32)
+        self.vx = np.zeros(n, dtype=np.float32)
+        self.vy = np.zeros(n, dtype=np.float32)
+        self.size = np.zeros(n, dtype=np.float32)
+        self.lifetime = np.zeros(n, dtype=np.float32)
+        self.max_lifetime = np.ones(n, dtype=np.float32)
+        self.kind = np.zeros(n, dtype=np.int16)
+        self.color = np.zeros(n, dtype=np.int16)
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def _arrays(self):
+        return (self.x, self.y, self.vx, self.vy, self.size, self.lifetime, self.max_lifetime, self.kind, self.color)
+
+    def _color_index(self, color):
+        color = tuple(int(channel) for channel in color[:3])
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self._palette)
+            self._palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def clear(self):
+        self._count = 0
+
+    def emit(self, x, y, vx, vy, color, lifetime, size, kind="spark"):
+        """发射一个或一批粒子；除 color 与 kind 外的参数都可以是等长数组。
+
+        color 可以是单个 RGB，也可以是与粒子数等长的 RGB 序列。
+        """
+        x, y, vx, vy, lifetime, size = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(x, dtype=np.float32)),
+            np.asarray(y, dtype=np.float32),
+            np.asarray(vx, dtype=np.float32),
+            np.asarray(vy, dtype=np.float32),
+            np.asarray(lifetime, dtype=np.float32),
+            np.asarray(size, dtype=np.float32),
+        )
+        count = len(x)
+        if count == 0:
+            return
+        if len(color) and isinstance(color[0], (tuple, list)):
+            colors = np.array([self._color_index(item) for item in color], dtype=np.int16)
+        else:
+            colors = np.full(count, self._color_index(color), dtype=np.int16)
+        if count > self.capacity:
+            x, y, vx, vy, lifetime, size = (array[-self.capacity:] for array in (x, y, vx, vy, lifetime, size))
+            colors = colors[-self.capacity:]
+            count = self.capacity
+        overflow = self._count + count - self.capacity
+        if overflow > 0:
+            keep = self._count - overflow
+            for array in self._arrays():
+                array[:keep] = array[overflow:self._count]
+            self._count = keep
+        start, end = self._count, self._count + count
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.size[start:end] = size
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = np.maximum(1.0, lifetime)
+        self.kind[start:end] = self._kinds.index(kind)
+        self.color[start:end] = colors
+        self._count = end
+
+    def step(self):
+        """推进一帧并移除寿命耗尽的粒子。"""
+        n = self._count
+        if n == 0:
+            return
+        params = self._kind_params[self.kind[:n]]
+        gravity, drag, scale, grow = params[:, 0], params[:, 1], params[:, 2], params[:, 3]
+        self.lifetime[:n] -= 1
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += gravity
+        self.vx[:n] *= drag
+        self.vy[:n] *= drag
+        np.maximum(MIN_SIZE, self.size[:n] * scale + grow, out=self.size[:n])
+        alive = self.lifetime[:n] > 0
+        if alive.all():
+            return
+        keep = int(alive.sum())
+        for array in self._arrays():
+            array[:keep] = array[:n][alive]
+        self._count = keep
+
+    def draw(self, screen, offset=(0, 0)):
+        n = self._count
+        if n == 0:
+            return
+        radius = np.maximum(1, self.size[:n].astype(np.int32))
+        left = (self.x[:n] + offset[0]).astype(np.int32) - radius
+        top = (self.y[:n] + offset[1]).astype(np.int32) - radius
+        levels = fade_level(self.lifetime[:n], self.max_lifetime[:n])
+        outlines = self._kind_params[self.kind[:n], 4].astype(np.int32)
+        palette = self._palette
+        screen.blits(
+            [
+                (dot_sprite(palette[color], r, level, outline), (px, py))
+                for color, r, level, outline, px, py in zip(
+                    self.color[:n].tolist(),
+                    radius.tolist(),
+                    levels.tolist(),
+                    outlines.tolist(),
+                    left.tolist(),
+                    top.tolist(),
+                )
+            ],
+            doreturn=False,
+        )
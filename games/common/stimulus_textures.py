@@ -0,0 +1,135 @@
+from collections import OrderedDict
+
+import pygame
+
+from core.asset_loader import count_image_allocation
+from games.common.gratings import DriftingGrating
+
+
+# 行纹理的透明色键；刺激图案只使用灰阶，不会与之冲突。
+_COLORKEY = (255, 0, 255)
+
+
+def scroll_area(shift, period, size):
+    """返回从可平铺纹理中取样的区域，使图案整体向右平移 shift 像素。"""
+    offset = int(-shift) % period if period > 0 else 0
+    return pygame.Rect(offset, 0, size[0], size[1])
+
+
+def tint_toward_white(color, alpha):
+    """把半透明白色面板预先混合进颜色，省去每帧叠加一次面板。"""
+    ratio = max(0, min(255, int(alpha))) / 255.0
+    return tuple(int(round(channel + (255 - channel) * ratio)) for channel in color[:3])
+
+
+def build_checker_texture(size, cell, light, dark, row_parity=None):
+    """渲染宽度多出一个周期的棋盘纹理；row_parity 为 0/1 时只保留偶数/奇数行。"""
+    width, height = size
+    period = cell * 2
+    texture = pygame.Surface((max(1, width + period), max(1, height)))
+    count_image_allocation()
+    if row_parity is None:
+        texture.fill(dark)
+    else:
+        texture.fill(_COLORKEY)
+        texture.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+    for row, y in enumerate(range(0, height, cell)):
+        if row_parity is not None and row % 2 != row_parity:
+            continue
+        if row_parity is not None:
+            texture.fill(dark, pygame.Rect(0, y, texture.get_width(), cell))
+        for col, x in enumerate(range(0, texture.get_width(), cell)):
+            if (row + col) % 2 == 0:
+                texture.fill(light, pygame.Rect(x, y, cell, cell))
+    return texture
+
+
+def build_stripe_texture(size, stripe, light, dark):
+    """渲染竖条纹纹理，偶数条为浅色，宽度多出一个周期以便平移取样。"""
+    width, height = size
+    period = stripe * 2
+    texture = pygame.Surface((max(1, width + period), max(1, height)))
+    count_image_allocation()
+    texture.fill(dark)
+    for x in range(0, texture.get_width(), period):
+        texture.fill(light, pygame.Rect(x, 0, stripe, height))
+    return texture
+
+
+def build_rounded_mask(size, radius):
+    mask = pygame.Surface(size, pygame.SRCALPHA)
+    count_image_allocation()
+    pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=radius)
+    return mask
+
+
+def _new_scratch(size):
+    count_image_allocation()
+    return pygame.Surface(size, pygame.SRCALPHA)
+
+
+class StimulusTextureCache:
+    """按尺寸与参数缓存刺激纹理；运动只改变取样偏移，每帧只需几次 blit。"""
+
+    MAX_ENTRIES = 12
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _get(self, key, builder):
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            return surface
+        surface = builder()
+        self._entries[key] = surface
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def checker_texture(self, size, cell, light, dark, row_parity=None):
+        key = ("checker", tuple(size), cell, tuple(light), tuple(dark), row_parity)
+        return self._get(key, lambda: build_checker_texture(size, cell, light, dark, row_parity))
+
+    def stripe_texture(self, size, stripe, light, dark):
+        key = ("stripe", tuple(size), stripe, tuple(light), tuple(dark))
+        return self._get(key, lambda: build_stripe_texture(size, stripe, light, dark))
+
+    def rounded_mask(self, size, radius):
+        return self._get(("mask", tuple(size), radius), lambda: build_rounded_mask(size, radius))
+
+    def scratch(self, size):
+        """可复用的离屏画布，用于需要圆角遮罩的场景。"""
+        return self._get(("scratch", tuple(size)), lambda: _new_scratch(size))
+
+    def blit_checker(self, target, dest, size, cell, light, dark, row_shifts=(0, 0)):
+        """绘制棋盘；row_shifts 分别是偶数行和奇数行的水平位移。"""
+        period = cell * 2
+        even_shift, odd_shift = row_shifts
+        if even_shift == odd_shift:
+            texture = self.checker_texture(size, cell, light, dark)
+            target.blit(texture, dest, scroll_area(even_shift, period, size))
+            return
+        for parity, shift in ((0, even_shift), (1, odd_shift)):
+            texture = self.checker_texture(size, cell, light, dark, row_parity=parity)
+            target.blit(texture, dest, scroll_area(shift, period, size))
+
+    def blit_stripes(self, target, dest, size, stripe, light, dark, shift=0):
+        texture = self.stripe_texture(size, stripe, light, dark)
+        target.blit(texture, dest, scroll_area(shift, stripe * 2, size))
+
+    def drifting_grating(self, size, spatial_frequency, contrast, orientation):
+        key = ("grating", tuple(size), float(spatial_frequency), float(contrast), float(orientation))
+        return self._get(key, lambda: DriftingGrating(size, spatial_frequency, contrast, orientation))
+
+    def blit_grating(self, target, dest, size, spatial_frequency, contrast, orientation, phase=0.0):
+        """绘制正弦光栅；phase 为弧度，漂移时只改变相位。"""
+        grating = self.drifting_grating(size, spatial_frequency, contrast, orientation)
+        target.blit(grating.frame(phase), dest)
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+
+
+# 单步内最多处理的反弹次数；超过后盒子停在最后的接触点，避免夹缝中无限反弹。
+MAX_BOUNCES = 4
+
+
+@dataclass(frozen=True)
+class SweepHit:
+    """一次接触：index 为障碍物序号，time 为本步已走过的比例（0..1），normal 为障碍物表面朝外的法线。"""
+
+    index: int
+    time: float
+    normal: tuple
+    velocity: tuple
+
+
+def _overlap(a_min, a_max, b_min, b_max):
+    return min(a_max, b_max) - max(a_min, b_min)
+
+
+def sweep_box(box, dx, dy, obstacle):
+    """轴对齐盒 box=(x, y, w, h) 位移 (dx, dy) 时首次接触静止 obstacle 的时刻。
+
+    返回 (t, normal)，t 为位移比例 0..1；不接触或正在远离时返回 None。
+    起点已重叠且仍在靠近时按穿透最浅的轴返回 t=0，便于调用方把它推回去。
+    """
+    x, y, w, h = box
+    ox, oy, ow, oh = obstacle
+    overlap_x = _overlap(x, x + w, ox, ox + ow)
+    overlap_y = _overlap(y, y + h, oy, oy + oh)
+    if overlap_x > 0 and overlap_y > 0:
+        if overlap_x <= overlap_y:
+            normal = (1.0 if x + w / 2 >= ox + ow / 2 else -1.0, 0.0)
+        else:
+            normal = (0.0, 1.0 if y + h / 2 >= oy + oh / 2 else -1.0)
+        if dx * normal[0] + dy * normal[1] < 0:
+            return 0.0, normal
+        return None
+
+    entry = []
+    exit_ = []
+    for start, size, delta, o_start, o_size in ((x, w, dx, ox, ow), (y, h, dy, oy, oh)):
+        if delta == 0:
+            if start + size <= o_start or start >= o_start + o_size:
+                return None
+            entry.append(float("-inf"))
+            exit_.append(float("inf"))
+        elif delta > 0:
+            entry.append((o_start - (start + size)) / delta)
+            exit_.append((o_start + o_size - start) / delta)
+        else:
+            entry.append((o_start + o_size - start) / delta)
+            exit_.append((o_start - (start + size)) / delta)
+    t_entry = max(entry)
+    t_exit = min(exit_)
+    # t_entry == t_exit 只是擦过角点，不算碰撞。
+    if t_entry >= t_exit or t_entry < 0 or t_entry > 1:
+        return None
+    if entry[0] >= entry[1]:
+        normal = (-1.0 if dx > 0 else 1.0, 0.0)
+    else:
+        normal = (0.0, -1.0 if dy > 0 else 1.0)
+    return t_entry, normal
+
+
+def reflect(velocity, normal):
+    """沿法线镜面反射速度。"""
+    vx, vy = velocity
+    nx, ny = normal
+    dot = vx * nx + vy * ny
+    return vx - 2 * dot * nx, vy - 2 * dot * ny
+
+
+def move_box(box, velocity, obstacles, scale=1.0, on_hit=None, max_bounces=MAX_BOUNCES):
+    """按 velocity * scale 移动 box，与 obstacles 做连续碰撞，一步内可多次反弹。
+
+    每次接触先把盒子移到接触点，再用 on_hit(hit) 的返回值（None 表示镜面反射）作为新速度，
+    剩余位移按新速度继续扫掠。返回 (x, y, velocity, hits)，x/y 为盒子新的左上角。
+    """
+    x, y, w, h = box
+    velocity = tuple(velocity)
+    obstacles = [tuple(obstacle) for obstacle in obstacles]
+    hits = []
+    elapsed = 0.0
+    remaining = 1.0
+    while remaining > 0:
+        dx = velocity[0] * scale * remaining
+        dy = velocity[1] * scale * remaining
+        first = None
+        for index, obstacle in enumerate(obstacles):
+            result = sweep_box((x, y, w, h), dx, dy, obstacle)
+            if result is not None and (first is None or result[0] < first[0]):
+                first = (result[0], result[1], index)
+        if first is None:
+            x += dx
+            y += dy
+            break
+        t, normal, index = first
+        x += dx * t
+        y += dy * t
+        elapsed += remaining * t
+        remaining *= 1.0 - t
+        hit = SweepHit(index, elapsed, normal, velocity)
+        hits.append(hit)
+        new_velocity = on_hit(hit) if on_hit is not None else None
+        velocity = tuple(new_velocity) if new_velocity is not None else reflect(velocity, normal)
+        if len(hits) > max_bounces:
+            break
+    return x, y, velocity, hits
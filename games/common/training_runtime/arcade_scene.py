@@ -1,13 +1,17 @@
 import math
 import random
-import time
 from dataclasses import dataclass
 from datetime import datetime
 
 import pygame
 
-from core.asset_loader import load_image_if_exists, project_path
+from core import frame_clock
+from core.asset_loader import count_image_allocation, load_image_if_exists, project_path
 from core.base_scene import BaseScene
+from core.quality_governor import QUALITY_HIGH, QUALITY_LOW, QUALITY_MEDIUM
+from core.scale_pyramid import FRUIT_PYRAMID_LEVELS, get_scale_pyramid
+from games.common.gratings import GRATING_ORIENTATIONS
+from games.common.stimulus_textures import StimulusTextureCache
 from .feedback import FeedbackState
 from .result_payload import build_training_result_payload
 from .scoring import ScoreState
@@ -15,6 +19,14 @@ from .session import SessionState
 from .widgets import draw_button, draw_top_stat_text
 
 
+# 弱视刺激背景：amblyopia_stimulus 为棋盘/条纹交替，amblyopia_grating 为漂移正弦光栅。
+STIMULUS_BACKGROUND_STYLES = ("amblyopia_stimulus", "amblyopia_grating")
+GRATING_SPATIAL_FREQUENCY = 1 / 48
+GRATING_DRIFT_HZ = 0.75
+# 各画质档位下渐变背景的色带高度（像素）；训练刺激不随档位变化。
+GRADIENT_BAND_HEIGHT = {QUALITY_HIGH: 1, QUALITY_MEDIUM: 4, QUALITY_LOW: 12}
+
+
 @dataclass(frozen=True)
 class ArcadeGameConfig:
     game_id: str
@@ -213,11 +225,14 @@ class CatchFruitMechanic(BaseArcadeMechanic):
 
         clarity = self._clarity()
         size = self._current_size()
-        halo = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-        pygame.draw.circle(halo, (255, 223, 142, int(150 * (1.0 - clarity))), (halo.get_width() // 2, halo.get_height() // 2), size)
-        screen.blit(halo, halo.get_rect(center=(int(self.fruit_x), int(self.fruit_y))))
-        fruit_surface = load_image_if_exists(self.fruit_assets[self.fruit_asset_name], (size, size))
-        if fruit_surface is not None:
+        if self.scene.quality_at_least(QUALITY_MEDIUM):
+            halo = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+            count_image_allocation()
+            pygame.draw.circle(halo, (255, 223, 142, int(150 * (1.0 - clarity))), (halo.get_width() // 2, halo.get_height() // 2), size)
+            screen.blit(halo, halo.get_rect(center=(int(self.fruit_x), int(self.fruit_y))))
+        pyramid = get_scale_pyramid(self.fruit_assets[self.fruit_asset_name], self.end_size, self.start_size, FRUIT_PYRAMID_LEVELS)
+        if pyramid is not None:
+            fruit_surface = pyramid.surface(size)
             screen.blit(fruit_surface, fruit_surface.get_rect(center=(int(self.fruit_x), int(self.fruit_y))))
         else:
             pygame.draw.circle(screen, (255, 98, 86), (int(self.fruit_x), int(self.fruit_y)), size // 2)
@@ -633,6 +648,7 @@ MECHANICS = {
 
 
 class ArcadeTrainingScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
@@ -653,6 +669,7 @@ class ArcadeTrainingScene(BaseScene):
         self.feedback = FeedbackState()
         self.session_started_at = 0.0
         self.round_started_at = 0.0
+        self._stimulus_textures = StimulusTextureCache()
         self.session_elapsed = 0.0
         self.round_elapsed = 0.0
         self.feedback_text = ""
@@ -888,7 +905,7 @@ class ArcadeTrainingScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             self.session_elapsed = self.session.session_elapsed
@@ -908,45 +925,47 @@ class ArcadeTrainingScene(BaseScene):
     def _draw_gradient_bg(self, screen):
         top = tuple(min(255, c + 88) for c in self.config.theme_color)
         bottom = (226, 237, 248)
-        for y in range(self.height):
+        band = GRADIENT_BAND_HEIGHT.get(self.quality_tier(), 1)
+        for y in range(0, self.height, band):
             t = y / max(1, self.height - 1)
             color = (
                 int(top[0] * (1 - t) + bottom[0] * t),
                 int(top[1] * (1 - t) + bottom[1] * t),
                 int(top[2] * (1 - t) + bottom[2] * t),
             )
-            pygame.draw.line(screen, color, (0, y), (self.width, y))
+            if band == 1:
+                pygame.draw.line(screen, color, (0, y), (self.width, y))
+            else:
+                screen.fill(color, pygame.Rect(0, y, self.width, band))
 
-        self._draw_theme_decorations(screen)
+        if self.quality_at_least(QUALITY_MEDIUM):
+            self._draw_theme_decorations(screen)
 
     def _draw_amblyopia_stimulus_bg(self, screen):
         pattern_rect = self.play_area.inflate(-12, -12)
-        elapsed = time.time() - self.session_started_at if self.session_started_at else time.time()
+        elapsed = frame_clock.now() - self.session_started_at if self.session_started_at else frame_clock.now()
         pattern_index = int(elapsed // 3) % 2
         motion = int((elapsed * 36) % 48)
-        pattern_surface = pygame.Surface(pattern_rect.size, pygame.SRCALPHA)
-        if pattern_index == 0:
-            block = 32
-            for x in range(-block, pattern_rect.width + block, block):
-                for y in range(-block, pattern_rect.height + block, block):
-                    shifted_x = x + (motion if (y // block) % 2 == 0 else -motion)
-                    color = (245, 245, 245) if ((x // block) + (y // block)) % 2 == 0 else (18, 18, 18)
-                    pygame.draw.rect(pattern_surface, color, pygame.Rect(shifted_x, y, block, block))
+        frame = self._stimulus_textures.scratch(pattern_rect.size)
+        if self.config.play_background_style == "amblyopia_grating":
+            orientation = GRATING_ORIENTATIONS[pattern_index]
+            phase = elapsed * GRATING_DRIFT_HZ * 2 * math.pi
+            self._stimulus_textures.blit_grating(
+                frame, (0, 0), pattern_rect.size, GRATING_SPATIAL_FREQUENCY, 0.9, orientation, phase=phase
+            )
+        elif pattern_index == 0:
+            self._stimulus_textures.blit_checker(
+                frame, (0, 0), pattern_rect.size, 32, (245, 245, 245), (18, 18, 18), row_shifts=(motion, -motion)
+            )
         else:
-            stripe = 28
-            for idx, x in enumerate(range(-stripe * 2, pattern_rect.width + stripe * 2, stripe)):
-                shifted = x + motion
-                color = (248, 248, 248) if idx % 2 == 0 else (12, 12, 12)
-                pygame.draw.rect(pattern_surface, color, pygame.Rect(shifted, 0, stripe, pattern_rect.height))
-        mask_surface = pygame.Surface(pattern_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(mask_surface, (255, 255, 255, 255), mask_surface.get_rect(), border_radius=18)
-        pattern_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        screen.blit(pattern_surface, pattern_rect.topleft)
+            self._stimulus_textures.blit_stripes(frame, (0, 0), pattern_rect.size, 28, (248, 248, 248), (12, 12, 12), shift=motion)
+        frame.blit(self._stimulus_textures.rounded_mask(pattern_rect.size, 18), (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        screen.blit(frame, pattern_rect.topleft)
         pygame.draw.rect(screen, (255, 255, 255), pattern_rect, 2, border_radius=18)
 
     def _draw_theme_decorations(self, screen):
         color = self.config.theme_color
-        now = time.time()
+        now = frame_clock.now()
         if self.config.mechanic_type == 'catch_fruit':
             for idx in range(4):
                 x = int(100 + idx * 180 + math.sin(now * 0.8 + idx) * 18)
@@ -1089,7 +1108,7 @@ class ArcadeTrainingScene(BaseScene):
         self._draw_button(screen, self.btn_ok, self.manager.t("arcade.help.ok"), (244, 214, 126), text_color=(110, 88, 46), icon_name="check")
 
     def _draw_play(self, screen):
-        if self.config.play_background_style == "amblyopia_stimulus":
+        if self.config.play_background_style in STIMULUS_BACKGROUND_STYLES:
             pygame.draw.rect(screen, (236, 236, 236), self.play_area, border_radius=18)
             self._draw_amblyopia_stimulus_bg(screen)
         else:
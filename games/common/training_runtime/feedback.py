@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-import time
+
+from core import frame_clock
 
 
 @dataclass
@@ -9,13 +10,13 @@ class FeedbackState:
     until: float = 0.0
 
     def set(self, text: str, color: tuple[int, int, int], duration: float = 1.0, now: float | None = None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         self.text = text
         self.color = color
         self.until = current + duration
 
     def clear_if_expired(self, now: float | None = None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         if self.text and current > self.until:
             self.text = ""
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-import time
+
+from core import frame_clock
 
 
 @dataclass
@@ -16,19 +17,19 @@ class SessionState:
         self.round_elapsed = 0.0
 
     def start_session(self, now: float | None = None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         self.session_started_at = current
         self.round_started_at = current
         self.session_elapsed = 0.0
         self.round_elapsed = 0.0
 
     def start_round(self, now: float | None = None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         self.round_started_at = current
         self.round_elapsed = 0.0
 
     def tick(self, now: float | None = None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         if self.session_started_at > 0:
             self.session_elapsed = current - self.session_started_at
         if self.round_started_at > 0:
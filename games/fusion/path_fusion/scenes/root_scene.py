@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER
 from ..services import PathFusionBoardService, PathFusionScoringService, PathFusionSessionService
@@ -171,7 +171,7 @@ class PathFusionScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 0.8
+        self.feedback_until = frame_clock.now() + 0.8
 
     def _glasses_colors(self):
         if self.filter_direction == FILTER_LR:
@@ -245,7 +245,7 @@ class PathFusionScene(BaseScene):
         pygame.draw.circle(screen, (66, 84, 114), mid, 5)
         for idx, rect in enumerate(self.option_rects):
             self._draw_button(screen, rect, str(idx + 1), (96, 140, 214) if idx == self.selected_path else (124, 140, 168))
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.option_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, board.bottom + 20))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170))
@@ -356,7 +356,7 @@ class PathFusionScene(BaseScene):
                         self.manager.set_scene("menu")
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             if self.session.is_complete():
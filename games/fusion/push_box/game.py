@@ -1,8 +1,11 @@
-from core.game_contract import GameDescriptor
+from core.game_contract import AssetManifest, GameDescriptor, ui_icon_images
 
 from .scenes.root_scene import FusionPushBoxScene
 
 
+_UI_ICONS = ("back_arrow_light", "check_light", "home_light", "power_light", "question_light")
+
+
 def create_scene(manager):
     return FusionPushBoxScene(manager)
 
@@ -14,4 +17,5 @@ def build_descriptor():
         name="Fusion Push Box",
         factory=create_scene,
         name_key="game.fusion.push_box",
+        assets=AssetManifest(images=ui_icon_images(_UI_ICONS)),
     )
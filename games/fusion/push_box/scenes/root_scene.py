@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from games.common.anaglyph import (
@@ -143,7 +143,7 @@ class FusionPushBoxScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _play_sound(self, method_name):
         sound_manager = getattr(self.manager, "sound_manager", None)
@@ -176,7 +176,7 @@ class FusionPushBoxScene(BaseScene):
     def _fail_and_restart_level(self):
         self.scoring.current_streak = 0
         self._set_feedback("fusion_push_box.feedback.deadlock", (236, 132, 132))
-        self.restart_pending_until = time.time() + 1.0
+        self.restart_pending_until = frame_clock.now() + 1.0
         self._play_sound("play_wrong")
 
     def _finish_game(self):
@@ -401,7 +401,7 @@ class FusionPushBoxScene(BaseScene):
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self._go_menu()
-                    elif self.restart_pending_until and time.time() < self.restart_pending_until:
+                    elif self.restart_pending_until and frame_clock.now() < self.restart_pending_until:
                         continue
                     elif event.key == pygame.K_r:
                         self._reset_level()
@@ -434,7 +434,7 @@ class FusionPushBoxScene(BaseScene):
         if self.state != self.STATE_PLAY:
             return
         if self.restart_pending_until:
-            if time.time() >= self.restart_pending_until:
+            if frame_clock.now() >= self.restart_pending_until:
                 self.board_state = self.board_service.create_level(self.level_index)
                 self.restart_pending_until = 0.0
             else:
@@ -488,10 +488,10 @@ class FusionPushBoxScene(BaseScene):
             legend = self.small_font.render(self.manager.t("fusion_push_box.play.legend"), True, (96, 114, 142))
             screen.blit(guide, (self.width // 2 - guide.get_width() // 2, self.board_rect.bottom + 18))
             screen.blit(legend, (self.width // 2 - legend.get_width() // 2, self.board_rect.bottom + 42))
-            if self.feedback_text and time.time() <= self.feedback_until:
+            if self.feedback_text and frame_clock.now() <= self.feedback_until:
                 feedback = self.body_font.render(self.feedback_text, True, self.feedback_color)
                 screen.blit(feedback, (self.width // 2 - feedback.get_width() // 2, self.height - 46))
-            if self.restart_pending_until and time.time() < self.restart_pending_until:
+            if self.restart_pending_until and frame_clock.now() < self.restart_pending_until:
                 self._draw_failure_overlay(screen)
             return
         panel = pygame.Rect(90, 88, self.width - 180, self.height - 170)
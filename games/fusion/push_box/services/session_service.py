@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class FusionPushBoxSessionService:
@@ -11,12 +11,12 @@ class FusionPushBoxSessionService:
         self.session_elapsed = 0.0
 
     def start(self, now=None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         self.session_started_at = current
         self.session_elapsed = 0.0
 
     def tick(self, now=None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         if self.session_started_at > 0:
             self.session_elapsed = current - self.session_started_at
         return self.session_elapsed
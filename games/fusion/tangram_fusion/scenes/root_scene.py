@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from games.common.anaglyph import (
     FILTER_LR,
@@ -180,23 +180,23 @@ class TangramFusionScene(BaseScene):
     def _new_round(self):
         self.round_data = self.board_service.create_round(self._stage_index(), self.filter_direction)
         self.selected_option = 0
-        self.round_started_at = time.time()
+        self.round_started_at = frame_clock.now()
         self.round_index += 1
 
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 0.9
+        self.feedback_until = frame_clock.now() + 0.9
 
     def _answer(self, option_index):
         if self.pending_next_round_at:
             return
-        response_time = time.time() - self.round_started_at
+        response_time = frame_clock.now() - self.round_started_at
         correct = option_index == self.round_data["correct_option"]
         self.scoring.on_answer(correct, response_time, self.round_data["stage_index"])
         if correct:
             self.pending_correct_option = option_index
-            self.pending_next_round_at = time.time() + 0.42
+            self.pending_next_round_at = frame_clock.now() + 0.42
             self._set_feedback("tangram_fusion.feedback.correct", (96, 176, 116))
             self.play_correct_sound()
         else:
@@ -399,7 +399,7 @@ class TangramFusionScene(BaseScene):
             selected = index == self.selected_option
             self._draw_option_piece(screen, rect, self.round_data["options"][index], selected=selected)
         screen.blit(tip, (self.width // 2 - tip.get_width() // 2, self.option_rects[0].bottom + 28))
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.height - 36))
 
@@ -511,7 +511,7 @@ class TangramFusionScene(BaseScene):
         if self.state != self.STATE_PLAY:
             return
         self.session.tick()
-        now = time.time()
+        now = frame_clock.now()
         if self.pending_next_round_at and now >= self.pending_next_round_at:
             self.pending_next_round_at = 0.0
             self.pending_correct_option = None
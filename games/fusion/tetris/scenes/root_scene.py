@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER
 from ..services import FusionTetrisBoardService, FusionTetrisScoringService, FusionTetrisSessionService
@@ -32,7 +32,7 @@ class FusionTetrisScene(BaseScene):
         self.scoring = FusionTetrisScoringService()
         self.session = FusionTetrisSessionService(self._session_seconds())
         self.round_data = {}
-        self.last_drop = time.time()
+        self.last_drop = frame_clock.now()
         self._refresh_fonts()
         self._build_ui()
 
@@ -134,7 +134,7 @@ class FusionTetrisScene(BaseScene):
 
     def _new_round(self):
         self.round_data = self.board_service.create_round()
-        self.last_drop = time.time()
+        self.last_drop = frame_clock.now()
 
     def _cell_size(self):
         return min(self.board_rect.width // self.round_data["cols"], self.board_rect.height // self.round_data["rows"])
@@ -198,7 +198,7 @@ class FusionTetrisScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 0.8
+        self.feedback_until = frame_clock.now() + 0.8
 
     def _lock_piece(self):
         cols = self.round_data["cols"]
@@ -310,7 +310,7 @@ class FusionTetrisScene(BaseScene):
         for dx, dy in self.round_data["piece"]:
             rect = pygame.Rect(origin_x + (self.round_data["piece_x"] + dx) * cell + 2, origin_y + (self.round_data["piece_y"] + dy) * cell + 2, cell - 4, cell - 4)
             pygame.draw.rect(screen, self._piece_color(self.round_data["piece_side"]), rect, border_radius=5)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.option_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.board_rect.bottom + 16))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170))
@@ -403,7 +403,7 @@ class FusionTetrisScene(BaseScene):
                         self.manager.set_scene("menu")
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             if self.session.is_complete():
@@ -1,4 +1,5 @@
-from core.game_contract import GameDescriptor
+from core.asset_loader import project_path
+from core.game_contract import GAME_BUTTON_ICONS, AssetManifest, GameDescriptor, ui_icon_images
 from .scenes.game_scene import EyeFindPatternsScene
 
 
@@ -6,6 +7,12 @@ def create_scene(manager):
     return EyeFindPatternsScene(manager)
 
 
+def _pattern_images():
+    # 只有部分图案有 PNG，其余在运行时绘制。
+    objects = project_path("games", "simultaneous", "eye_find_patterns", "assets", "objects")
+    return tuple((str(path), (140, 140)) for path in sorted(objects.glob("*.png")))
+
+
 def build_descriptor():
     return GameDescriptor(
         game_id="simultaneous.eye_find_patterns",
@@ -13,4 +20,5 @@ def build_descriptor():
         name="Eye Find Patterns",
         factory=create_scene,
         name_key="game.simultaneous.eye_find_patterns",
+        assets=AssetManifest(images=_pattern_images() + ui_icon_images(GAME_BUTTON_ICONS)),
     )
@@ -1,8 +1,8 @@
 import math
-import time
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, GLASSES_BUTTON_COLOR, RED_FILTER
@@ -10,6 +10,7 @@ from ..services import EyeFindPatternService, EyeFindScoringService, EyeFindSess
 
 
 class EyeFindPatternsScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
@@ -23,6 +24,7 @@ class EyeFindPatternsScene(BaseScene):
 
     ATTEMPT_SECONDS = 30
     OVERLAP_TOLERANCE = 8
+    PATTERN_SIZE = 140
 
     def __init__(self, manager):
         super().__init__(manager)
@@ -49,6 +51,7 @@ class EyeFindPatternsScene(BaseScene):
         self.right_pattern_surface = pygame.Surface((1, 1), pygame.SRCALPHA)
         self.pattern_id = "star"
         self.pattern_color = (255, 214, 140, 255)
+        self.pattern_size = self.PATTERN_SIZE
         self.session_elapsed = 0.0
         self.attempt_elapsed = 0.0
         self.feedback_text = ""
@@ -138,35 +141,30 @@ class EyeFindPatternsScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.2
+        self.feedback_until = frame_clock.now() + 1.2
 
     def _new_pattern(self, reset_position):
-        pattern = self.pattern_service.next_pattern(size=140)
+        pattern = self.pattern_service.next_pattern(size=self.PATTERN_SIZE)
         self.pattern_id = pattern["pattern_id"]
         self.pattern_color = pattern["color"]
+        self.pattern_size = pattern["size"]
         self.pattern_surface = pattern["surface"]
         self._refresh_pattern_cache()
         if reset_position:
             self.left_center, self.right_center = self.pattern_service.reset_positions(self.width, self.height)
 
     def _refresh_pattern_cache(self):
-        self.left_pattern_surface = self.pattern_service.apply_filter(
-            self.pattern_surface,
-            self.mode,
-            self.filter_direction,
-            "left",
-            self.MODE_GLASSES,
-            self.FILTER_LR,
+        pattern_key = (self.pattern_id, self.pattern_size, self.pattern_color, self.mode, self.filter_direction)
+        self.left_pattern_surface = self.pattern_service.filtered_pattern(
+            *pattern_key, "left", self.MODE_GLASSES, self.FILTER_LR
         )
-        self.right_pattern_surface = self.pattern_service.apply_filter(
-            self.pattern_surface,
-            self.mode,
-            self.filter_direction,
-            "right",
-            self.MODE_GLASSES,
-            self.FILTER_LR,
+        self.right_pattern_surface = self.pattern_service.filtered_pattern(
+            *pattern_key, "right", self.MODE_GLASSES, self.FILTER_LR
         )
 
+    def prewarm(self):
+        self.pattern_service.prebake(self.PATTERN_SIZE, filter_directions=(self.filter_direction,))
+
     def _is_overlapped(self):
         dx = self.left_center[0] - self.right_center[0]
         dy = self.left_center[1] - self.right_center[1]
@@ -212,7 +210,7 @@ class EyeFindPatternsScene(BaseScene):
                 int(top[2] * (1 - t) + bottom[2] * t),
             )
             pygame.draw.line(screen, color, (0, y), (self.width, y))
-        now = time.time()
+        now = frame_clock.now()
         for i in range(4):
             cx = int((self.width * (0.2 + i * 0.2) + math.sin(now * (0.15 + i * 0.03)) * 28))
             cy = int(90 + i * 34 + math.cos(now * (0.2 + i * 0.05)) * 8)
@@ -350,7 +348,7 @@ class EyeFindPatternsScene(BaseScene):
                         self._exit_to_main_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session_elapsed, self.attempt_elapsed = self.session.tick(now)
             if self.session.is_session_complete():
@@ -443,18 +441,18 @@ class EyeFindPatternsScene(BaseScene):
         )
 
         left_rect = self.left_pattern_surface.get_rect(center=self.left_center)
-        right_rect = self.right_pattern_surface.get_rect(center=self.right_center)
-        blend_bounds = left_rect.union(right_rect).clip(screen.get_rect())
-        if blend_bounds.width > 0 and blend_bounds.height > 0:
-            blend_layer = self.pattern_service.blend_filtered_patterns(
-                blend_bounds.size,
-                self.left_pattern_surface,
-                left_rect.move(-blend_bounds.x, -blend_bounds.y),
-                self.right_pattern_surface,
-                right_rect.move(-blend_bounds.x, -blend_bounds.y),
-                use_offset_crop=False,
-            )
-            screen.blit(blend_layer, blend_bounds.topleft)
+        disparity = (self.right_center[0] - self.left_center[0], self.right_center[1] - self.left_center[1])
+        blend_layer, left_offset = self.pattern_service.composite_patterns(
+            self.pattern_id,
+            self.pattern_size,
+            self.pattern_color,
+            self.mode,
+            self.filter_direction,
+            disparity,
+            self.MODE_GLASSES,
+            self.FILTER_LR,
+        )
+        screen.blit(blend_layer, (left_rect.x - left_offset[0], left_rect.y - left_offset[1]))
 
         guide = self.small_font.render(self.manager.t("eye_find.play.guide"), True, hud_secondary)
         screen.blit(guide, (self.play_area.centerx - guide.get_width() // 2, self.play_area.bottom + 12))
@@ -1,9 +1,19 @@
 import math
 import random
+from collections import OrderedDict
 
 import pygame
-from core.asset_loader import load_image_if_exists, project_path
-from games.common.anaglyph import BLUE_FILTER, GLASSES_BACKGROUND, RED_FILTER, apply_filter, blend_filtered_patterns
+from core.asset_loader import load_image_if_exists, project_path, surface_bytes
+from games.common.anaglyph import (
+    BLUE_FILTER,
+    FILTER_LR,
+    FILTER_RL,
+    GLASSES_BACKGROUND,
+    MODE_GLASSES,
+    RED_FILTER,
+    apply_filter,
+    blend_filtered_patterns,
+)
 
 
 class EyeFindPatternService:
@@ -34,11 +44,30 @@ class EyeFindPatternService:
     GLASSES_BACKGROUND = GLASSES_BACKGROUND
     RED_FILTER = RED_FILTER
     BLUE_FILTER = BLUE_FILTER
+    # 合成结果随左右图相对位移变化，拖动时会不断产生新键，只保留最近的一批；
+    # 大位移下单张合成图可达数 MB，因此同时按条数与像素字节数设上限。
+    MAX_COMPOSITES = 64
+    MAX_COMPOSITE_BYTES = 16 * 1024 * 1024
+
+    def __init__(self):
+        self._patterns = {}
+        self._filtered = {}
+        self._composites = OrderedDict()
+        self._composite_bytes = 0
 
     def _asset_path(self, pattern_id):
         return project_path("games", "simultaneous", "eye_find_patterns", "assets", "objects", f"{pattern_id}.png")
 
     def build_pattern_surface(self, pattern_id, size, color):
+        """按 (图案, 尺寸, 颜色) 缓存栅格化结果；返回的 Surface 为共享只读。"""
+        key = (pattern_id, size, tuple(color))
+        surface = self._patterns.get(key)
+        if surface is None:
+            surface = self._render_pattern_surface(pattern_id, size, color)
+            self._patterns[key] = surface
+        return surface
+
+    def _render_pattern_surface(self, pattern_id, size, color):
         asset_surface = load_image_if_exists(self._asset_path(pattern_id), (size, size))
         if asset_surface is not None:
             return asset_surface
@@ -145,9 +174,62 @@ class EyeFindPatternService:
         return {
             "pattern_id": pattern_id,
             "color": color,
+            "size": size,
             "surface": self.build_pattern_surface(pattern_id, size, color),
         }
 
+    def filtered_pattern(self, pattern_id, size, color, mode, filter_direction, side, mode_glasses=MODE_GLASSES, filter_lr=FILTER_LR):
+        key = (pattern_id, size, tuple(color), mode, filter_direction, side)
+        surface = self._filtered.get(key)
+        if surface is None:
+            base = self.build_pattern_surface(pattern_id, size, color)
+            surface = apply_filter(base, mode, filter_direction, side, mode_glasses, filter_lr)
+            self._filtered[key] = surface
+        return surface
+
+    def composite_patterns(self, pattern_id, size, color, mode, filter_direction, disparity, mode_glasses=MODE_GLASSES, filter_lr=FILTER_LR):
+        """返回左右滤色图的合成结果及左图在其中的左上角；disparity 为右图相对左图的位移。"""
+        disparity = (int(disparity[0]), int(disparity[1]))
+        key = (pattern_id, size, tuple(color), mode, filter_direction, disparity)
+        cached = self._composites.get(key)
+        if cached is not None:
+            self._composites.move_to_end(key)
+            return cached
+        left = self.filtered_pattern(pattern_id, size, color, mode, filter_direction, "left", mode_glasses, filter_lr)
+        right = self.filtered_pattern(pattern_id, size, color, mode, filter_direction, "right", mode_glasses, filter_lr)
+        left_rect = left.get_rect()
+        right_rect = right.get_rect(center=(left_rect.centerx + disparity[0], left_rect.centery + disparity[1]))
+        bounds = left_rect.union(right_rect)
+        surface = self.blend_filtered_patterns(
+            bounds.size,
+            left,
+            left_rect.move(-bounds.x, -bounds.y),
+            right,
+            right_rect.move(-bounds.x, -bounds.y),
+            use_offset_crop=False,
+        )
+        cached = (surface, (left_rect.x - bounds.x, left_rect.y - bounds.y))
+        composite_bytes = surface_bytes(surface)
+        if composite_bytes > self.MAX_COMPOSITE_BYTES:
+            return cached
+        while self._composites and (
+            len(self._composites) >= self.MAX_COMPOSITES
+            or self._composite_bytes + composite_bytes > self.MAX_COMPOSITE_BYTES
+        ):
+            _key, (evicted, _offset) = self._composites.popitem(last=False)
+            self._composite_bytes -= surface_bytes(evicted)
+        self._composites[key] = cached
+        self._composite_bytes += composite_bytes
+        return cached
+
+    def prebake(self, size=140, colors=None, filter_directions=(FILTER_LR, FILTER_RL), mode=MODE_GLASSES):
+        """预先栅格化全部图案与颜色并做好滤色，之后换图只是字典查找。"""
+        for pattern_id in self.PATTERN_IDS:
+            for color in colors or self.PATTERN_COLORS:
+                for filter_direction in filter_directions:
+                    for side in ("left", "right"):
+                        self.filtered_pattern(pattern_id, size, color, mode, filter_direction, side)
+
     def reset_positions(self, width, height):
         left_center = (width // 2 - 140, height // 2 + 10)
         right_center = (
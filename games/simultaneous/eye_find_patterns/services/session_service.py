@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class EyeFindSessionService:
@@ -17,19 +17,19 @@ class EyeFindSessionService:
         self.attempt_elapsed = 0.0
 
     def start(self, now=None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         self.session_started_at = current
         self.attempt_started_at = current
         self.session_elapsed = 0.0
         self.attempt_elapsed = 0.0
 
     def restart_attempt(self, now=None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         self.attempt_started_at = current
         self.attempt_elapsed = 0.0
 
     def tick(self, now=None):
-        current = time.time() if now is None else float(now)
+        current = frame_clock.now() if now is None else float(now)
         if self.session_started_at > 0:
             self.session_elapsed = current - self.session_started_at
         if self.attempt_started_at > 0:
@@ -1,15 +1,17 @@
 import random
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER
+from games.common.swept_collision import move_box
 
 
 class PongScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
@@ -172,7 +174,7 @@ class PongScene(BaseScene):
 
     def _start_match(self):
         self.state = self.STATE_PLAY
-        self.session_started_at = time.time()
+        self.session_started_at = frame_clock.now()
         self.feedback_text = ""
         self._reset_match()
         self._start_serve(1)
@@ -185,13 +187,13 @@ class PongScene(BaseScene):
 
     def _set_feedback(self, key, duration=1.0):
         self.feedback_text = self.manager.t(key)
-        self.feedback_until = time.time() + duration
+        self.feedback_until = frame_clock.now() + duration
         self.feedback_color = (86, 158, 108)
 
     def _set_feedback_text(self, text, color=(86, 158, 108), duration=0.8):
         self.feedback_text = text
         self.feedback_color = color
-        self.feedback_until = time.time() + duration
+        self.feedback_until = frame_clock.now() + duration
 
     def _draw_chip(self, screen, rect, text, bg_color, text_color=(255, 255, 255)):
         pygame.draw.rect(screen, bg_color, rect, border_radius=rect.height // 2)
@@ -221,10 +223,10 @@ class PongScene(BaseScene):
         self.ball_vx = 5.0 * (1 if direction >= 0 else -1)
         self.ball_vy = random.choice((-3.2, -2.4, 2.4, 3.2))
         self.serve_direction = 1 if direction >= 0 else -1
-        self.serve_until = time.time() + 1.0
+        self.serve_until = frame_clock.now() + 1.0
 
     def _serve_countdown(self):
-        remaining = max(0.0, self.serve_until - time.time())
+        remaining = max(0.0, self.serve_until - frame_clock.now())
         return int(remaining) + (1 if remaining > int(remaining) else 0)
 
     def _result_encouragement(self):
@@ -236,7 +238,7 @@ class PongScene(BaseScene):
 
     def _finish_match(self):
         self.state = self.STATE_RESULT
-        duration = int(max(0, time.time() - self.session_started_at))
+        duration = int(max(0, frame_clock.now() - self.session_started_at))
         self.final_stats = {
             "duration": duration,
             "player_score": self.player_score,
@@ -280,6 +282,56 @@ class PongScene(BaseScene):
     def _ai_paddle_rect(self):
         return pygame.Rect(self.play_rect.right - 42, int(self.ai_y), 16, 96)
 
+    def _wall_rects(self):
+        play = self.play_rect
+        return (
+            pygame.Rect(play.left - play.width, play.top - play.height, play.width * 3, play.height),
+            pygame.Rect(play.left - play.width, play.bottom, play.width * 3, play.height),
+        )
+
+    def _move_ball(self, frame_scale, now):
+        """扫掠移动球：帧时间较长时也不会穿过球拍，一步内可先撞墙再撞拍。"""
+        obstacles = self._wall_rects() + (self._player_paddle_rect(), self._ai_paddle_rect())
+
+        def on_hit(hit):
+            # 与原先一致：只有朝球拍飞来的球才算击球，其余接触按镜面反弹。
+            if hit.index == 2 and hit.velocity[0] < 0:
+                return self._return_ball(hit, 1, now)
+            if hit.index == 3 and hit.velocity[0] > 0:
+                return self._return_ball(hit, -1, now)
+            return None
+
+        x, y, velocity, _hits = move_box(
+            (self.ball_x - 10, self.ball_y - 10, 20, 20),
+            (self.ball_vx, self.ball_vy),
+            obstacles,
+            scale=frame_scale,
+            on_hit=on_hit,
+        )
+        self.ball_x, self.ball_y = x + 10, y + 10
+        self.ball_vx, self.ball_vy = velocity
+
+    def _return_ball(self, hit, direction, now):
+        """球拍击球：加速并随机偏转；返回新的速度。"""
+        vx, vy = hit.velocity
+        vx = direction * min(8.6, abs(vx) * 1.06)
+        vy = max(-6.2, min(6.2, vy + random.choice((-0.5, 0.5))))
+        if hit.normal[1] * vy < 0:
+            vy = -vy
+        self.current_rally += 1
+        self.best_rally = max(self.best_rally, self.current_rally)
+        self.hit_flash_until = now + 0.18
+        if direction > 0:
+            self.player_hits += 1
+            self.hit_flash_side = "left"
+            if self.current_rally > 0 and self.current_rally % 4 == 0:
+                self._set_feedback("pong.feedback.combo", 0.8)
+            elif self.current_rally >= 2:
+                self._set_feedback_text(self.manager.t("pong.feedback.rally", n=self.current_rally), duration=0.55)
+        else:
+            self.hit_flash_side = "right"
+        return vx, vy
+
     def _ball_rect(self):
         return pygame.Rect(int(self.ball_x - 10), int(self.ball_y - 10), 20, 20)
 
@@ -376,7 +428,7 @@ class PongScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             elapsed = now - self.session_started_at
             if elapsed >= self._session_seconds() or self.player_score >= 11 or self.ai_score >= 11:
@@ -389,29 +441,7 @@ class PongScene(BaseScene):
             self.ai_y = max(self.play_rect.top, min(self.play_rect.bottom - 96, self.ai_y))
             if self.serve_until > now:
                 return
-            self.ball_x += self.ball_vx * frame_scale
-            self.ball_y += self.ball_vy * frame_scale
-            if self.ball_y <= self.play_rect.top + 10 or self.ball_y >= self.play_rect.bottom - 10:
-                self.ball_vy *= -1
-            if self._ball_rect().colliderect(self._player_paddle_rect()) and self.ball_vx < 0:
-                self.ball_vx = min(8.6, abs(self.ball_vx) * 1.06)
-                self.ball_vy = max(-6.2, min(6.2, self.ball_vy + random.choice((-0.5, 0.5))))
-                self.current_rally += 1
-                self.player_hits += 1
-                self.best_rally = max(self.best_rally, self.current_rally)
-                self.hit_flash_side = "left"
-                self.hit_flash_until = now + 0.18
-                if self.current_rally > 0 and self.current_rally % 4 == 0:
-                    self._set_feedback("pong.feedback.combo", 0.8)
-                elif self.current_rally >= 2:
-                    self._set_feedback_text(self.manager.t("pong.feedback.rally", n=self.current_rally), duration=0.55)
-            if self._ball_rect().colliderect(self._ai_paddle_rect()) and self.ball_vx > 0:
-                self.ball_vx = -min(8.6, abs(self.ball_vx) * 1.06)
-                self.ball_vy = max(-6.2, min(6.2, self.ball_vy + random.choice((-0.5, 0.5))))
-                self.current_rally += 1
-                self.best_rally = max(self.best_rally, self.current_rally)
-                self.hit_flash_side = "right"
-                self.hit_flash_until = now + 0.18
+            self._move_ball(frame_scale, now)
             if self.ball_x < self.play_rect.left:
                 self.ai_score += 1
                 self.current_rally = 0
@@ -515,7 +545,7 @@ class PongScene(BaseScene):
         self._draw_button(screen, self.filter_start, self.manager.t("pong.filter.start"), (92, 152, 114), icon_name="check")
 
     def _draw_play(self, screen):
-        time_left = max(0, int(self._session_seconds() - (time.time() - self.session_started_at)))
+        time_left = max(0, int(self._session_seconds() - (frame_clock.now() - self.session_started_at)))
         mode_key = "pong.mode.glasses"
         self.draw_session_hud(
             screen,
@@ -527,7 +557,7 @@ class PongScene(BaseScene):
             left_lines=(
                 self.manager.t("pong.rally", n=self.current_rally),
                 self.manager.t("pong.best_rally", n=self.best_rally),
-            ) + ((self.manager.t("pong.serve", n=self._serve_countdown()),) if self.serve_until > time.time() else ()),
+            ) + ((self.manager.t("pong.serve", n=self._serve_countdown()),) if self.serve_until > frame_clock.now() else ()),
             right_lines=(),
             play_area=self.play_rect,
             timer_color=(56, 68, 94),
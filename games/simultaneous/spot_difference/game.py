@@ -1,4 +1,4 @@
-from core.game_contract import GameDescriptor
+from core.game_contract import GAME_BUTTON_ICONS, AssetManifest, GameDescriptor, ui_icon_images
 from .scenes.root_scene import SpotDifferenceScene
 
 
@@ -13,4 +13,5 @@ def build_descriptor():
         name="Binocular Spot Difference",
         factory=create_scene,
         name_key="game.simultaneous.spot_difference",
+        assets=AssetManifest(images=ui_icon_images(GAME_BUTTON_ICONS)),
     )
@@ -1,10 +1,11 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
+from core.quality_governor import QUALITY_MEDIUM
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER, apply_filter
 from ..services import SpotDifferenceBoardService, SpotDifferenceScoringService, SpotDifferenceSessionService
 
@@ -173,7 +174,7 @@ class SpotDifferenceScene(BaseScene):
         self.pending_indices = set()
         self.round_data = self.board_service.create_round(self.left_panel, self._target_difference_count())
         self.selected_index = min(self.selected_index, len(self.round_data["right"]) - 1)
-        self.round_started_at = time.time()
+        self.round_started_at = frame_clock.now()
 
     def _target_difference_count(self):
         progress = 0.0
@@ -249,7 +250,7 @@ class SpotDifferenceScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.1
+        self.feedback_until = frame_clock.now() + 1.1
 
     def _go_category(self):
         self.manager.set_scene("category")
@@ -269,14 +270,14 @@ class SpotDifferenceScene(BaseScene):
             self.pending_indices.clear()
             return
         if pending.issubset(set(self.round_data["diff_indices"])):
-            reaction_time = time.time() - self.round_started_at if self.round_started_at > 0 else None
+            reaction_time = frame_clock.now() - self.round_started_at if self.round_started_at > 0 else None
             for _ in pending:
                 self.scoring.on_success(reaction_time)
             self.found_indices.update(pending)
             self.pending_indices.clear()
             self.play_correct_sound()
             if len(self.found_indices) >= len(self.round_data["diff_indices"]):
-                self.round_flash_until = time.time() + 0.55
+                self.round_flash_until = frame_clock.now() + 0.55
                 self._set_feedback("spot_difference.feedback.round_clear", (90, 226, 132))
             else:
                 self._set_feedback("spot_difference.feedback.success", (90, 226, 132))
@@ -458,7 +459,7 @@ class SpotDifferenceScene(BaseScene):
         tip = self.small_font.render(self.manager.t("spot_difference.play.guide"), True, (54, 70, 96))
         screen.blit(tip, (self.width // 2 - tip.get_width() // 2, 98))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170), icon_name="back_arrow")
-        if self.round_flash_until > time.time():
+        if self.round_flash_until > frame_clock.now() and self.quality_at_least(QUALITY_MEDIUM):
             flash = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             flash.fill((140, 218, 150, 18))
             screen.blit(flash, (0, 0))
@@ -593,7 +594,7 @@ class SpotDifferenceScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             if self.round_flash_until and now > self.round_flash_until:
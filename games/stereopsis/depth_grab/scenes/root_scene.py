@@ -1,9 +1,9 @@
 import math
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER, SUBTRACTIVE_BACKGROUND, apply_filter, blend_filtered_patterns
@@ -142,7 +142,7 @@ class DepthGrabScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.1
+        self.feedback_until = frame_clock.now() + 1.1
 
     def _play_sound(self, method_name):
         sound_manager = getattr(self.manager, "sound_manager", None)
@@ -152,7 +152,8 @@ class DepthGrabScene(BaseScene):
 
     def _new_round(self):
         self.round_data = self.board_service.create_round(self.play_area, self._stage_index())
-        self.session.restart_round(time.time())
+        self.session.restart_round(frame_clock.now())
+        self.mark_stimulus_onset("round")
 
     def _start_game(self):
         self.show_filter_picker = False
@@ -423,7 +424,7 @@ class DepthGrabScene(BaseScene):
         guide = self.small_font.render(self.manager.t("depth_grab.play.guide"), True, hud_secondary)
         screen.blit(guide, (self.play_area.centerx - guide.get_width() // 2, max(98, self.play_area.y - 28)))
         self._draw_targets(screen)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.play_area.bottom + 18))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (62, 52, 128) if is_glasses_mode else (86, 116, 170), icon_name="back_arrow")
@@ -536,7 +537,7 @@ class DepthGrabScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             self._depth_phase += 0.05 * self.frame_scale()
@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class DepthGrabSessionService:
@@ -13,18 +13,18 @@ class DepthGrabSessionService:
         self.round_elapsed = 0.0
 
     def start(self):
-        now = time.time()
+        now = frame_clock.now()
         self.session_started_at = now
         self.round_started_at = now
         self.session_elapsed = 0.0
         self.round_elapsed = 0.0
 
     def restart_round(self, now=None):
-        self.round_started_at = now if now is not None else time.time()
+        self.round_started_at = now if now is not None else frame_clock.now()
         self.round_elapsed = 0.0
 
     def tick(self, now=None):
-        now = now if now is not None else time.time()
+        now = now if now is not None else frame_clock.now()
         if self.session_started_at:
             self.session_elapsed = now - self.session_started_at
         if self.round_started_at:
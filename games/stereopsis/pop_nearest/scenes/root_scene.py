@@ -1,10 +1,12 @@
 import math
-import time
+from collections import OrderedDict
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
+from core.quality_governor import QUALITY_MEDIUM
 from games.common.anaglyph import (
     BLUE_FILTER,
     FILTER_LR,
@@ -20,6 +22,7 @@ from ..services import PopNearestBoardService, PopNearestScoringService, PopNear
 
 
 class PopNearestScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
@@ -28,6 +31,7 @@ class PopNearestScene(BaseScene):
     SHOT_DURATION = 0.22
     IMPACT_DURATION = 0.32
     HOME_VERTICAL_UNIT = 14
+    MAX_STEREO_COMPOSITES = 32
 
     def __init__(self, manager):
         super().__init__(manager)
@@ -48,6 +52,8 @@ class PopNearestScene(BaseScene):
         self.pending_finish = False
         self.last_group_started_at = 0.0
         self._balloon_surface_cache = {}
+        # (半径, 视差, 模式, 滤镜方向) -> 左右眼合成后的图层，逐帧只需一次 blit。
+        self._stereo_composites = OrderedDict()
         self.board_service = PopNearestBoardService()
         self.scoring = PopNearestScoringService()
         self.session = PopNearestSessionService(session_seconds=self._session_seconds(), group_seconds=12)
@@ -160,7 +166,7 @@ class PopNearestScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _set_bow_x(self, x):
         self.bow_x = max(self.play_area.left + 30, min(self.play_area.right - 30, int(x)))
@@ -192,7 +198,7 @@ class PopNearestScene(BaseScene):
             "balloon_index": balloon_index,
             "correct": shot_correct,
             "miss": miss,
-            "started_at": time.time(),
+            "started_at": frame_clock.now(),
             "duration": self.SHOT_DURATION,
             "shot_x": self.bow_x,
             "target_y": self.play_area.top + 18 if miss else display["center"][1],
@@ -200,7 +206,7 @@ class PopNearestScene(BaseScene):
 
     def _new_group(self):
         self.group_data = self.board_service.create_group(self.play_area, self.session.completed_groups + 1)
-        self.last_group_started_at = time.time()
+        self.last_group_started_at = frame_clock.now()
         self.active_shot = None
         self.impact_effect = None
         self.pending_group_advance = False
@@ -284,8 +290,13 @@ class PopNearestScene(BaseScene):
         self._balloon_surface_cache[radius] = surface
         return surface
 
-    def _draw_stereo_surface(self, screen, surface, center, disparity):
-        rect = surface.get_rect(center=center)
+    def _stereo_composite(self, radius, disparity):
+        key = (radius, disparity, self.mode, self.filter_direction)
+        cached = self._stereo_composites.get(key)
+        if cached is not None:
+            self._stereo_composites.move_to_end(key)
+            return cached
+        surface = self._balloon_surface(radius)
         left = apply_filter(surface, self.mode, self.filter_direction, "left")
         right = apply_filter(surface, self.mode, self.filter_direction, "right")
         crop_x = max(2, disparity // 3)
@@ -300,14 +311,23 @@ class PopNearestScene(BaseScene):
             crop_border=(0, 0),
             use_offset_crop=False,
         )
-        screen.blit(blended, (rect.x - half - crop_x, rect.y - crop_x))
+        cached = (blended, (-half - crop_x, -crop_x))
+        self._stereo_composites[key] = cached
+        while len(self._stereo_composites) > self.MAX_STEREO_COMPOSITES:
+            self._stereo_composites.popitem(last=False)
+        return cached
+
+    def _draw_stereo_balloon(self, screen, radius, center, disparity):
+        blended, offset = self._stereo_composite(radius, disparity)
+        rect = self._balloon_surface(radius).get_rect(center=center)
+        screen.blit(blended, (rect.x + offset[0], rect.y + offset[1]))
 
     def _draw_balloons(self, screen):
         for balloon in self.group_data.get("balloons", []):
             if balloon.get("popped"):
                 continue
             display = self._balloon_display_state(balloon)
-            self._draw_stereo_surface(screen, self._balloon_surface(display["radius"]), display["center"], display["disparity"])
+            self._draw_stereo_balloon(screen, display["radius"], display["center"], display["disparity"])
 
     def _draw_bow(self, screen):
         x, y = self.bow_x, self.bow_y
@@ -337,7 +357,7 @@ class PopNearestScene(BaseScene):
             self.impact_effect = {
                 "correct": False,
                 "center": (shot["shot_x"], shot["target_y"]),
-                "started_at": time.time(),
+                "started_at": frame_clock.now(),
                 "duration": self.IMPACT_DURATION,
             }
             self.scoring.on_wrong()
@@ -350,12 +370,12 @@ class PopNearestScene(BaseScene):
         self.impact_effect = {
             "correct": shot["correct"],
             "center": center,
-            "started_at": time.time(),
+            "started_at": frame_clock.now(),
             "duration": self.IMPACT_DURATION,
         }
         if shot["correct"]:
             balloon["popped"] = True
-            self.scoring.on_correct(max(0.0, time.time() - self.last_group_started_at))
+            self.scoring.on_correct(max(0.0, frame_clock.now() - self.last_group_started_at))
             self._play_sound("play_correct")
             self._set_feedback("pop_nearest.feedback.correct", (255, 246, 164))
             if self.board_service.current_target_rank(self.group_data["balloons"]) is None:
@@ -375,7 +395,7 @@ class PopNearestScene(BaseScene):
         shot = self.active_shot
         if shot is None:
             return
-        progress = min(1.0, max(0.0, (time.time() - shot["started_at"]) / shot["duration"]))
+        progress = min(1.0, max(0.0, (frame_clock.now() - shot["started_at"]) / shot["duration"]))
         start_x, start_y = self._shot_start()
         x = shot["shot_x"]
         # Make the arrow leave the bow decisively, then settle before impact.
@@ -409,7 +429,7 @@ class PopNearestScene(BaseScene):
         effect = self.impact_effect
         if not effect:
             return
-        progress = (time.time() - effect["started_at"]) / effect["duration"]
+        progress = (frame_clock.now() - effect["started_at"]) / effect["duration"]
         if progress >= 1.0:
             return
         cx, cy = effect["center"]
@@ -441,7 +461,7 @@ class PopNearestScene(BaseScene):
         effect = self.impact_effect
         if not effect:
             return
-        progress = (time.time() - effect["started_at"]) / effect["duration"]
+        progress = (frame_clock.now() - effect["started_at"]) / effect["duration"]
         if progress < 1.0:
             return
         self.impact_effect = None
@@ -453,10 +473,9 @@ class PopNearestScene(BaseScene):
             self._new_group()
 
     def _draw_feedback(self, screen):
-        if not (self.feedback_text and time.time() <= self.feedback_until):
+        if not (self.feedback_text and frame_clock.now() <= self.feedback_until):
             return
         feedback = self.body_font.render(self.feedback_text, True, self.feedback_color)
-        shadow = self.body_font.render(self.feedback_text, True, (28, 18, 34))
         padding_x = 16
         padding_y = 8
         box = pygame.Rect(
@@ -465,11 +484,14 @@ class PopNearestScene(BaseScene):
             feedback.get_width() + padding_x * 2,
             feedback.get_height() + padding_y * 2,
         )
-        bubble = pygame.Surface(box.size, pygame.SRCALPHA)
-        pygame.draw.rect(bubble, (22, 18, 34, 88), bubble.get_rect(), border_radius=12)
-        screen.blit(bubble, box.topleft)
+        if self.quality_at_least(QUALITY_MEDIUM):
+            # 半透明底和文字投影只是装饰，降档时只保留描边。
+            bubble = pygame.Surface(box.size, pygame.SRCALPHA)
+            pygame.draw.rect(bubble, (22, 18, 34, 88), bubble.get_rect(), border_radius=12)
+            screen.blit(bubble, box.topleft)
+            shadow = self.body_font.render(self.feedback_text, True, (28, 18, 34))
+            screen.blit(shadow, (self.width // 2 - feedback.get_width() // 2 + 2, self.feedback_anchor_y + 2))
         pygame.draw.rect(screen, (244, 239, 228), box, 1, border_radius=12)
-        screen.blit(shadow, (self.width // 2 - feedback.get_width() // 2 + 2, self.feedback_anchor_y + 2))
         screen.blit(feedback, (self.width // 2 - feedback.get_width() // 2, self.feedback_anchor_y))
 
     def _draw_play(self, screen):
@@ -631,7 +653,7 @@ class PopNearestScene(BaseScene):
             return
         self.session.tick()
         self._update_impact_state()
-        if self.active_shot and (time.time() - self.active_shot["started_at"]) >= self.active_shot["duration"]:
+        if self.active_shot and (frame_clock.now() - self.active_shot["started_at"]) >= self.active_shot["duration"]:
             self._resolve_shot()
             if self.state != self.STATE_PLAY:
                 return
@@ -13,7 +13,8 @@ class PopNearestBoardService:
     HORIZONTAL_JITTER = 0.035
 
     def __init__(self, seed=None):
-        self._random = random.Random(seed)
+        # 未指定种子时从全局 random 派生，录像回放固定全局种子后布局也能复现。
+        self._random = random.Random(seed if seed is not None else random.getrandbits(64))
 
     def create_group(self, play_area, group_index):
         order = self._build_horizontal_order()
@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class PopNearestSessionService:
@@ -15,7 +15,7 @@ class PopNearestSessionService:
         self.completed_groups = 0
 
     def start(self):
-        now = time.time()
+        now = frame_clock.now()
         self.session_started_at = now
         self.group_started_at = now
         self.session_elapsed = 0.0
@@ -23,13 +23,13 @@ class PopNearestSessionService:
         self.completed_groups = 0
 
     def next_group(self, now=None):
-        now = now if now is not None else time.time()
+        now = now if now is not None else frame_clock.now()
         self.completed_groups += 1
         self.group_started_at = now
         self.group_elapsed = 0.0
 
     def tick(self, now=None):
-        now = now if now is not None else time.time()
+        now = now if now is not None else frame_clock.now()
         if self.session_started_at:
             self.session_elapsed = now - self.session_started_at
         if self.group_started_at:
@@ -1,8 +1,9 @@
-import time
+from collections import OrderedDict
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from games.common.anaglyph import (
     FILTER_LR,
@@ -31,6 +32,11 @@ class RingFlightScene(BaseScene):
     PLANE_DISPARITY = 18
     FLY_THROUGH_DURATION = 0.32
     HOME_VERTICAL_UNIT = 14
+    FIXED_TIMESTEP = True
+    HANDLES_MOUSEMOTION = True
+    # 圆环半径按 2 像素量化，逐渐放大的圆环可以复用已合成的图层。
+    RING_RADIUS_STEP = 2
+    MAX_RING_COMPOSITES = 96
 
     def __init__(self, manager):
         super().__init__(manager)
@@ -53,6 +59,7 @@ class RingFlightScene(BaseScene):
         self.plane_x = 0.0
         self.fly_through = None
         self._visual_phase = 0.0
+        self._ring_composites = OrderedDict()
         self._refresh_fonts()
         self._build_ui()
 
@@ -174,7 +181,7 @@ class RingFlightScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 0.8
+        self.feedback_until = frame_clock.now() + 0.8
 
     def _new_wave(self):
         self.wave = self.board_service.create_wave(self.play_area)
@@ -202,7 +209,7 @@ class RingFlightScene(BaseScene):
     def _plane_rect(self):
         rect = pygame.Rect(int(self.plane_x) - 30, self.play_area.bottom - 52, 60, 34)
         if self.fly_through:
-            progress = min(1.0, max(0.0, (time.time() - self.fly_through["started_at"]) / self.fly_through["duration"]))
+            progress = min(1.0, max(0.0, (frame_clock.now() - self.fly_through["started_at"]) / self.fly_through["duration"]))
             base_y = self.play_area.bottom - 35
             if self.fly_through["result"] == "success":
                 end_y = self._selection_y() - 10
@@ -215,6 +222,16 @@ class RingFlightScene(BaseScene):
     def _display_rings(self):
         return [self.board_service.ring_display_state(self.play_area, ring) for ring in self.wave.get("rings", [])]
 
+    def _interpolated_display_rings(self):
+        """绘制用：在上一模拟步与当前步之间插值圆环进度，判定仍使用 _display_rings。"""
+        alpha = self.interpolation_alpha()
+        displays = []
+        for ring in self.wave.get("rings", []):
+            previous = ring.get("prev_progress", ring["progress"])
+            progress = previous + (ring["progress"] - previous) * alpha
+            displays.append(self.board_service.ring_display_state(self.play_area, dict(ring, progress=progress)))
+        return displays
+
     def _plane_target_index(self):
         displays = self._display_rings()
         if not displays:
@@ -273,7 +290,7 @@ class RingFlightScene(BaseScene):
         target_x = decision["display"]["center"][0] if decision["display"] else self._plane_rect().centerx
         self.awaiting_selection = False
         self.fly_through = {
-            "started_at": time.time(),
+            "started_at": frame_clock.now(),
             "duration": self.FLY_THROUGH_DURATION,
             "result": decision["result"],
             "target_x": int(target_x),
@@ -403,18 +420,27 @@ class RingFlightScene(BaseScene):
         center = (int(display["center"][0] - self.play_area.x + horizontal_shift), int(display["center"][1] - self.play_area.y))
         pygame.draw.circle(surface, (255, 255, 255, 255), center, display["radius"], display["thickness"])
 
-    def _draw_ring_sprite(self, screen, display):
-        half_shift = max(4, display["disparity"] // 2)
-        padding = display["thickness"] + half_shift + 8
-        size = display["radius"] * 2 + padding * 2
+    def _quantized_radius(self, radius):
+        step = self.RING_RADIUS_STEP
+        return max(step, int(radius / step + 0.5) * step)
+
+    def _ring_composite(self, radius, thickness, disparity):
+        key = (radius, thickness, disparity, self.mode, self.filter_direction)
+        cached = self._ring_composites.get(key)
+        if cached is not None:
+            self._ring_composites.move_to_end(key)
+            return cached
+        half_shift = max(4, disparity // 2)
+        padding = thickness + half_shift + 8
+        size = radius * 2 + padding * 2
         local_left = pygame.Surface((size, size), pygame.SRCALPHA)
         local_right = pygame.Surface((size, size), pygame.SRCALPHA)
         center = (size // 2, size // 2)
-        pygame.draw.circle(local_left, (255, 255, 255, 255), (center[0] - half_shift, center[1]), display["radius"], display["thickness"])
-        pygame.draw.circle(local_right, (255, 255, 255, 255), (center[0] + half_shift, center[1]), display["radius"], display["thickness"])
+        pygame.draw.circle(local_left, (255, 255, 255, 255), (center[0] - half_shift, center[1]), radius, thickness)
+        pygame.draw.circle(local_right, (255, 255, 255, 255), (center[0] + half_shift, center[1]), radius, thickness)
         left_filtered = apply_filter(local_left, self.mode, self.filter_direction, "left")
         right_filtered = apply_filter(local_right, self.mode, self.filter_direction, "right")
-        ring_layer = blend_filtered_patterns(
+        cached = blend_filtered_patterns(
             (size, size),
             left_filtered,
             (0, 0),
@@ -423,11 +449,20 @@ class RingFlightScene(BaseScene):
             crop_border=half_shift,
             use_offset_crop=False,
         )
+        self._ring_composites[key] = cached
+        while len(self._ring_composites) > self.MAX_RING_COMPOSITES:
+            self._ring_composites.popitem(last=False)
+        return cached
+
+    def _draw_ring_sprite(self, screen, display):
+        radius = self._quantized_radius(display["radius"])
+        ring_layer = self._ring_composite(radius, display["thickness"], display["disparity"])
+        size = ring_layer.get_width()
         screen.blit(ring_layer, (display["center"][0] - size // 2, display["center"][1] - size // 2))
 
     def _draw_glasses_play_content(self, screen):
         pygame.draw.rect(screen, (255, 255, 255), self.play_area, 2, border_radius=20)
-        for display in self._display_rings():
+        for display in self._interpolated_display_rings():
             self._draw_ring_sprite(screen, display)
         plane_shift = max(4, self.PLANE_DISPARITY // 2)
         plane_world = self._plane_rect().inflate(30, 28)
@@ -475,7 +510,7 @@ class RingFlightScene(BaseScene):
         screen.blit(score, (score_x, 18))
         screen.blit(streak, (streak_x, 48))
         self._draw_glasses_play_content(screen)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.option_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.play_area.bottom + 20))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170))
@@ -588,7 +623,7 @@ class RingFlightScene(BaseScene):
                         self.manager.set_scene("menu")
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             self._visual_phase += 0.05 * self.frame_scale()
@@ -601,6 +636,8 @@ class RingFlightScene(BaseScene):
                     self.fly_through = None
                     self._finalize_wave_result(result)
                 return
+            for ring in self.wave.get("rings", []):
+                ring["prev_progress"] = ring["progress"]
             if not self.awaiting_selection:
                 step = self.RING_SPEED * self.frame_scale()
                 for ring in self.wave.get("rings", []):
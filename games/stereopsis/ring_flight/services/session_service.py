@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class RingFlightSessionService:
@@ -11,11 +11,11 @@ class RingFlightSessionService:
         self.session_elapsed = 0.0
 
     def start(self):
-        self.session_started_at = time.time()
+        self.session_started_at = frame_clock.now()
         self.session_elapsed = 0.0
 
     def tick(self, now=None):
-        now = now if now is not None else time.time()
+        now = now if now is not None else frame_clock.now()
         if self.session_started_at:
             self.session_elapsed = now - self.session_started_at
         return self.session_elapsed
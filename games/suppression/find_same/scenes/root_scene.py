@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER, apply_filter
 from ..services import FindSameBoardService, FindSameScoringService, FindSameSessionService
@@ -99,7 +99,7 @@ class FindSameScene(BaseScene):
         self.pending_indices = set()
         self.round_data = self.board_service.create_round(self.left_panel, self._match_count())
         self.selected_index = min(self.selected_index, len(self.round_data["right"]) - 1)
-        self.round_started_at = time.time()
+        self.round_started_at = frame_clock.now()
 
     def _start_game(self):
         self.state = self.STATE_PLAY
@@ -142,7 +142,7 @@ class FindSameScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _draw_button(self, screen, rect, text, color, text_color=(255, 255, 255), selected=False):
         hovered = rect.collidepoint(pygame.mouse.get_pos())
@@ -370,12 +370,12 @@ class FindSameScene(BaseScene):
 
     def _confirm_selection(self):
         if self.pending_indices == set(self.round_data["match_indices"]):
-            reaction_time = time.time() - self.round_started_at if self.round_started_at > 0 else None
+            reaction_time = frame_clock.now() - self.round_started_at if self.round_started_at > 0 else None
             for _ in self.pending_indices:
                 self.scoring.on_success(reaction_time)
             self.play_correct_sound()
             self.pending_indices.clear()
-            self.round_flash_until = time.time() + 0.2
+            self.round_flash_until = frame_clock.now() + 0.2
             self._set_feedback("find_same.feedback.round_clear", (90, 226, 132))
             self._new_round()
         else:
@@ -397,7 +397,7 @@ class FindSameScene(BaseScene):
             self._set_feedback("find_same.feedback.select", (96, 156, 214))
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             if self.session.is_complete():
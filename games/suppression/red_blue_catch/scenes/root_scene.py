@@ -1,14 +1,15 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER
 from ..services import RedBlueCatchBoardService, RedBlueCatchScoringService, RedBlueCatchSessionService
 
 
 class RedBlueCatchScene(BaseScene):
+    HANDLES_MOUSEMOTION = True
     STATE_HOME = "home"
     STATE_HELP = "help"
     STATE_PLAY = "play"
@@ -138,7 +139,7 @@ class RedBlueCatchScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 0.9
+        self.feedback_until = frame_clock.now() + 0.9
 
     def _draw_background(self, screen):
         top = (230, 243, 255)
@@ -292,7 +293,7 @@ class RedBlueCatchScene(BaseScene):
             pygame.draw.rect(screen, (88, 116, 170), basket, border_radius=10)
             for ball in self.round_data["balls"]:
                 pygame.draw.circle(screen, self._ball_rgb(ball["color"]), (int(ball["x"]), int(ball["y"])), 18)
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             fb = self.option_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(fb, (self.width // 2 - fb.get_width() // 2, self.play_area.bottom + 20))
         self._draw_button(screen, self.btn_home, self.manager.t("common.back"), (86, 116, 170))
@@ -389,7 +390,7 @@ class RedBlueCatchScene(BaseScene):
                         self.manager.set_scene("menu")
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             frame_scale = self.frame_scale()
             self.session.tick(now)
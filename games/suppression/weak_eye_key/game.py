@@ -1,4 +1,4 @@
-from core.game_contract import GameDescriptor
+from core.game_contract import GAME_BUTTON_ICONS, AssetManifest, GameDescriptor, ui_icon_images
 
 from .scenes.root_scene import WeakEyeKeyScene
 
@@ -14,4 +14,5 @@ def build_descriptor():
         name="Weak Eye Key Hunt",
         factory=create_scene,
         name_key="game.suppression.weak_eye_key",
+        assets=AssetManifest(images=ui_icon_images(GAME_BUTTON_ICONS)),
     )
@@ -1,8 +1,8 @@
-import time
 from datetime import datetime
 
 import pygame
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from games.common.anaglyph import BLUE_FILTER, FILTER_LR, FILTER_RL, GLASSES_BACKGROUND, GLASSES_BUTTON_COLOR, MODE_GLASSES, RED_FILTER, apply_filter
@@ -165,7 +165,7 @@ class WeakEyeKeyScene(BaseScene):
     def _set_feedback(self, key, color):
         self.feedback_text = self.manager.t(key)
         self.feedback_color = color
-        self.feedback_until = time.time() + 1.0
+        self.feedback_until = frame_clock.now() + 1.0
 
     def _play_sound(self, method_name):
         sound_manager = getattr(self.manager, "sound_manager", None)
@@ -185,7 +185,7 @@ class WeakEyeKeyScene(BaseScene):
         stage_index = self._stage_index()
         self.round_data = self.board_service.create_round(self.board_rect, self.clue_rect, stage_index)
         self.selected_index = None
-        self.session.restart_round(time.time())
+        self.session.restart_round(frame_clock.now())
 
     def _start_game(self):
         self.state = self.STATE_PLAY
@@ -444,7 +444,7 @@ class WeakEyeKeyScene(BaseScene):
         self._draw_clue(screen)
         self._draw_board(screen)
 
-        if self.feedback_text and time.time() <= self.feedback_until:
+        if self.feedback_text and frame_clock.now() <= self.feedback_until:
             feedback = self.body_font.render(self.feedback_text, True, self.feedback_color)
             screen.blit(feedback, (self.width // 2 - feedback.get_width() // 2, self.play_area.bottom - 12))
 
@@ -566,7 +566,7 @@ class WeakEyeKeyScene(BaseScene):
                         self._go_menu()
 
     def update(self):
-        now = time.time()
+        now = frame_clock.now()
         if self.state == self.STATE_PLAY:
             self.session.tick(now)
             if self.session.is_complete():
@@ -1,4 +1,4 @@
-import time
+from core import frame_clock
 
 
 class WeakEyeKeySessionService:
@@ -14,18 +14,18 @@ class WeakEyeKeySessionService:
         self.round_elapsed = 0.0
 
     def start(self):
-        now = time.time()
+        now = frame_clock.now()
         self.session_started_at = now
         self.round_started_at = now
         self.session_elapsed = 0.0
         self.round_elapsed = 0.0
 
     def restart_round(self, now=None):
-        self.round_started_at = time.time() if now is None else now
+        self.round_started_at = frame_clock.now() if now is None else now
         self.round_elapsed = 0.0
 
     def tick(self, now=None):
-        now = time.time() if now is None else now
+        now = frame_clock.now() if now is None else now
         if self.session_started_at <= 0.0:
             return 0.0, 0.0
         self.session_elapsed = max(0.0, now - self.session_started_at)
@@ -1,7 +1,17 @@
+import argparse
+import os
+import random
+
 import pygame
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, MIN_SCREEN_WIDTH, MIN_SCREEN_HEIGHT, FPS, TITLE
 from core.app_paths import get_resource_path
+from core.asset_loader import load_image_if_exists
 from core.display_bootstrap import clamp_window_size, detect_desktop_size, fit_startup_window_size, set_compatible_display_mode
+from core import frame_clock
+from core.diagnostics import DiagnosticsService
+from core.font_pool import schedule_font_warmup, warm_pending_fonts
+from core.input_events import EventBatch, EventFilter
+from core.input_replay import SPEED_FAST, SPEED_REALTIME, InputRecorder, InputReplay, new_seed
 from core.scene_manager import SceneManager
 from core.startup_health import run_startup_health_check, safe_init_audio
 from scenes.menu_scene import MenuScene
@@ -12,15 +22,41 @@ from scenes.game_host_scene import GameHostScene
 from scenes.system_settings_scene import SystemSettingsScene
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--record", metavar="PATH", help="Record input, frame timing and the random seed to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="Replay a recording made with --record")
+    parser.add_argument(
+        "--replay-speed",
+        choices=(SPEED_REALTIME, SPEED_FAST),
+        default=SPEED_REALTIME,
+        help="Pace the replay like the recording, or run it as fast as possible",
+    )
+    parser.add_argument("--headless", action="store_true", help="Use the SDL dummy video and audio drivers")
+    parser.add_argument("--cprofile", action="store_true", help="Run cProfile from startup; F5 stops and dumps it")
+    parser.add_argument("--latency", action="store_true", help="Measure input-to-present and stimulus-to-present latency")
+    parser.add_argument("--tracemalloc", action="store_true", help="Trace allocations from startup; F6 dumps a snapshot")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    replay = InputReplay(args.replay) if args.replay else None
+    random_seed = replay.seed if replay is not None else new_seed()
+    if replay is not None or args.record:
+        # 游戏都使用全局 random，录制与回放从同一个种子出发。
+        random.seed(random_seed)
+
     pygame.init()
 
     icon_path = get_resource_path("assets", "branding", "shiya_app_icon_256.png")
     try:
-        window_icon = pygame.image.load(icon_path)
-        if pygame.display.get_surface() is not None:
-            window_icon = window_icon.convert_alpha()
-        pygame.display.set_icon(window_icon)
+        window_icon = load_image_if_exists(icon_path)
+        if window_icon is not None:
+            pygame.display.set_icon(window_icon)
     except (pygame.error, FileNotFoundError):
         pass
 
@@ -35,6 +71,13 @@ def main():
     if not audio_ok:
         manager.settings["sound_enabled"] = False
         manager.apply_sound_preference()
+    if replay is not None:
+        # 回放使用录制时的设置、窗口尺寸与帧时钟时间轴。
+        manager.settings.update(replay.settings)
+        manager.settings["fullscreen"] = False
+        manager.apply_language_preference()
+        manager.clock = frame_clock.install(frame_clock.FrameClock(source=replay.clock_source, epoch=replay.epoch))
+        windowed_size = replay.screen_size
 
     pygame.display.set_caption(TITLE)
     screen, is_fullscreen, mode_error = set_compatible_display_mode(
@@ -49,29 +92,81 @@ def main():
         manager.settings["fullscreen"] = is_fullscreen
         manager.save_user_preferences()
     manager.set_screen_size(*screen.get_size())
+    schedule_font_warmup(manager.settings.get("language", "en-US"))
 
-    manager.register("menu", MenuScene(manager))
-    manager.register("license", LicenseScene(manager))
-    manager.register("onboarding", OnboardingScene(manager))
-    manager.register("category", CategoryScene(manager))
-    manager.register("game_host", GameHostScene(manager))
-    manager.register("system_settings", SystemSettingsScene(manager))
+    manager.register("menu", factory=MenuScene)
+    manager.register("license", factory=LicenseScene)
+    manager.register("onboarding", factory=OnboardingScene)
+    manager.register("category", factory=CategoryScene)
+    manager.register("game_host", factory=GameHostScene)
+    manager.register("system_settings", factory=SystemSettingsScene)
 
     has_license, _message = manager.license_manager.check_local_license()
     initial_scene = manager.decide_initial_scene(
         has_license=has_license,
         onboarding_completed=bool(manager.settings.get("onboarding_completed", False)),
     )
+    if replay is not None:
+        initial_scene = replay.initial_scene
+    if replay is not None or args.record:
+        # 先采样一次帧时钟，让初始场景构造时读到的时间也落在录像时间轴上。
+        manager.clock.tick()
     manager.set_scene(initial_scene)
+    # F5 开始/停止 cProfile，F6 开启 tracemalloc 或写出内存快照，结果写到用户数据目录。
+    diagnostics = DiagnosticsService(manager)
+    latency = manager.latency
+    latency.enabled = args.latency
+    if args.tracemalloc:
+        diagnostics.start_tracing()
+    if args.cprofile:
+        diagnostics.start_cpu_profile()
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(
+            args.record,
+            seed=random_seed,
+            epoch=manager.clock.now(),
+            screen_size=screen.get_size(),
+            initial_scene=initial_scene,
+            settings=manager.settings,
+        )
+
+    event_filter = EventFilter()
+    if replay is None:
+        event_filter.install()
 
     running = True
     while running:
-        manager.update_frame_timing(clock.tick(FPS))
+        if replay is not None:
+            if replay.finished:
+                break
+            dt_ms, recorded_events = replay.next_frame()
+            events = EventBatch(recorded_events)
+            # 本机事件只用来响应关闭窗口，其余以录像为准。
+            if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                break
+            if args.replay_speed == SPEED_REALTIME:
+                clock.tick(1000.0 / max(1, dt_ms))
+        else:
+            dt_ms = clock.tick(FPS)
+            event_filter.update(manager.get_scene())
+            # 高回报率鼠标一帧可产生上百个 MOUSEMOTION，合并后场景的事件处理与回报率无关。
+            events = EventBatch(pygame.event.get())
+        latency.begin_frame(events, manager.active_game_id or type(manager.get_scene()).__name__)
+        manager.update_frame_timing(dt_ms)
+        if recorder is not None:
+            recorder.record(dt_ms, manager.clock.now(), events)
+        profiler = manager.profiler
+        profiler.start_frame()
 
-        events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.WINDOWMINIMIZED and replay is None:
+                manager.clock.pause()
+            elif event.type == pygame.WINDOWRESTORED and replay is None:
+                # 回放的时间轴已包含录制时的暂停，不再重复处理。
+                manager.clock.resume()
             elif event.type == pygame.VIDEORESIZE:
                 if not manager.settings.get("fullscreen", False):
                     desktop_size = detect_desktop_size(pygame.display)
@@ -84,7 +179,15 @@ def main():
                     manager.set_screen_size(*screen.get_size())
                     manager.get_scene().on_resize(*screen.get_size())
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and (event.mod & pygame.KMOD_ALT)):
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_F5:
+                    capture_path = diagnostics.toggle_cpu_profile()
+                    print(f"[diagnostics] {capture_path or 'cProfile started'}")
+                elif event.key == pygame.K_F6:
+                    capture_path = diagnostics.capture_memory()
+                    print(f"[diagnostics] {capture_path or 'tracemalloc started'}")
+                elif event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and (event.mod & pygame.KMOD_ALT)):
                     is_fullscreen = manager.settings.get("fullscreen", False)
                     if is_fullscreen:
                         desktop_size = detect_desktop_size(pygame.display)
@@ -121,11 +224,33 @@ def main():
                         manager.get_scene().on_resize(*screen.get_size())
 
         manager.get_scene().handle_events(events)
-        manager.get_scene().update()
+        latency.mark_handled()
+        profiler.lap("events")
+        manager.update_scene()
+        profiler.lap("update")
         manager.get_scene().draw(screen)
+        profiler.lap("draw")
+        profiler.draw(screen, manager.quality.name)
 
         pygame.display.flip()
+        latency.mark_presented()
+        profiler.lap("flip")
+        profiler.end_frame(manager.get_scene())
+        warm_pending_fonts()
+        manager.asset_prefetcher.step()
 
+    for line in latency.summary_lines():
+        print(f"[latency] {line}")
+    for capture_path in diagnostics.shutdown():
+        print(f"[diagnostics] {capture_path}")
+    if recorder is not None:
+        recorder.close()
+        print(f"[record] {recorder.frames} frames written to {recorder.path}")
+    if replay is not None:
+        print(f"[replay] {replay.index}/{len(replay)} frames replayed")
+        if manager.profiler.frames:
+            print(f"[replay] {manager.profiler.summary_line()}")
+    manager.asset_prefetcher.shutdown()
     pygame.quit()
 
 
@@ -25,6 +25,15 @@ if exist "__pycache__" rmdir /s /q "__pycache__"
 if exist "build_smoke2" rmdir /s /q "build_smoke2"
 if exist "dist_smoke2" rmdir /s /q "dist_smoke2"
 
+echo Building asset pack...
+python tools\build_asset_pack.py
+
+if %errorlevel% neq 0 (
+    echo Error: Asset pack build failed
+    pause
+    exit /b 1
+)
+
 echo Running PyInstaller...
 python -m PyInstaller visionseed.spec --distpath dist --workpath build --noconfirm
 
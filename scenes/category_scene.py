@@ -47,6 +47,7 @@ class CategoryScene(BaseScene):
             self._items.append({"rect": rect, "index": index, "game_id": game.game_id, "name": game_name, "summary1": summary1, "summary2": summary2})
         self.back_rect = pygame.Rect(self.width - 126, 24, 92, 40)
         self.focused_index = max(0, min(self.focused_index, len(self._items)))
+        self._schedule_prewarm()
 
     def _resolve_label(self, item):
         if not item:
@@ -67,6 +68,22 @@ class CategoryScene(BaseScene):
     def _all_items(self):
         return self._items + [{"rect": self.back_rect, "kind": "back"}]
 
+    def _schedule_prewarm(self):
+        game_ids = [item["game_id"] for item in self._items]
+        if self.focused_index < len(game_ids):
+            game_ids.insert(0, game_ids[self.focused_index])
+        prefetcher = getattr(self.manager, "asset_prefetcher", None)
+        if prefetcher is not None:
+            prefetcher.prefetch(game_ids)
+        prewarmer = getattr(self.manager, "scene_prewarmer", None)
+        if prewarmer is not None:
+            prewarmer.schedule(game_ids)
+
+    def update(self):
+        prewarmer = getattr(self.manager, "scene_prewarmer", None)
+        if prewarmer is not None:
+            prewarmer.step()
+
     def _enter_game(self, game_id: str):
         self.manager.active_game_id = game_id
         self.manager.set_scene("game_host")
@@ -81,9 +98,11 @@ class CategoryScene(BaseScene):
                 all_items = self._all_items()
                 if event.key in (pygame.K_UP, pygame.K_LEFT) and all_items:
                     self.focused_index = (self.focused_index - 1) % len(all_items)
+                    self._schedule_prewarm()
                     continue
                 if event.key in (pygame.K_DOWN, pygame.K_RIGHT) and all_items:
                     self.focused_index = (self.focused_index + 1) % len(all_items)
+                    self._schedule_prewarm()
                     continue
                 if event.key in (pygame.K_RETURN, pygame.K_SPACE) and all_items:
                     target = all_items[self.focused_index]
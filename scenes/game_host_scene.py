@@ -1,17 +1,64 @@
+from collections import OrderedDict
+
 from core.base_scene import BaseScene
+from core.scene_prewarmer import estimate_surface_bytes
 
 
 class GameHostScene(BaseScene):
+    MAX_POOLED_SCENES = 4
+    MAX_POOLED_BYTES = 96 * 1024 * 1024
+
     def __init__(self, manager):
         super().__init__(manager)
         self.active_game_scene = None
         self.active_game_id = None
+        # 最近玩过且提供 reset() 的游戏场景，按 game_id 做 LRU；重新进入时 reset() 后复用。
+        self._scene_pool = OrderedDict()
+        self._scene_pool_bytes = {}
+
+    @property
+    def pooled_bytes(self):
+        return sum(self._scene_pool_bytes.values())
+
+    def _release_active_scene(self):
+        if self.active_game_scene is not None and self.active_game_id:
+            self._pool_scene(self.active_game_id, self.active_game_scene)
+        self.active_game_scene = None
+        self.active_game_id = None
+
+    def _pool_scene(self, game_id, scene):
+        self._scene_pool.pop(game_id, None)
+        self._scene_pool_bytes.pop(game_id, None)
+        # 没有 reset() 的场景无法回到初始状态，复用会带回上一局的画面，下次重新构建。
+        if not callable(getattr(scene, "reset", None)):
+            return
+        scene_bytes = estimate_surface_bytes(scene, skip=(self.manager,))
+        if self.MAX_POOLED_SCENES <= 0 or scene_bytes > self.MAX_POOLED_BYTES:
+            return
+        while self._scene_pool and (
+            len(self._scene_pool) >= self.MAX_POOLED_SCENES
+            or self.pooled_bytes + scene_bytes > self.MAX_POOLED_BYTES
+        ):
+            evicted_id, _scene = self._scene_pool.popitem(last=False)
+            self._scene_pool_bytes.pop(evicted_id, None)
+        self._scene_pool[game_id] = scene
+        self._scene_pool_bytes[game_id] = scene_bytes
+
+    def _take_pooled_scene(self, game_id):
+        self._scene_pool_bytes.pop(game_id, None)
+        return self._scene_pool.pop(game_id, None)
+
+    def _build_game_scene(self, game_id, game):
+        prewarmer = getattr(self.manager, "scene_prewarmer", None)
+        scene = None
+        if prewarmer is not None:
+            scene = prewarmer.take(game_id)
+        return scene if scene is not None else game.factory(self.manager)
 
     def _mount_if_needed(self):
         game_id = self.manager.active_game_id
         if not game_id:
-            self.active_game_scene = None
-            self.active_game_id = None
+            self._release_active_scene()
             return False
 
         if self.active_game_scene is not None and game_id == self.active_game_id:
@@ -19,11 +66,21 @@ class GameHostScene(BaseScene):
 
         game = self.manager.game_registry.get_game(game_id)
         if not game:
-            self.active_game_scene = None
-            self.active_game_id = None
+            self._release_active_scene()
             return False
 
-        self.active_game_scene = game.factory(self.manager)
+        # 先取出目标场景，避免放回当前场景时把它挤出池子。
+        scene = self._take_pooled_scene(game_id)
+        self._release_active_scene()
+        prefetcher = getattr(self.manager, "asset_prefetcher", None)
+        if prefetcher is not None:
+            prefetcher.flush(game_id)
+        if scene is None:
+            scene = self._build_game_scene(game_id, game)
+        prewarmer = getattr(self.manager, "scene_prewarmer", None)
+        if prewarmer is not None:
+            prewarmer.cancel()
+        self.active_game_scene = scene
         self.active_game_id = game_id
         if self.manager.screen_size and hasattr(self.active_game_scene, "on_resize"):
             self.active_game_scene.on_resize(*self.manager.screen_size)
@@ -56,7 +113,11 @@ class GameHostScene(BaseScene):
     def update(self):
         self._mount_if_needed()
         if self.active_game_scene:
-            self.active_game_scene.update()
+            update_scene = getattr(self.manager, "update_scene", None)
+            if callable(update_scene):
+                update_scene(self.active_game_scene)
+            else:
+                self.active_game_scene.update()
 
     def draw(self, screen):
         self._mount_if_needed()
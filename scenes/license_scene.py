@@ -1,6 +1,6 @@
 import pygame
-import time
 
+from core import frame_clock
 from core.asset_loader import load_image_if_exists, project_path
 from core.base_scene import BaseScene
 from core.ui_theme import PlatformTheme, draw_card, draw_platform_background
@@ -139,7 +139,7 @@ class LicenseScene(BaseScene):
                     if event.key == pygame.K_BACKSPACE:
                         self._delete_one_char()
                         self._backspace_held = True
-                        self._backspace_next_repeat_at = time.time() + 0.35
+                        self._backspace_next_repeat_at = frame_clock.now() + 0.35
                         continue
                     if event.unicode and event.unicode.isprintable():
                         if len(self.input_text) < 1024:
@@ -330,7 +330,7 @@ class LicenseScene(BaseScene):
 
     def update(self):
         if self.input_active and self._backspace_held:
-            now = time.time()
+            now = frame_clock.now()
             if now >= self._backspace_next_repeat_at:
                 self._delete_one_char()
                 self._backspace_next_repeat_at = now + 0.045
@@ -85,6 +85,7 @@ class MenuScene(BaseScene):
         self.recommendations = build_daily_plan(self.manager, limit=3)
         self.recommendation_hint = build_daily_suggestion(self.manager, self.recommendations)
         self.recent_completions = build_recent_completions(self.manager, limit=2)
+        self._schedule_prewarm()
         self._recent_row_y = self.recommend_panel.bottom - 38
         self._disclaimer_y = max(self.recommend_panel.bottom + 10, self.height - 68)
         self._hint_y = self._disclaimer_y + 34
@@ -95,6 +96,11 @@ class MenuScene(BaseScene):
     def _all_items(self):
         return self._items + self.control_items
 
+    def _schedule_prewarm(self):
+        prewarmer = getattr(self.manager, "scene_prewarmer", None)
+        if prewarmer is not None:
+            prewarmer.schedule([item.get("game_id") for item in self.recommendations])
+
     def _safe_categories(self):
         categories = []
         registry = getattr(self.manager, "game_registry", None)
@@ -181,6 +187,11 @@ class MenuScene(BaseScene):
                         self._handle_item(item)
                         break
 
+    def update(self):
+        prewarmer = getattr(self.manager, "scene_prewarmer", None)
+        if prewarmer is not None:
+            prewarmer.step()
+
     def _draw_recommendations(self, screen):
         draw_card(screen, self.recommend_panel, alt=True, radius=18)
         target_icon = load_image_if_exists(project_path("assets", "ui", "target_dark.png"), (18, 18))
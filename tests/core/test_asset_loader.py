@@ -1,11 +1,15 @@
 import os
+import tempfile
 import unittest
+from pathlib import Path
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
-from core.asset_loader import load_image_if_exists, project_path
+from core import asset_loader
+from core.asset_loader import PROJECT_ROOT, load_image_if_exists, project_path
+from core.asset_pack import build_asset_pack, open_asset_pack
 
 
 class AssetLoaderTests(unittest.TestCase):
@@ -30,6 +34,97 @@ class AssetLoaderTests(unittest.TestCase):
         self.assertIsNotNone(image)
         self.assertEqual(image.get_size(), (72, 72))
 
+    def test_shared_surface_is_returned_without_copy(self):
+        path = project_path("games", "accommodation", "catch_fruit", "assets", "objects", "apple.png")
+        asset_loader.clear_image_cache()
+        allocations = asset_loader.image_allocations()
+        shared = load_image_if_exists(path, (48, 48))
+        self.assertIs(load_image_if_exists(path, (48, 48)), shared)
+        self.assertEqual(asset_loader.image_allocations(), allocations + 1)
+        private = load_image_if_exists(path, (48, 48), mutable=True)
+        self.assertEqual(asset_loader.image_allocations(), allocations + 2)
+        self.assertIsNot(private, shared)
+        private.fill((0, 0, 0, 0))
+        self.assertNotEqual(shared.get_at((24, 24)), private.get_at((24, 24)))
+
+    def test_image_cache_evicts_least_recently_used_by_bytes(self):
+        objects = ("games", "accommodation", "catch_fruit", "assets", "objects")
+        apple = project_path(*objects, "apple.png")
+        orange = project_path(*objects, "orange.png")
+        original_limit = asset_loader.IMAGE_CACHE_MAX_BYTES
+        asset_loader.clear_image_cache()
+        try:
+            asset_loader.IMAGE_CACHE_MAX_BYTES = 2 * 32 * 32 * 4
+            load_image_if_exists(apple, (32, 32))
+            load_image_if_exists(orange, (32, 32))
+            load_image_if_exists(apple, (32, 32))
+            self.assertEqual(asset_loader.image_cache_bytes(), 2 * 32 * 32 * 4)
+            load_image_if_exists(apple, (16, 16))
+            keys = [key for key in asset_loader._IMAGE_CACHE]
+            self.assertNotIn((os.path.abspath(orange), (32, 32)), keys)
+            self.assertIn((os.path.abspath(apple), (32, 32)), keys)
+            self.assertLessEqual(asset_loader.image_cache_bytes(), asset_loader.IMAGE_CACHE_MAX_BYTES)
+        finally:
+            asset_loader.IMAGE_CACHE_MAX_BYTES = original_limit
+            asset_loader.clear_image_cache()
+
+
+
+class AssetPackTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        cls._tmpdir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        cls.pack_path = Path(cls._tmpdir.name) / "asset_pack.bin"
+        cls.packed_count = build_asset_pack(PROJECT_ROOT, cls.pack_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_asset_pack(None)
+        cls._tmpdir.cleanup()
+        pygame.quit()
+
+    def tearDown(self):
+        asset_loader.set_asset_pack(None)
+
+    def test_pack_pixels_match_png_decode(self):
+        pack = open_asset_pack(self.pack_path)
+        self.assertIsNotNone(pack)
+        self.assertEqual(len(pack), self.packed_count)
+        key = "games/accommodation/catch_fruit/assets/objects/apple.png"
+        self.assertIn(key, pack)
+        self.assertIn("assets/ui/gear_dark.png", pack)
+        self.assertNotIn("assets/branding/shiya_app_icon_1024.png", pack)
+
+        packed = pack.load_surface(key)
+        decoded = pygame.image.load(str(project_path(*key.split("/"))))
+        self.assertEqual(packed.get_size(), decoded.get_size())
+        self.assertEqual(pygame.image.tobytes(packed, "RGBA"), pygame.image.tobytes(decoded, "RGBA"))
+
+    def test_loader_reads_from_pack_before_filesystem(self):
+        pack = open_asset_pack(self.pack_path)
+        asset_loader.set_asset_pack(pack)
+        key = "games/accommodation/catch_fruit/assets/objects/banana.png"
+        calls = []
+        original = pack.load_surface
+
+        def tracking_load(name):
+            calls.append(name)
+            return original(name)
+
+        pack.load_surface = tracking_load
+        image = load_image_if_exists(project_path(*key.split("/")), (40, 40))
+        self.assertIsNotNone(image)
+        self.assertEqual(image.get_size(), (40, 40))
+        self.assertIn(key, calls)
+        self.assertTrue(all(name.startswith("games/accommodation/catch_fruit/assets/objects/") for name in calls))
+
+    def test_invalid_pack_falls_back_to_files(self):
+        broken = Path(self._tmpdir.name) / "broken.bin"
+        broken.write_bytes(b"not a pack")
+        self.assertIsNone(open_asset_pack(broken))
+        self.assertIsNone(open_asset_pack(Path(self._tmpdir.name) / "missing.bin"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,140 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core import asset_loader
+from core.asset_loader import PROJECT_ROOT, load_image_if_exists, project_path
+from core.asset_prefetcher import AssetPrefetcher
+from core.game_contract import AssetManifest, GameDescriptor, ui_icon_images
+from core.game_registry import GameRegistry
+
+
+OBJECTS = ("games", "accommodation", "catch_fruit", "assets", "objects")
+
+
+class _Registry:
+    def __init__(self, descriptors):
+        self._games = {descriptor.game_id: descriptor for descriptor in descriptors}
+
+    def get_game(self, game_id):
+        return self._games.get(game_id)
+
+
+class _Manager:
+    def __init__(self, descriptors):
+        self.game_registry = _Registry(descriptors)
+
+
+def _descriptor(game_id, images):
+    return GameDescriptor(
+        game_id=game_id,
+        category="accommodation",
+        name=game_id,
+        factory=lambda manager: None,
+        assets=AssetManifest(images=images),
+    )
+
+
+class AssetPrefetcherTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.clear_image_cache()
+        pygame.quit()
+
+    def setUp(self):
+        asset_loader.clear_image_cache()
+
+    def test_flush_makes_manifest_images_warm(self):
+        apple = str(project_path(*OBJECTS, "apple.png"))
+        basket = str(project_path(*OBJECTS, "basket.png"))
+        manager = _Manager([_descriptor("accommodation.fruit", ((apple, (64, 64)), (basket, (148, 52))))])
+        prefetcher = AssetPrefetcher(manager)
+        try:
+            prefetcher.prefetch(["accommodation.fruit", "accommodation.unknown"])
+            prefetcher.flush("accommodation.fruit")
+            self.assertEqual(prefetcher.pending(), 0)
+            self.assertTrue(asset_loader.is_image_cached(apple, (64, 64)))
+            warm = load_image_if_exists(apple, (64, 64))
+            self.assertEqual(warm.get_size(), (64, 64))
+            self.assertEqual(load_image_if_exists(basket, (148, 52)).get_size(), (148, 52))
+        finally:
+            prefetcher.shutdown()
+
+    def test_decoding_runs_off_the_main_thread(self):
+        threads = []
+        original = asset_loader.decode_image_pixels
+
+        def tracking_decode(path, size=None):
+            threads.append(threading.current_thread())
+            return original(path, size)
+
+        apple = str(project_path(*OBJECTS, "apple.png"))
+        manager = _Manager([_descriptor("accommodation.fruit", ((apple, (32, 32)),))])
+        prefetcher = AssetPrefetcher(manager)
+        asset_loader.decode_image_pixels = tracking_decode
+        try:
+            prefetcher.prefetch(["accommodation.fruit"])
+            deadline = time.time() + 5.0
+            while prefetcher.pending() and time.time() < deadline:
+                prefetcher.step(budget_seconds=1.0)
+                time.sleep(0.01)
+        finally:
+            asset_loader.decode_image_pixels = original
+            prefetcher.shutdown()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertTrue(asset_loader.is_image_cached(apple, (32, 32)))
+
+    def test_cached_images_and_repeat_requests_are_skipped(self):
+        apple = str(project_path(*OBJECTS, "apple.png"))
+        load_image_if_exists(apple, (40, 40))
+        manager = _Manager([_descriptor("accommodation.fruit", ((apple, (40, 40)),))])
+        prefetcher = AssetPrefetcher(manager)
+        try:
+            prefetcher.prefetch(["accommodation.fruit", "accommodation.fruit"])
+            self.assertEqual(prefetcher.pending(), 0)
+        finally:
+            prefetcher.shutdown()
+
+    def test_builtin_manifests_point_at_existing_files(self):
+        registry = GameRegistry()
+        for category in registry.get_categories():
+            for game in registry.get_games_by_category(category["id"]):
+                for path, _size in game.assets.images:
+                    self.assertTrue(project_path(path).is_file(), path)
+        # 不绘制图标按钮的游戏不预取任何图标。
+        self.assertEqual(len(registry.get_game("fusion.tetris").assets), 0)
+        pong_images = [path for path, _size in registry.get_game("simultaneous.pong").assets.images]
+        self.assertNotIn("assets/ui/home_light.png", pong_images)
+        self.assertEqual(ui_icon_images(("check_light",)), (("assets/ui/check_light.png", (18, 18)),))
+
+    def test_relative_manifest_paths_warm_the_loader_cache(self):
+        manager = _Manager([_descriptor("accommodation.icons", ui_icon_images(("check_light",)))])
+        prefetcher = AssetPrefetcher(manager)
+        try:
+            prefetcher.prefetch(["accommodation.icons"])
+            prefetcher.flush("accommodation.icons")
+        finally:
+            prefetcher.shutdown()
+        self.assertTrue(asset_loader.is_image_cached(project_path("assets", "ui", "check_light.png"), (18, 18)))
+
+    def test_game_contract_does_not_import_the_loader(self):
+        code = "import sys, core.game_contract; print('core.asset_loader' in sys.modules, 'pygame' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "False False")
+
+
+if __name__ == "__main__":
+    unittest.main()
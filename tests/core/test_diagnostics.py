@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.diagnostics import CAPTURE_FORMAT, DiagnosticsService, surface_owners
+from core.frame_clock import FrameClock
+from core.frame_profiler import FrameProfiler
+from core.quality_governor import QualityGovernor
+
+
+class _Game:
+    def __init__(self):
+        self.background = pygame.Surface((100, 50), pygame.SRCALPHA)
+        self.sprites = [pygame.Surface((10, 10), pygame.SRCALPHA) for _ in range(3)]
+        self.score = 3
+
+
+class _Host:
+    def __init__(self, manager):
+        self.manager = manager
+        self.active_game_scene = _Game()
+
+
+class _Manager:
+    def __init__(self):
+        self.scene = _Host(self)
+        self.screen_size = (900, 700)
+        self.clock = FrameClock()
+        self.quality = QualityGovernor(1.0 / 60)
+        self.profiler = FrameProfiler()
+
+    def get_scene(self):
+        return self.scene
+
+
+class DiagnosticsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.service = DiagnosticsService(_Manager(), output_dir=self._tmpdir.name)
+
+    def tearDown(self):
+        self.service.shutdown()
+        self._tmpdir.cleanup()
+
+    def _load(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_surface_owners_lists_scene_attributes_by_size(self):
+        owners = {item["owner"]: item for item in surface_owners(self.service.manager)}
+        self.assertEqual(owners["_Game.background"]["bytes"], 100 * 50 * 4)
+        self.assertEqual(owners["_Game.sprites"]["entries"], 3)
+        self.assertNotIn("_Game.score", owners)
+        self.assertIn("asset_loader._IMAGE_CACHE", owners)
+
+    def test_cpu_capture_writes_stats_and_manifest(self):
+        self.assertIsNone(self.service.toggle_cpu_profile())
+        self.assertTrue(self.service.cpu_profiling)
+        sum(index * index for index in range(1000))
+        manifest_path = self.service.toggle_cpu_profile()
+        self.assertFalse(self.service.cpu_profiling)
+        manifest = self._load(manifest_path)
+        self.assertEqual((manifest["format"], manifest["kind"]), (CAPTURE_FORMAT, "cpu"))
+        self.assertEqual(manifest["scene"], "_Host > _Game")
+        self.assertTrue(os.path.exists(os.path.join(self._tmpdir.name, manifest["files"]["pstats"])))
+        self.assertTrue(manifest["top_functions"])
+
+    def test_memory_capture_starts_tracing_then_diffs_snapshots(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc already enabled by the runner")
+        self.assertIsNone(self.service.capture_memory())
+        self.assertTrue(self.service.tracing)
+        first_path = self.service.capture_memory()
+        self.assertNotIn("growth", self._load(first_path))
+        second = self._load(self.service.capture_memory())
+        self.assertEqual(second["compared_to"] + ".json", os.path.basename(first_path))
+        self.assertIn("growth", second)
+        self.assertTrue(os.path.exists(os.path.join(self._tmpdir.name, second["files"]["snapshot"])))
+        paths = self.service.shutdown()
+        self.assertEqual(len(paths), 1)
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == "__main__":
+    unittest.main()
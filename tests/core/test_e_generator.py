@@ -0,0 +1,61 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config import E_SIZE_LEVELS
+from core.e_generator import E_DIRECTIONS, EGenerator, render_optotype
+
+
+class EGeneratorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def test_level_sizes_render_crisp_strokes(self):
+        surface = render_optotype(5, "RIGHT")
+        alpha = pygame.surfarray.array_alpha(surface)
+        self.assertEqual(surface.get_size(), (5, 5))
+        self.assertEqual(sorted(set(alpha.flatten().tolist())), [0, 255])
+        self.assertEqual(alpha[:, 0].tolist(), [255] * 5)
+        self.assertEqual(alpha[0, :].tolist(), [255] * 5)
+        self.assertEqual(alpha[1:, 1].tolist(), [0] * 4)
+
+    def test_directions_are_rotations_of_each_other(self):
+        right = pygame.surfarray.array_alpha(render_optotype(20, "RIGHT"))
+        left = pygame.surfarray.array_alpha(render_optotype(20, "LEFT"))
+        up = pygame.surfarray.array_alpha(render_optotype(20, "UP"))
+        down = pygame.surfarray.array_alpha(render_optotype(20, "DOWN"))
+        self.assertEqual(left.tolist(), right[::-1, :].tolist())
+        self.assertEqual(down.tolist(), right.T.tolist())
+        self.assertEqual(up.tolist(), down[:, ::-1].tolist())
+
+    def test_fractional_size_uses_area_coverage(self):
+        surface = render_optotype(7.5, "RIGHT")
+        alpha = pygame.surfarray.array_alpha(surface)
+        self.assertEqual(surface.get_size(), (8, 8))
+        self.assertTrue(any(0 < value < 255 for value in alpha.flatten().tolist()))
+        ink = alpha.sum() / 255.0
+        self.assertAlmostEqual(ink, 7.5 * 7.5 * 17 / 25, delta=1.0)
+
+    def test_optotypes_are_cached_and_copies_stay_private(self):
+        EGenerator.prebake(E_SIZE_LEVELS)
+        shared = EGenerator.optotype(E_SIZE_LEVELS[3], "UP")
+        for direction in E_DIRECTIONS:
+            self.assertIs(EGenerator.optotype(E_SIZE_LEVELS[0], direction), EGenerator.optotype(E_SIZE_LEVELS[0], direction))
+        private = EGenerator.create_e_surface(E_SIZE_LEVELS[3], "UP")
+        self.assertIsNot(private, shared)
+        private.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        self.assertEqual(shared.get_at((0, 0))[:3], (255, 255, 255))
+        black = EGenerator.optotype(E_SIZE_LEVELS[3], "UP", color=(0, 0, 0))
+        self.assertEqual(black.get_at((0, 0)), pygame.Color(0, 0, 0, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from core.base_scene import BaseScene
+from core.fixed_timestep import FixedTimestep
+from core.frame_clock import FrameClock
+from core.quality_governor import QualityGovernor
+from core.scene_manager import SceneManager
+
+
+def _manager(fps):
+    manager = SceneManager.__new__(SceneManager)
+    manager.scene = None
+    manager.settings = {"language": "en-US"}
+    manager.target_frame_seconds = 1.0 / 60
+    manager.delta_seconds = manager.target_frame_seconds
+    manager.frame_scale = 1.0
+    manager.fixed_timestep = FixedTimestep(manager.target_frame_seconds)
+    manager.interpolation_alpha = 1.0
+    manager._pending_fixed_steps = 1
+    manager.clock = FrameClock()
+    manager.quality = QualityGovernor(manager.target_frame_seconds)
+    manager.frame_ms = 1000.0 / fps
+    return manager
+
+
+class _FixedScene(BaseScene):
+    FIXED_TIMESTEP = True
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.position = 0.0
+        self.steps = 0
+
+    def update(self):
+        self.position += 1.5 * self.frame_scale()
+        self.steps += 1
+
+
+class _VariableScene(_FixedScene):
+    FIXED_TIMESTEP = False
+
+
+class FixedTimestepTests(unittest.TestCase):
+    def test_accumulator_yields_substeps_and_alpha(self):
+        timestep = FixedTimestep(0.01, max_substeps=4)
+        self.assertEqual(timestep.advance(0.025), 2)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertEqual(timestep.advance(0.006), 1)
+        self.assertAlmostEqual(timestep.accumulator, 0.001)
+        self.assertEqual(timestep.advance(1.0), 4)
+        self.assertEqual(timestep.accumulator, 0.0)
+
+    def test_fixed_scene_advances_identically_at_any_frame_rate(self):
+        results = []
+        for fps in (30, 60, 144):
+            manager = _manager(fps)
+            scene = _FixedScene(manager)
+            for _ in range(fps):
+                manager.update_frame_timing(manager.frame_ms)
+                manager.update_scene(scene)
+            results.append((scene.steps, round(scene.position, 6)))
+            self.assertEqual(manager.frame_scale, min(0.05, manager.frame_ms / 1000.0) * 60)
+        for steps, position in results:
+            self.assertLessEqual(abs(steps - 60), 1)
+            self.assertAlmostEqual(position, steps * 1.5)
+
+    def test_variable_scene_updates_once_per_frame(self):
+        manager = _manager(30)
+        scene = _VariableScene(manager)
+        manager.update_frame_timing(manager.frame_ms)
+        manager.update_scene(scene)
+        self.assertEqual(scene.steps, 1)
+        self.assertAlmostEqual(scene.position, 1.5 * 2.0)
+        self.assertEqual(scene.interpolation_alpha(), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.base_scene import BaseScene
+from core.font_pool import (
+    adjust_font_size,
+    clear_font_pool,
+    get_shared_font,
+    pending_font_warmups,
+    schedule_font_warmup,
+    warm_pending_fonts,
+)
+
+
+class _ManagerStub:
+    def __init__(self, language="en-US"):
+        self.settings = {"language": language}
+
+
+class FontPoolTests(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        clear_font_pool()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_scenes_share_font_objects(self):
+        first = BaseScene(_ManagerStub())
+        second = BaseScene(_ManagerStub())
+        self.assertIs(first.create_font(24), second.create_font(24))
+        self.assertIsNot(first.create_font(24), first.create_font(24, bold=True))
+        self.assertTrue(first.create_font(24, bold=True).get_bold())
+
+    def test_chinese_sizes_are_scaled_before_pooling(self):
+        self.assertEqual(adjust_font_size("zh-CN", 50), 44)
+        self.assertEqual(adjust_font_size("zh-CN", 8), 10)
+        self.assertEqual(adjust_font_size("en-US", 50), 50)
+        scene = BaseScene(_ManagerStub("zh-CN"))
+        self.assertIs(scene.create_font(50), get_shared_font("zh-CN", 44))
+
+    def test_warmup_fills_pool_within_budget(self):
+        schedule_font_warmup("en-US", sizes=(18, 22))
+        schedule_font_warmup("en-US", sizes=(22,))
+        self.assertEqual(pending_font_warmups(), 2)
+        created = 0
+        while pending_font_warmups():
+            created += warm_pending_fonts(budget_seconds=0.0)
+        self.assertEqual(created, 2)
+        font = get_shared_font("en-US", 18)
+        schedule_font_warmup("en-US", sizes=(18,))
+        self.assertEqual(pending_font_warmups(), 0)
+        self.assertIs(BaseScene(_ManagerStub()).create_font(18), font)
+
+    def test_pool_is_cleared_when_pygame_quits(self):
+        font = get_shared_font("en-US", 20)
+        pygame.quit()
+        pygame.init()
+        self.assertIsNot(get_shared_font("en-US", 20), font)
+
+
+if __name__ == "__main__":
+    unittest.main()
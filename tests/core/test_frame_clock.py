@@ -0,0 +1,54 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from core import frame_clock
+from core.frame_clock import FrameClock
+
+
+class _Source:
+    def __init__(self):
+        self.value = 10.0
+
+    def __call__(self):
+        return self.value
+
+
+class FrameClockTests(unittest.TestCase):
+    def test_reads_live_until_first_tick_then_once_per_frame(self):
+        source = _Source()
+        clock = FrameClock(source=source, epoch=1000.0)
+        self.assertEqual(clock.now(), 1000.0)
+        source.value = 10.5
+        self.assertEqual(clock.now(), 1000.5)
+        self.assertEqual(clock.tick(), 1000.5)
+        source.value = 11.0
+        self.assertEqual(clock.now(), 1000.5)
+        self.assertEqual(clock.live(), 1001.0)
+        clock.tick()
+        self.assertEqual(clock.now(), 1001.0)
+        self.assertEqual(clock.frame_index, 2)
+
+    def test_pause_excludes_elapsed_time(self):
+        source = _Source()
+        clock = FrameClock(source=source, epoch=0.0)
+        clock.tick()
+        clock.pause()
+        source.value = 40.0
+        clock.tick()
+        self.assertTrue(clock.paused)
+        self.assertEqual(clock.now(), 0.0)
+        clock.resume()
+        source.value = 41.0
+        clock.tick()
+        self.assertFalse(clock.paused)
+        self.assertEqual(clock.now(), 1.0)
+
+    def test_default_clock_is_aligned_with_wall_time(self):
+        self.assertLess(abs(FrameClock().now() - time.time()), 0.05)
+        with patch("core.frame_clock.now", return_value=5.0):
+            self.assertEqual(frame_clock.now(), 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core import asset_loader, font_pool
+from core.frame_profiler import HISTOGRAM_BINS, LOG_ENV, FrameProfiler, active_scene_path
+from games.common.anaglyph import FILTER_LR, apply_filter, blend_filtered_patterns
+
+
+class _Leaf:
+    pass
+
+
+class _Root:
+    def __init__(self):
+        self.current_scene = _Leaf()
+
+
+class _Host:
+    def __init__(self):
+        self.active_game_scene = _Root()
+
+
+class FrameProfilerTests(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.profiler = FrameProfiler(capacity=4)
+
+    def tearDown(self):
+        self.profiler.visible = False
+        self.profiler.start_frame()
+        font_pool.clear_font_pool()
+
+    def _record(self, seconds):
+        self.profiler.start_frame()
+        row = self.profiler._row
+        self.profiler.lap("draw")
+        row[:] = seconds
+        self.profiler.end_frame()
+
+    def test_hidden_profiler_records_nothing(self):
+        self.profiler.start_frame()
+        self.profiler.lap("events")
+        self.profiler.end_frame(_Host())
+        self.assertEqual(self.profiler.frames, 0)
+        self.assertEqual(self.profiler.stats(), {})
+        screen = pygame.Surface((32, 32))
+        self.profiler.draw(screen)
+        self.assertEqual(screen.get_at((10, 10)), pygame.Color(0, 0, 0, 255))
+
+    def test_ring_buffer_keeps_latest_frames_for_percentiles(self):
+        self.profiler.toggle()
+        for ms in (100, 1, 2, 3, 4):
+            self._record((ms / 4000.0, ms / 4000.0, ms / 4000.0, ms / 4000.0))
+        stats = self.profiler.stats()
+        self.assertEqual(stats["frames"], 4)
+        self.assertAlmostEqual(stats["p50_ms"], 2.5)
+        self.assertAlmostEqual(stats["update_ms"], 0.625)
+        self.assertLess(stats["p99_ms"], 4.0 + 1e-9)
+        self.assertEqual(len(self.profiler.histogram()), HISTOGRAM_BINS)
+        self.assertEqual(int(self.profiler.histogram().sum()), 4)
+
+    def test_counts_image_allocations_and_font_renders_during_draw(self):
+        self.profiler.toggle()
+        font = font_pool.get_shared_font("en-US", 16)
+        self.profiler.start_frame()
+        self.profiler.lap("events")
+        self.profiler.lap("update")
+        asset_loader.count_image_allocation()
+        font.render("abc", True, (255, 255, 255))
+        font.render("def", True, (255, 255, 255))
+        self.profiler.lap("draw")
+        asset_loader.count_image_allocation()
+        self.profiler.lap("flip")
+        self.profiler.end_frame(_Host())
+        stats = self.profiler.stats()
+        self.assertEqual(stats["image_allocs_per_frame"], 1.0)
+        self.assertEqual(stats["font_renders_per_frame"], 2.0)
+        self.assertEqual(self.profiler.scene_label, "_Host > _Root > _Leaf")
+        self.assertIn("image_allocs=1.0 renders=2.0", self.profiler.summary_line())
+
+    def test_counts_anaglyph_composites_built_during_draw(self):
+        self.profiler.toggle()
+        left = pygame.Surface((20, 20), pygame.SRCALPHA)
+        right = pygame.Surface((20, 20), pygame.SRCALPHA)
+        self.profiler.start_frame()
+        left_filtered = apply_filter(left, "glasses", FILTER_LR, "left")
+        right_filtered = apply_filter(right, "glasses", FILTER_LR, "right")
+        blend_filtered_patterns((20, 20), left_filtered, (0, 0), right_filtered, (0, 0))
+        self.profiler.lap("draw")
+        self.profiler.end_frame()
+        # 两次滤色各一张，合成时左右图层加结果共三张。
+        self.assertEqual(self.profiler.stats()["image_allocs_per_frame"], 5.0)
+
+    def test_overlay_draws_panel_when_visible(self):
+        self.profiler.toggle()
+        self._record((0.002, 0.003, 0.004, 0.001))
+        screen = pygame.Surface((400, 200))
+        self.profiler.draw(screen, "high")
+        self.assertNotEqual(screen.get_at((10, 10)), pygame.Color(0, 0, 0, 255))
+
+    def test_active_scene_path_follows_nested_hosts(self):
+        self.assertEqual(active_scene_path(_Root()), "_Root > _Leaf")
+        self.assertEqual(active_scene_path(None), "")
+
+    def test_log_mode_comes_from_environment(self):
+        self.assertEqual(FrameProfiler.from_environment({}).log_every, 0)
+        self.assertEqual(FrameProfiler.from_environment({LOG_ENV: "60"}).log_every, 60)
+        logging_profiler = FrameProfiler.from_environment({LOG_ENV: "yes"})
+        self.assertTrue(logging_profiler.enabled)
+        self.assertFalse(logging_profiler.visible)
+
+    def test_log_mode_prints_summary_every_n_frames(self):
+        profiler = FrameProfiler(capacity=4, log_every=2)
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            for _ in range(4):
+                profiler.start_frame()
+                profiler.lap("draw")
+                profiler.end_frame(_Host())
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("[profile] frame p50="))
+        self.assertIn("_Host > _Root > _Leaf", lines[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
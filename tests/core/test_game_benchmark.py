@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config import FPS
+from core import asset_loader, frame_clock
+from core.fixed_timestep import FixedTimestep
+from core.frame_clock import FrameClock
+from core.game_benchmark import benchmark_game, benchmark_replay, compare_reports, enter_play_state, in_play_state, run_benchmarks, scripted_events
+from core.game_registry import GameRegistry
+from core.input_replay import InputRecorder, InputReplay
+from core.quality_governor import QualityGovernor
+from core.scene_manager import SceneManager
+from games.common.anaglyph import FILTER_LR, FILTER_RL
+from games.simultaneous.pong.scenes.root_scene import PongScene
+
+
+def _manager():
+    manager = SceneManager.__new__(SceneManager)
+    manager.scene = None
+    manager.settings = {"language": "en-US", "session_duration_minutes": 5}
+    manager.screen_size = (900, 700)
+    manager.target_frame_seconds = 1.0 / 60
+    manager.delta_seconds = manager.target_frame_seconds
+    manager.frame_scale = 1.0
+    manager.fixed_timestep = FixedTimestep(manager.target_frame_seconds)
+    manager.interpolation_alpha = 1.0
+    manager._pending_fixed_steps = 1
+    manager.clock = FrameClock()
+    manager.quality = QualityGovernor(manager.target_frame_seconds)
+    manager.data_manager = None
+    manager.sound_manager = None
+    manager.game_registry = GameRegistry()
+    manager.t = lambda key, **_kwargs: key
+    manager.scenes = {}
+    manager.scene_factories = {}
+    return manager
+
+
+def _report(update_ms, image_allocs=1.0):
+    return {
+        "results": [
+            {
+                "game_id": "simultaneous.pong",
+                "size": [900, 700],
+                "filter_direction": FILTER_LR,
+                "update_ms": update_ms,
+                "draw_ms": 2.0,
+                "p95_ms": 3.0,
+                "image_allocs_per_frame": image_allocs,
+                "font_renders_per_frame": 4.0,
+            }
+        ]
+    }
+
+
+class GameBenchmarkTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.clear_image_cache()
+        pygame.quit()
+
+    def test_scripted_events_are_deterministic(self):
+        first = [(event.type, event.dict) for event in scripted_events(40, (900, 700))]
+        second = [(event.type, event.dict) for event in scripted_events(40, (900, 700))]
+        self.assertEqual(first, second)
+        self.assertIn(pygame.MOUSEBUTTONDOWN, [event.type for event in scripted_events(40, (900, 700))])
+        for frame in range(200):
+            for event in scripted_events(frame, (900, 700)):
+                if hasattr(event, "pos"):
+                    self.assertTrue(180 <= event.pos[0] <= 720 and 140 <= event.pos[1] <= 560)
+
+    def test_enters_play_state_for_root_and_nested_games(self):
+        manager = _manager()
+        for game_id in ("simultaneous.pong", "stereopsis.ring_flight"):
+            with self.subTest(game=game_id):
+                scene = manager.game_registry.get_game(game_id).factory(manager)
+                self.assertFalse(in_play_state(scene))
+                self.assertTrue(enter_play_state(scene))
+                self.assertTrue(in_play_state(scene))
+
+    def test_run_reports_each_filter_direction(self):
+        report = run_benchmarks(_manager(), ["simultaneous.pong"], sizes=((320, 240),), frames=4, warmup_frames=2)
+        results = report["results"]
+        self.assertEqual([result["filter_direction"] for result in results], [FILTER_LR, FILTER_RL])
+        for result in results:
+            self.assertEqual(result["frames"], 4)
+            self.assertEqual(result["play_frames"], 4)
+            self.assertGreater(result["draw_ms"], 0.0)
+
+    def test_game_clock_advances_one_frame_per_step(self):
+        manager = _manager()
+        manager_clock = manager.clock
+        global_clock = frame_clock.FRAME_CLOCK
+        readings = []
+        update_frame_timing = manager.update_frame_timing
+
+        def record(dt_ms):
+            update_frame_timing(dt_ms)
+            readings.append(frame_clock.now())
+
+        manager.update_frame_timing = record
+        benchmark_game(manager, "simultaneous.pong", (320, 240), frames=3, warmup_frames=2)
+        self.assertEqual(len(readings), 5)
+        for earlier, later in zip(readings, readings[1:]):
+            self.assertAlmostEqual(later - earlier, 1.0 / FPS, places=5)
+        self.assertIs(frame_clock.FRAME_CLOCK, global_clock)
+        self.assertIs(manager.clock, manager_clock)
+
+    def test_replay_drives_recorded_frames_and_clock(self):
+        epoch = 1700000000.0
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "pong.rec")
+            recorder = InputRecorder(path, seed=5, epoch=epoch, screen_size=(320, 240), initial_scene="pong", settings={})
+            for frame in range(6):
+                events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0)] if frame == 1 else []
+                recorder.record(20, epoch + 0.02 * (frame + 1), events)
+            recorder.close()
+            manager = _manager()
+            manager.register("pong", factory=PongScene)
+            global_clock = frame_clock.FRAME_CLOCK
+            result = benchmark_replay(manager, InputReplay(path))
+
+        self.assertEqual(result["game_id"], "replay:pong.rec")
+        self.assertEqual(result["frames"], 6)
+        self.assertEqual(result["size"], [320, 240])
+        self.assertEqual(result["final_scene"], "PongScene")
+        self.assertAlmostEqual(manager.delta_seconds, 0.02)
+        self.assertIs(frame_clock.FRAME_CLOCK, global_clock)
+        self.assertEqual(compare_reports({"results": [result]}, {"results": [result]}), [])
+
+    def test_compare_flags_only_real_regressions(self):
+        self.assertEqual(compare_reports(_report(1.0), _report(1.1)), [])
+        self.assertEqual(compare_reports(_report(0.01), _report(0.05)), [])
+        regressions = compare_reports(_report(1.0), _report(1.5, image_allocs=3.0))
+        self.assertEqual([item["metric"] for item in regressions], ["update_ms", "image_allocs_per_frame"])
+        self.assertEqual(regressions[0]["current"], 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
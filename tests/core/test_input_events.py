@@ -0,0 +1,78 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.base_scene import BaseScene
+from core.input_events import EventBatch, EventFilter, coalesce_motion, handles_mouse_motion
+from games.simultaneous.pong.scenes.root_scene import PongScene
+
+
+def _motion(x, y, dx, dy):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(dx, dy), buttons=(0, 0, 0))
+
+
+def _click(x, y):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1)
+
+
+class _Host:
+    def __init__(self, child):
+        self.active_game_scene = child
+
+
+class InputEventsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((64, 64))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def test_consecutive_motion_is_merged_in_order(self):
+        events = [_motion(1, 1, 1, 1) for _ in range(200)]
+        events += [_click(5, 5), _motion(7, 8, 2, 3), _motion(9, 9, 2, 1)]
+        merged = coalesce_motion(events)
+        self.assertEqual([event.type for event in merged], [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION])
+        self.assertEqual(merged[0].rel, (200, 200))
+        self.assertEqual((merged[2].pos, merged[2].rel), ((9, 9), (4, 4)))
+
+    def test_batch_is_a_classified_list(self):
+        key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP, mod=0)
+        batch = EventBatch([_motion(1, 2, 1, 0), key, _motion(3, 4, 1, 0), _motion(5, 6, 1, 0)])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.of_type(pygame.KEYDOWN), [key])
+        self.assertEqual(len(batch.of_type(pygame.KEYDOWN, pygame.MOUSEMOTION)), 3)
+        self.assertTrue(batch.has(pygame.MOUSEMOTION))
+        self.assertEqual(batch.mouse_pos, (5, 6))
+        self.assertIsNone(EventBatch([key]).mouse_pos)
+
+    def test_filter_follows_the_active_scene(self):
+        manager = type("Manager", (), {"settings": {"language": "en-US"}})()
+        quiet_scene = BaseScene(manager)
+        self.assertFalse(handles_mouse_motion(_Host(quiet_scene)))
+        self.assertTrue(PongScene.HANDLES_MOUSEMOTION)
+        self.assertTrue(handles_mouse_motion(object()))
+
+        event_filter = EventFilter()
+        try:
+            event_filter.install()
+            self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+            self.assertFalse(pygame.event.get_blocked(pygame.KEYDOWN))
+            self.assertFalse(pygame.event.get_blocked(pygame.WINDOWFOCUSLOST))
+            self.assertTrue(pygame.event.get_blocked(pygame.JOYAXISMOTION))
+            event_filter.update(_Host(_Host(PongScene)))
+            self.assertFalse(pygame.event.get_blocked(pygame.MOUSEMOTION))
+            event_filter.update(quiet_scene)
+            self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+        finally:
+            event_filter.uninstall()
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEMOTION))
+
+
+if __name__ == "__main__":
+    unittest.main()
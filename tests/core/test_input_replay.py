@@ -0,0 +1,81 @@
+import gzip
+import os
+import random
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.frame_clock import FrameClock
+from core.input_replay import InputRecorder, InputReplay, decode_event, encode_event
+from games.stereopsis.pop_nearest.services.board_service import PopNearestBoardService
+
+
+class InputReplayTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmpdir.name, "session.rec")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_event_round_trip_keeps_tuples_and_drops_objects(self):
+        event = pygame.event.Event(pygame.MOUSEMOTION, pos=(12, 34), rel=(1, -2), buttons=(1, 0, 0), window=object())
+        restored = decode_event(encode_event(event))
+        self.assertEqual(restored.type, pygame.MOUSEMOTION)
+        self.assertEqual(restored.pos, (12, 34))
+        self.assertEqual(restored.rel, (1, -2))
+        self.assertFalse(hasattr(restored, "window"))
+
+    def test_recording_replays_frames_and_clock_exactly(self):
+        epoch = 1700000000.123456
+        recorder = InputRecorder(
+            self.path,
+            seed=42,
+            epoch=epoch,
+            screen_size=(900, 700),
+            initial_scene="menu",
+            settings={"language": "zh-CN", "session_duration_minutes": 3, "fullscreen": True},
+        )
+        recorder.record(16, epoch + 0.016667, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT, mod=0)])
+        recorder.record(33, epoch + 0.050001, [])
+        recorder.close()
+
+        replay = InputReplay(self.path)
+        self.assertEqual((replay.seed, replay.screen_size, replay.initial_scene), (42, (900, 700), "menu"))
+        self.assertEqual(replay.settings, {"language": "zh-CN", "session_duration_minutes": 3})
+        clock = FrameClock(source=replay.clock_source, epoch=replay.epoch)
+        dt_ms, events = replay.next_frame()
+        clock.tick()
+        self.assertEqual(dt_ms, 16)
+        self.assertEqual(events[0].key, pygame.K_LEFT)
+        self.assertEqual(clock.now(), epoch + 0.016667)
+        self.assertEqual(replay.next_frame(), (33, []))
+        clock.tick()
+        self.assertEqual(clock.now(), epoch + 0.050001)
+        self.assertTrue(replay.finished)
+
+    def test_rejects_foreign_files(self):
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            f.write('{"format": "other"}\n')
+        with self.assertRaises(ValueError):
+            InputReplay(self.path)
+
+    def test_board_layout_follows_global_seed(self):
+        area = pygame.Rect(0, 0, 900, 600)
+        layouts = []
+        state = random.getstate()
+        try:
+            for _ in range(2):
+                random.seed(7)
+                balloons = PopNearestBoardService().create_group(area, 0)["balloons"]
+                layouts.append([(balloon["base_center"], balloon["float_phase"]) for balloon in balloons])
+        finally:
+            random.setstate(state)
+        self.assertEqual(layouts[0], layouts[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
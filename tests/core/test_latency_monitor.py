@@ -0,0 +1,85 @@
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.base_scene import BaseScene
+from core.latency_monitor import MAX_POLL_WINDOW, SUMMARY_NOTE, LatencyMonitor
+
+
+class _Source:
+    def __init__(self):
+        self.value = 100.0
+
+    def __call__(self):
+        return self.value
+
+
+class _Manager:
+    def __init__(self, latency):
+        self.latency = latency
+        self.settings = {"language": "en-US"}
+
+
+def _key():
+    return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT, mod=0)
+
+
+class LatencyMonitorTests(unittest.TestCase):
+    def setUp(self):
+        self.source = _Source()
+        self.monitor = LatencyMonitor(enabled=True, source=self.source)
+
+    def test_input_and_stimulus_latency_per_label(self):
+        self.monitor.begin_frame([_key(), pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1))], "game.a")
+        self.source.value += 0.002
+        self.monitor.mark_handled()
+        onset = BaseScene(_Manager(self.monitor)).mark_stimulus_onset("target")
+        self.source.value += 0.010
+        self.monitor.mark_presented()
+
+        self.assertAlmostEqual(onset.presented_at, 100.012)
+        self.assertAlmostEqual(onset.presentation_delay, 0.010)
+        report = self.monitor.report()["game.a"]
+        self.assertEqual(report["input_to_handled"]["count"], 1)
+        self.assertAlmostEqual(report["input_to_handled"]["p50_ms"], 2.0)
+        self.assertAlmostEqual(report["input_to_present"]["max_ms"], 12.0)
+        self.assertAlmostEqual(report["onset_to_present"]["p95_ms"], 10.0)
+        self.assertTrue(self.monitor.summary_lines()[0].startswith("game.a: "))
+        self.assertEqual(self.monitor.summary_lines()[-1], SUMMARY_NOTE)
+
+    def test_untimestamped_input_arrives_mid_way_between_polls(self):
+        self.monitor.begin_frame([], "game.d")
+        self.source.value += 0.016
+        self.monitor.begin_frame([_key()], "game.d")
+        self.source.value += 0.002
+        self.monitor.mark_presented()
+        self.assertAlmostEqual(self.monitor.report()["game.d"]["input_to_present"]["p50_ms"], 10.0)
+
+        self.source.value += 5.0
+        self.monitor.begin_frame([_key()], "game.d")
+        self.monitor.mark_presented()
+        self.assertAlmostEqual(self.monitor.report()["game.d"]["input_to_present"]["max_ms"], MAX_POLL_WINDOW * 500.0)
+
+    def test_event_timestamp_moves_arrival_earlier(self):
+        event = _key()
+        event.timestamp = 1000
+        with patch("core.latency_monitor.pygame.time.get_ticks", return_value=1005):
+            self.monitor.begin_frame([event], "game.b")
+        self.monitor.mark_presented()
+        self.assertAlmostEqual(self.monitor.report()["game.b"]["input_to_present"]["p50_ms"], 5.0)
+
+    def test_disabled_monitor_records_nothing(self):
+        monitor = LatencyMonitor(source=self.source)
+        monitor.begin_frame([_key()], "game.c")
+        self.assertIsNone(monitor.stimulus_onset())
+        monitor.mark_presented()
+        self.assertEqual(monitor.report(), {})
+        self.assertIsNone(BaseScene(_Manager(None)).mark_stimulus_onset())
+
+
+if __name__ == "__main__":
+    unittest.main()
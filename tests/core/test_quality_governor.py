@@ -0,0 +1,38 @@
+import unittest
+
+from core.quality_governor import QUALITY_HIGH, QUALITY_LOW, QUALITY_MEDIUM, QualityGovernor
+
+
+class QualityGovernorTests(unittest.TestCase):
+    def _feed(self, governor, seconds, frames):
+        for _ in range(frames):
+            governor.record(seconds)
+
+    def test_sustained_slow_frames_step_down_one_tier_at_a_time(self):
+        governor = QualityGovernor(1.0 / 60)
+        self._feed(governor, 1.0 / 60, governor.WINDOW * 3)
+        self.assertEqual(governor.tier, QUALITY_HIGH)
+        self._feed(governor, 0.04, governor.WINDOW)
+        self.assertEqual(governor.tier, QUALITY_MEDIUM)
+        self._feed(governor, 0.04, governor.WINDOW)
+        self.assertEqual(governor.tier, QUALITY_LOW)
+        self._feed(governor, 0.04, governor.WINDOW)
+        self.assertEqual(governor.name, "low")
+
+    def test_occasional_spikes_do_not_downgrade(self):
+        governor = QualityGovernor(1.0 / 60)
+        for index in range(governor.WINDOW * 4):
+            governor.record(0.1 if index % 20 == 0 else 1.0 / 60)
+        self.assertEqual(governor.tier, QUALITY_HIGH)
+
+    def test_upgrade_waits_for_cooldown(self):
+        governor = QualityGovernor(1.0 / 60, tier=QUALITY_LOW)
+        self._feed(governor, 1.0 / 60, governor.UPGRADE_COOLDOWN_FRAMES - 1)
+        self.assertEqual(governor.tier, QUALITY_LOW)
+        governor.record(1.0 / 60)
+        self.assertEqual(governor.tier, QUALITY_MEDIUM)
+        self.assertAlmostEqual(governor.frame_time_percentile(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core import asset_loader
+from core.asset_loader import project_path
+from core.scale_pyramid import ScalePyramid, clear_scale_pyramids, get_scale_pyramid, pyramid_sizes
+
+
+APPLE = project_path("games", "accommodation", "catch_fruit", "assets", "objects", "apple.png")
+
+
+class ScalePyramidTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        clear_scale_pyramids()
+        pygame.quit()
+
+    def test_sizes_cover_range(self):
+        self.assertEqual(pyramid_sizes(36, 88, 14)[0], 36)
+        self.assertEqual(pyramid_sizes(36, 88, 14)[-1], 88)
+        self.assertEqual(len(pyramid_sizes(36, 88, 14)), 14)
+        self.assertEqual(pyramid_sizes(40, 40, 5), (40,))
+
+    def test_picks_nearest_level_without_new_cache_entries(self):
+        clear_scale_pyramids()
+        asset_loader.clear_image_cache()
+        pyramid = get_scale_pyramid(APPLE, 36, 88, 14)
+        cached = len(asset_loader._IMAGE_CACHE)
+        seen = set()
+        for size in range(88, 35, -1):
+            surface = pyramid.surface(size)
+            self.assertLessEqual(abs(surface.get_width() - size), 2)
+            seen.add(id(surface))
+        self.assertEqual(len(seen), len(pyramid))
+        self.assertEqual(len(asset_loader._IMAGE_CACHE), cached)
+        self.assertIs(get_scale_pyramid(APPLE, 36, 88, 14), pyramid)
+
+    def test_exact_mode_scales_from_larger_level(self):
+        pyramid = ScalePyramid(pygame.Surface((100, 100)), 20, 60, 3)
+        self.assertEqual(pyramid.sizes, (20, 40, 60))
+        self.assertEqual(pyramid.surface(33, exact=True).get_size(), (33, 33))
+        self.assertIs(pyramid.surface(40, exact=True), pyramid.surface(40))
+        self.assertEqual(pyramid.surface(90).get_size(), (60, 60))
+
+    def test_missing_asset_returns_none(self):
+        self.assertIsNone(get_scale_pyramid(project_path("assets", "missing.png"), 10, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,6 +73,33 @@ class SceneFlowIntegrationTests(unittest.TestCase):
         self.assertEqual(menu.on_enter_calls, 1)
         self.assertEqual(menu.reset_calls, 0)
 
+    def test_factory_scene_is_built_on_first_set_scene(self):
+        manager = SceneManager.__new__(SceneManager)
+        manager.scenes = {}
+        manager.scene_factories = {}
+        manager.screen_size = (900, 700)
+        manager.scene = None
+        built = []
+
+        def build_menu(owner):
+            built.append(owner)
+            return _DummyScene()
+
+        SceneManager.register(manager, "menu", factory=build_menu)
+        SceneManager.register(manager, "license", factory=lambda _owner: self.fail("license should stay unbuilt"))
+        self.assertEqual(built, [])
+
+        SceneManager.set_scene(manager, "menu")
+        menu = manager.scene
+        SceneManager.set_scene(manager, "menu")
+
+        self.assertEqual(built, [manager])
+        self.assertIs(manager.scene, menu)
+        self.assertEqual(menu.on_enter_calls, 2)
+        self.assertNotIn("license", manager.scenes)
+        with self.assertRaises(KeyError):
+            SceneManager.set_scene(manager, "missing")
+
 
 class HistorySceneFilterIntegrationTests(unittest.TestCase):
     @classmethod
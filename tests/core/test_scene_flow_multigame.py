@@ -83,6 +83,10 @@ class _DummyGameScene:
         self.draw_calls += 1
 
 
+class _NoResetGameScene(_DummyGameScene):
+    reset = None
+
+
 class SceneFlowMultiGameTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -128,6 +132,75 @@ class SceneFlowMultiGameTests(unittest.TestCase):
         self.assertEqual(host.active_game_scene.update_calls, 1)
         self.assertEqual(host.active_game_scene.draw_calls, 1)
 
+    def test_game_host_reuses_recently_played_scenes(self):
+        built = []
+
+        def factory(manager):
+            scene = _DummyGameScene(manager)
+            scene.frame_cache = pygame.Surface((4, 4))
+            built.append(scene)
+            return scene
+
+        descriptors = {
+            game_id: GameDescriptor(game_id=game_id, category="accommodation", name=game_id, factory=factory)
+            for game_id in ("accommodation.a", "accommodation.b", "accommodation.c")
+        }
+        registry = _FakeGameRegistry(descriptors["accommodation.a"])
+        registry.get_game = descriptors.get
+        manager = _FlowManagerStub(registry)
+        host = GameHostScene(manager)
+        host.MAX_POOLED_SCENES = 2
+
+        manager.active_game_id = "accommodation.a"
+        host.on_enter()
+        first_a = host.active_game_scene
+        manager.active_game_id = "accommodation.b"
+        host.on_enter()
+        manager.active_game_id = "accommodation.a"
+        host.on_enter()
+
+        self.assertIs(host.active_game_scene, first_a)
+        self.assertEqual(first_a.reset_calls, 2)
+        self.assertEqual(first_a.resize_calls, 2)
+        self.assertEqual(len(built), 2)
+
+        manager.active_game_id = "accommodation.c"
+        host.on_enter()
+        manager.active_game_id = "accommodation.b"
+        host.on_enter()
+        self.assertEqual(len(built), 3)
+        self.assertEqual(list(host._scene_pool), ["accommodation.a", "accommodation.c"])
+
+        host.MAX_POOLED_BYTES = 0
+        manager.active_game_id = "accommodation.a"
+        host.on_enter()
+        self.assertNotIn("accommodation.b", host._scene_pool)
+
+    def test_game_host_rebuilds_scenes_without_reset(self):
+        built = []
+
+        def factory(manager):
+            scene = _NoResetGameScene(manager)
+            built.append(scene)
+            return scene
+
+        descriptors = {
+            game_id: GameDescriptor(game_id=game_id, category="accommodation", name=game_id, factory=factory)
+            for game_id in ("accommodation.a", "accommodation.b")
+        }
+        registry = _FakeGameRegistry(descriptors["accommodation.a"])
+        registry.get_game = descriptors.get
+        manager = _FlowManagerStub(registry)
+        host = GameHostScene(manager)
+
+        for game_id in ("accommodation.a", "accommodation.b", "accommodation.a"):
+            manager.active_game_id = game_id
+            host.on_enter()
+
+        self.assertEqual(len(built), 3)
+        self.assertIsNot(host.active_game_scene, built[0])
+        self.assertEqual(list(host._scene_pool), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,152 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.game_contract import GameDescriptor
+from core.scene_prewarmer import ScenePrewarmer, estimate_surface_bytes
+from scenes.game_host_scene import GameHostScene
+
+
+class _SurfaceScene:
+    instances = 0
+
+    def __init__(self, manager, size=(10, 10)):
+        type(self).instances += 1
+        self.manager = manager
+        self.cached = {"bg": pygame.Surface(size, pygame.SRCALPHA)}
+        self.resize_calls = 0
+        self.draw_calls = 0
+        self.reset_calls = 0
+
+    def on_resize(self, _w, _h):
+        self.resize_calls += 1
+
+    def draw(self, _screen):
+        self.draw_calls += 1
+
+    def reset(self):
+        self.reset_calls += 1
+
+    def handle_events(self, _events):
+        pass
+
+    def update(self):
+        pass
+
+
+class _BrokenScene(_SurfaceScene):
+    def draw(self, _screen):
+        raise RuntimeError("draw failed")
+
+
+class _Registry:
+    def __init__(self, descriptors):
+        self._games = {item.game_id: item for item in descriptors}
+
+    def get_game(self, game_id):
+        return self._games.get(game_id)
+
+
+class _ManagerStub:
+    def __init__(self, descriptors):
+        self.settings = {"language": "en-US"}
+        self.game_registry = _Registry(descriptors)
+        self.screen_size = (320, 240)
+        self.target_frame_seconds = 1.0 / 60
+        self.delta_seconds = 1.0 / 60
+        self.active_game_id = None
+        self.scene_prewarmer = ScenePrewarmer(self)
+
+
+def _descriptor(game_id, scene_cls=_SurfaceScene, size=(10, 10)):
+    return GameDescriptor(game_id=game_id, category="test", name=game_id, factory=lambda manager: scene_cls(manager, size))
+
+
+class ScenePrewarmerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def _run_idle_frames(self, prewarmer, frames=ScenePrewarmer.IDLE_FRAMES_BEFORE_START):
+        built = 0
+        for _ in range(frames):
+            built += int(prewarmer.step())
+        return built
+
+    def test_estimate_counts_each_surface_once_and_skips_manager(self):
+        manager = _ManagerStub([])
+        scene = _SurfaceScene(manager, (8, 4))
+        scene.alias = scene.cached["bg"]
+        manager.big = pygame.Surface((100, 100))
+        self.assertEqual(estimate_surface_bytes(scene, skip=(manager,)), 8 * 4 * 4)
+
+    def test_builds_one_scene_per_idle_frame_and_host_reuses_it(self):
+        manager = _ManagerStub([_descriptor("test.a"), _descriptor("test.b")])
+        prewarmer = manager.scene_prewarmer
+        prewarmer.schedule(["test.a", "test.b", "test.a"])
+
+        self.assertEqual(self._run_idle_frames(prewarmer), 1)
+        self.assertTrue(prewarmer.is_ready("test.a"))
+        self.assertFalse(prewarmer.is_ready("test.b"))
+        self.assertTrue(prewarmer.step())
+        self.assertTrue(prewarmer.is_ready("test.b"))
+
+        prewarmed = prewarmer._ready["test.a"]
+        self.assertEqual(prewarmed.resize_calls, 1)
+        self.assertEqual(prewarmed.draw_calls, 1)
+
+        manager.active_game_id = "test.a"
+        host = GameHostScene(manager)
+        host.on_enter()
+        self.assertIs(host.active_game_scene, prewarmed)
+        self.assertEqual(prewarmed.reset_calls, 1)
+        self.assertFalse(prewarmer.is_ready("test.a"))
+
+    def test_skips_frames_without_headroom_and_cancel_stops_work(self):
+        manager = _ManagerStub([_descriptor("test.a")])
+        prewarmer = manager.scene_prewarmer
+        prewarmer.schedule(["test.a"])
+        manager.delta_seconds = 0.05
+        self.assertEqual(self._run_idle_frames(prewarmer, 30), 0)
+        prewarmer.cancel()
+        manager.delta_seconds = manager.target_frame_seconds
+        self.assertEqual(self._run_idle_frames(prewarmer, 30), 0)
+        self.assertFalse(prewarmer.is_ready("test.a"))
+
+    def test_memory_cap_evicts_oldest_and_rejects_oversized(self):
+        manager = _ManagerStub([
+            _descriptor("test.a", size=(32, 32)),
+            _descriptor("test.b", size=(32, 32)),
+            _descriptor("test.huge", size=(128, 128)),
+        ])
+        prewarmer = ScenePrewarmer(manager, max_scenes=2, max_bytes=32 * 32 * 4 + 100)
+        prewarmer.schedule(["test.a"])
+        self._run_idle_frames(prewarmer)
+        prewarmer.schedule(["test.b"])
+        self._run_idle_frames(prewarmer)
+        self.assertFalse(prewarmer.is_ready("test.a"))
+        self.assertTrue(prewarmer.is_ready("test.b"))
+
+        prewarmer.schedule(["test.huge"])
+        self._run_idle_frames(prewarmer)
+        self.assertFalse(prewarmer.is_ready("test.huge"))
+        self.assertLessEqual(prewarmer.total_bytes, prewarmer.max_bytes)
+
+    def test_failed_prewarm_is_dropped(self):
+        manager = _ManagerStub([_descriptor("test.broken", scene_cls=_BrokenScene)])
+        prewarmer = manager.scene_prewarmer
+        prewarmer.schedule(["test.broken", "test.missing"])
+        with self.assertLogs("core.scene_prewarmer", level="WARNING"):
+            self._run_idle_frames(prewarmer, 20)
+        self.assertFalse(prewarmer.is_ready("test.broken"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core import asset_loader
+from core.asset_loader import PROJECT_ROOT, load_image_if_exists, project_path
+from core.texture_atlas import atlas_group, build_texture_atlas, shelf_pack
+
+
+OBJECTS = ("games", "accommodation", "catch_fruit", "assets", "objects")
+
+
+class TextureAtlasTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_asset_pack(None)
+        pygame.quit()
+
+    def test_shelf_pack_places_sprites_without_overlap(self):
+        sizes = [(100, 100), (256, 128), (256, 256), (30, 40), (256, 256)]
+        positions, atlas_size = shelf_pack(sizes, max_width=520, padding=1)
+        rects = [pygame.Rect(position, size) for position, size in zip(positions, sizes)]
+        for index, rect in enumerate(rects):
+            self.assertTrue(pygame.Rect((0, 0), atlas_size).contains(rect))
+            self.assertEqual(rect.collidelist(rects[:index] + rects[index + 1:]), -1)
+
+    def test_atlas_groups_follow_asset_directories(self):
+        self.assertEqual(atlas_group(project_path(*OBJECTS, "apple.png"), PROJECT_ROOT), project_path(*OBJECTS))
+        self.assertEqual(atlas_group(project_path("assets", "ui", "gear_dark.png"), PROJECT_ROOT), project_path("assets", "ui"))
+        self.assertIsNone(atlas_group(project_path("assets", "branding", "shiya_app_icon_256.png"), PROJECT_ROOT))
+
+    def test_atlas_preserves_sprite_pixels(self):
+        sprite = pygame.Surface((4, 3), pygame.SRCALPHA)
+        sprite.fill((200, 100, 50, 128))
+        sprite.set_at((1, 1), (10, 20, 30, 0))
+        atlas = build_texture_atlas({"a": sprite, "b": pygame.Surface((6, 6), pygame.SRCALPHA), "huge": pygame.Surface((300, 2))})
+        self.assertNotIn("huge", atlas)
+        packed = atlas.subsurface("a")
+        self.assertIs(packed.get_parent(), atlas.surface)
+        self.assertEqual(pygame.image.tobytes(packed, "RGBA"), pygame.image.tobytes(sprite, "RGBA"))
+
+    def test_loader_returns_subsurfaces_of_one_atlas_per_game(self):
+        asset_loader.set_asset_pack(None)
+        apple = load_image_if_exists(project_path(*OBJECTS, "apple.png"))
+        banana = load_image_if_exists(project_path(*OBJECTS, "banana.png"))
+        self.assertIsNotNone(apple.get_parent())
+        self.assertIs(apple.get_parent(), banana.get_parent())
+        decoded = pygame.image.load(str(project_path(*OBJECTS, "apple.png")))
+        self.assertEqual(pygame.image.tobytes(apple, "RGBA"), pygame.image.tobytes(decoded, "RGBA"))
+        self.assertEqual(load_image_if_exists(project_path(*OBJECTS, "apple.png"), (40, 40)).get_size(), (40, 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,12 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import asset_loader, frame_clock
+from core.quality_governor import QUALITY_LOW, QualityGovernor
 from games.accommodation.catch_fruit.scenes.root_scene import CatchFruitScene
 
 
@@ -140,8 +141,25 @@ class CatchFruitSceneTests(unittest.TestCase):
         scene.scoring.success_count = 3
         scene.scoring.failure_count = 1
         scene.scoring.score = 46
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "accommodation.catch_fruit")
         self.assertEqual(manager.sound_manager.completed_calls, 1)
+
+    def test_low_quality_skips_fruit_halos(self):
+        manager = _ManagerStub()
+        manager.quality = QualityGovernor(1 / 60)
+        scene = CatchFruitScene(manager)
+        scene._start_game()
+        screen = pygame.Surface((scene.width, scene.height))
+        scene.draw(screen)
+        fruits = len(scene.round_data["fruits"])
+        self.assertGreater(fruits, 0)
+        before = asset_loader.image_allocations()
+        scene.draw(screen)
+        self.assertEqual(asset_loader.image_allocations() - before, fruits)
+        manager.quality.tier = QUALITY_LOW
+        before = asset_loader.image_allocations()
+        scene.draw(screen)
+        self.assertEqual(asset_loader.image_allocations() - before, 0)
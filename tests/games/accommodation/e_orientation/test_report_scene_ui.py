@@ -7,6 +7,7 @@ import pygame
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core import frame_clock
 from games.accommodation.e_orientation.i18n import TRANSLATIONS
 from games.accommodation.e_orientation.scenes.report_scene import ReportScene
 from tests.ui_test_base import UITestCase
@@ -72,7 +73,7 @@ class TestReportSceneUI(UITestCase):
         updated_sum = sum(self.get_surface_average_color(updated_frame)[:3])
 
         if initial_sum == updated_sum:
-            with patch("time.time", return_value=self.scene.enter_started_at + 10):
+            with patch("core.frame_clock.now", return_value=self.scene.enter_started_at + 10):
                 final_frame = self.capture_frame(self.scene)
                 final_sum = sum(self.get_surface_average_color(final_frame)[:3])
                 self.assertNotEqual(initial_sum, final_sum)
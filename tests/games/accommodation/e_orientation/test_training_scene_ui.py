@@ -6,6 +6,7 @@ import unittest
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.input_events import EventFilter
 from tests.ui_test_base import UITestCase
 from games.accommodation.e_orientation.scenes.training_scene import TrainingScene
 
@@ -33,6 +34,20 @@ class TestTrainingSceneUI(UITestCase):
         expected_size = E_SIZE_LEVELS[expected_level_index]
         self.assertEqual(self.scene.base_size, expected_size)
     
+    def test_focus_loss_pauses_through_event_filter(self):
+        """事件过滤开启后，窗口失焦仍能触发自动暂停"""
+        event_filter = EventFilter()
+        try:
+            event_filter.install()
+            pygame.event.clear()
+            pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+            events = pygame.event.get()
+        finally:
+            event_filter.uninstall()
+        self.assertIn(pygame.WINDOWFOCUSLOST, [event.type for event in events])
+        self.scene.handle_events(events)
+        self.assertTrue(self.scene.is_paused)
+
     def test_e_char_rendering_basic(self):
         """测试E字的基本渲染"""
         # 捕获初始帧
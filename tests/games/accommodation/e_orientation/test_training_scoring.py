@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.accommodation.e_orientation.scenes.training_scene import TrainingScene
 
 
@@ -83,7 +83,7 @@ class TrainingScoringTests(unittest.TestCase):
         self.assertIsNone(manager.last_scene)
         self.assertEqual(len(manager.data_manager.saved), 0)
 
-        scene.finish_transition_ends_at = time.time() - 0.01
+        scene.finish_transition_ends_at = frame_clock.now() - 0.01
         scene.update()
 
         self.assertEqual(manager.current_result["correct"], 1)
@@ -124,12 +124,12 @@ class TrainingScoringTests(unittest.TestCase):
         self.assertEqual(manager.sound_manager.completed_calls, 1)
 
         # 仍在音频时长内，不应跳转
-        scene.finish_transition_ends_at = time.time() + 0.2
+        scene.finish_transition_ends_at = frame_clock.now() + 0.2
         scene.update()
         self.assertIsNone(manager.last_scene)
 
         # 超过结束时间后跳转
-        scene.finish_transition_ends_at = time.time() - 0.01
+        scene.finish_transition_ends_at = frame_clock.now() - 0.01
         scene.update()
         self.assertEqual(manager.last_scene, "report")
 
@@ -142,7 +142,7 @@ class TrainingScoringTests(unittest.TestCase):
         answer_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)
         scene.handle_events([answer_event])
 
-        remaining = scene.finish_transition_ends_at - time.time()
+        remaining = scene.finish_transition_ends_at - frame_clock.now()
         self.assertGreaterEqual(remaining, 1.0)
         self.assertLessEqual(remaining, 1.25)
 
@@ -155,7 +155,7 @@ class TrainingScoringTests(unittest.TestCase):
         answer_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)
         scene.handle_events([answer_event])
 
-        remaining = scene.finish_transition_ends_at - time.time()
+        remaining = scene.finish_transition_ends_at - frame_clock.now()
         self.assertGreaterEqual(remaining, 0.30)
         self.assertLessEqual(remaining, 0.45)
 
@@ -196,11 +196,11 @@ class TrainingScoringTests(unittest.TestCase):
         manager.settings["session_duration_minutes"] = 1
         scene = TrainingScene(manager)
 
-        scene.start_time = time.time() - 61
+        scene.start_time = frame_clock.now() - 61
         scene.update()
 
         self.assertTrue(scene.finish_transition_active)
-        scene.finish_transition_ends_at = time.time() - 0.01
+        scene.finish_transition_ends_at = frame_clock.now() - 0.01
         scene.update()
         self.assertEqual(manager.last_scene, "report")
 
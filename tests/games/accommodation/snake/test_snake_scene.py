@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.accommodation.snake.scenes.root_scene import SnakeFocusScene
 
 
@@ -94,7 +94,7 @@ class SnakeFocusSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = SnakeFocusScene(manager)
         scene._start_game()
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "accommodation.snake")
@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.amblyopia.fruit_slice.scenes.root_scene import FruitSliceScene
 
 
@@ -116,7 +116,7 @@ class FruitSliceSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = FruitSliceScene(manager)
         scene._start_game()
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "amblyopia.fruit_slice")
@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.amblyopia.precision_aim.scenes.root_scene import PrecisionAimScene
 from games.amblyopia.precision_aim.services.board_service import PrecisionAimBoardService
 
@@ -82,8 +82,8 @@ class PrecisionAimSceneTests(unittest.TestCase):
             "challenge_shift": 0.0,
             "stage_index": 1,
         }
-        scene.session.round_started_at = time.time() - 1.2
-        scene.session.tick(time.time())
+        scene.session.round_started_at = frame_clock.now() - 1.2
+        scene.session.tick(frame_clock.now())
         scene._handle_shot(200, 200)
         self.assertEqual(scene.scoring.success_count, 1)
         self.assertGreater(scene.scoring.score, 0)
@@ -114,7 +114,7 @@ class PrecisionAimSceneTests(unittest.TestCase):
         scene.scoring.failure_count = 1
         scene.scoring.center_hit_count = 2
         scene.scoring.score = 52
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "amblyopia.precision_aim")
@@ -124,7 +124,7 @@ class PrecisionAimSceneTests(unittest.TestCase):
     def test_background_switches_between_checker_and_stripe(self):
         scene = PrecisionAimScene(_ManagerStub())
         scene._start_game()
-        scene.background_switched_at = time.time() - 7.0
+        scene.background_switched_at = frame_clock.now() - 7.0
         current_mode = scene.background_mode
         scene.update()
         self.assertNotEqual(scene.background_mode, current_mode)
@@ -154,7 +154,7 @@ class PrecisionAimSceneTests(unittest.TestCase):
         scene.scoring.success_count = 5
         scene.scoring.failure_count = 1
         scene.scoring.center_hit_count = 3
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.final_stats["center_hit_rate"], 60.0)
 
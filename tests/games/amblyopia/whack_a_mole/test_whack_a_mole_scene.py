@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.amblyopia.whack_a_mole.scenes.root_scene import WhackAMoleScene
 
 
@@ -73,8 +73,8 @@ class WhackAMoleSceneTests(unittest.TestCase):
         scene = WhackAMoleScene(manager)
         scene._start_game()
         pos = scene.round_data["target_center"]
-        scene.session.round_started_at = time.time() - 1.0
-        scene.session.tick(time.time())
+        scene.session.round_started_at = frame_clock.now() - 1.0
+        scene.session.tick(frame_clock.now())
         scene._handle_hit(pos)
         self.assertEqual(scene.scoring.success_count, 1)
         self.assertGreater(scene.scoring.score, 0)
@@ -84,7 +84,7 @@ class WhackAMoleSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = WhackAMoleScene(manager)
         scene._start_game()
-        scene.session.round_started_at = time.time() - scene.session.ROUND_SECONDS
+        scene.session.round_started_at = frame_clock.now() - scene.session.ROUND_SECONDS
         scene.update()
         self.assertGreaterEqual(scene.scoring.failure_count, 1)
         self.assertEqual(manager.sound_manager.wrong_calls, 1)
@@ -93,7 +93,7 @@ class WhackAMoleSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = WhackAMoleScene(manager)
         scene._start_game()
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "amblyopia.whack_a_mole")
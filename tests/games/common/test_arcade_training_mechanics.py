@@ -1,10 +1,13 @@
 import os
 import unittest
+from unittest.mock import patch
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
+from core.quality_governor import QUALITY_HIGH, QUALITY_LOW, QualityGovernor
 from games.common.training_runtime.arcade_scene import ArcadeGameConfig, ArcadeTrainingScene
 
 
@@ -267,10 +270,9 @@ class ArcadeTrainingMechanicTests(unittest.TestCase):
         scene.session_started_at = 97.0
         screen_a = pygame.Surface((scene.width, scene.height))
         screen_b = pygame.Surface((scene.width, scene.height))
-        from unittest.mock import patch
-        with patch("games.common.training_runtime.arcade_scene.time.time", return_value=100.0):
+        with patch("core.frame_clock.now", return_value=100.0):
             scene.draw(screen_a)
-        with patch("games.common.training_runtime.arcade_scene.time.time", return_value=104.0):
+        with patch("core.frame_clock.now", return_value=104.0):
             scene.draw(screen_b)
         sample_points = [
             (scene.play_area.x + 28, scene.play_area.y + 28),
@@ -307,12 +309,44 @@ class ArcadeTrainingMechanicTests(unittest.TestCase):
         scene._start_session()
         scene.state = scene.STATE_PLAY
         screen = pygame.Surface((scene.width, scene.height))
-        with unittest.mock.patch("games.common.training_runtime.arcade_scene.time.time", return_value=100.0):
+        with patch("core.frame_clock.now", return_value=100.0):
             scene.draw(screen)
         outside_point = (scene.play_area.x - 8, scene.play_area.y + 28)
         inside_point = (scene.play_area.x + 28, scene.play_area.y + 28)
         self.assertNotEqual(screen.get_at(outside_point)[:3], screen.get_at(inside_point)[:3])
 
+    def test_amblyopia_grating_background_drifts_between_frames(self):
+        manager = _ManagerStub()
+        config = ArcadeGameConfig(
+            game_id="amblyopia.precision_aim",
+            category="amblyopia",
+            name="Precision Aim Target",
+            name_key="game.amblyopia.precision_aim",
+            title_key="precision_aim.title",
+            subtitle_key="precision_aim.subtitle",
+            guide_key="precision_aim.play.guide",
+            metric_label_key="precision_aim.metric.label",
+            help_steps=("precision_aim.help.step1", "precision_aim.help.step2", "precision_aim.help.step3"),
+            mechanic_type="precision_aim",
+            theme_color=(208, 104, 104),
+            difficulty_level=4,
+            play_background_style="amblyopia_grating",
+        )
+        scene = ArcadeTrainingScene(manager, config)
+        scene._start_session()
+        scene.session_started_at = 100.0
+        scene.state = scene.STATE_PLAY
+        screens = []
+        for now in (100.0, 100.5):
+            screen = pygame.Surface((scene.width, scene.height))
+            with patch("core.frame_clock.now", return_value=now):
+                scene._draw_amblyopia_stimulus_bg(screen)
+            screens.append(screen)
+        point = (scene.play_area.x + 40, scene.play_area.y + 40)
+        self.assertNotEqual(screens[0].get_at(point)[:3], screens[1].get_at(point)[:3])
+        color = screens[0].get_at(point)
+        self.assertEqual(color.r, color.g)
+
     def test_default_play_background_stays_light_without_stimulus_style(self):
         manager = _ManagerStub()
         config = ArcadeGameConfig(
@@ -337,6 +371,40 @@ class ArcadeTrainingMechanicTests(unittest.TestCase):
         sample = screen.get_at((scene.play_area.x + 40, scene.play_area.y + 40))[:3]
         self.assertEqual(sample, (245, 250, 255))
 
+    def test_low_quality_sheds_decorations_but_keeps_stimulus(self):
+        manager = _ManagerStub()
+        manager.quality = QualityGovernor(1.0 / 60)
+        config = ArcadeGameConfig(
+            game_id="amblyopia.precision_aim",
+            category="amblyopia",
+            name="Precision Aim Target",
+            name_key="game.amblyopia.precision_aim",
+            title_key="precision_aim.title",
+            subtitle_key="precision_aim.subtitle",
+            guide_key="precision_aim.play.guide",
+            metric_label_key="precision_aim.metric.label",
+            help_steps=("precision_aim.help.step1", "precision_aim.help.step2", "precision_aim.help.step3"),
+            mechanic_type="precision_aim",
+            theme_color=(208, 104, 104),
+            difficulty_level=4,
+            play_background_style="amblyopia_stimulus",
+        )
+        scene = ArcadeTrainingScene(manager, config)
+        scene._start_session()
+        scene.state = scene.STATE_PLAY
+        screens = {}
+        for tier in (QUALITY_HIGH, QUALITY_LOW):
+            manager.quality.tier = tier
+            screens[tier] = pygame.Surface((scene.width, scene.height))
+            with patch("core.frame_clock.now", return_value=100.0):
+                scene.draw(screens[tier])
+        stimulus = scene.play_area.inflate(-16, -16)
+        self.assertEqual(
+            pygame.image.tobytes(screens[QUALITY_HIGH].subsurface(stimulus), "RGB"),
+            pygame.image.tobytes(screens[QUALITY_LOW].subsurface(stimulus), "RGB"),
+        )
+        self.assertNotEqual(screens[QUALITY_HIGH].get_at((110, 78)), screens[QUALITY_LOW].get_at((110, 78)))
+
 
 if __name__ == "__main__":
     unittest.main()
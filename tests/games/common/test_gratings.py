@@ -0,0 +1,91 @@
+import math
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pygame.surfarray
+
+from games.common.gratings import (
+    DriftingGabor,
+    DriftingGrating,
+    gabor_luminance,
+    grating_luminance,
+    make_grating_surface,
+)
+from games.common.stimulus_textures import StimulusTextureCache
+
+
+class GratingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def test_grating_period_and_contrast(self):
+        luminance = grating_luminance((40, 4), 0.125, contrast=0.5)
+        self.assertEqual(luminance.shape, (40, 4))
+        np.testing.assert_allclose(luminance[:32], luminance[8:], atol=1e-3)
+        self.assertAlmostEqual(float(luminance.max()), 127.5 * 1.5, delta=0.5)
+        self.assertAlmostEqual(float(luminance.min()), 127.5 * 0.5, delta=0.5)
+
+    def test_horizontal_orientation_varies_along_y(self):
+        luminance = grating_luminance((8, 20), 0.1, orientation=90.0)
+        np.testing.assert_allclose(luminance[0], luminance[7], atol=1e-3)
+        self.assertGreater(float(np.ptp(luminance[0])), 100.0)
+
+    def test_gabor_fades_to_mean_luminance(self):
+        luminance = gabor_luminance((64, 64), 0.1, sigma=6.0, phase=math.pi / 2)
+        self.assertAlmostEqual(float(luminance[0, 0]), 127.5, delta=0.5)
+        self.assertGreater(float(luminance[32, 32]), 200.0)
+
+    def test_surface_is_greyscale(self):
+        surface = make_grating_surface((16, 4), 0.125)
+        pixels = pygame.surfarray.array3d(surface)
+        np.testing.assert_array_equal(pixels[..., 0], pixels[..., 1])
+        np.testing.assert_array_equal(pixels[..., 0], pixels[..., 2])
+
+    def test_drifting_grating_frames_match_rendered_phase(self):
+        for orientation in (0.0, 90.0, 180.0):
+            drifting = DriftingGrating((30, 20), 0.1, orientation=orientation)
+            for step in (0, 3, 7):
+                phase = 2 * math.pi * step / 10
+                expected = pygame.surfarray.array3d(make_grating_surface((30, 20), 0.1, 1.0, orientation, phase))
+                actual = pygame.surfarray.array3d(drifting.frame(phase))
+                self.assertLessEqual(int(np.abs(actual.astype(int) - expected.astype(int)).max()), 1)
+
+    def test_oblique_drifting_grating_has_no_phase_jitter(self):
+        for orientation in (45.0, 135.0):
+            drifting = DriftingGrating((30, 20), 1 / 24, orientation=orientation)
+            self.assertAlmostEqual(drifting.period, 24 * math.sqrt(2), places=4)
+            for phase in (0.0, 0.4, 1.3, 2.9, 4.4, 6.1):
+                shown = drifting.frame_phase(phase)
+                gap = abs((shown - phase + math.pi) % (2 * math.pi) - math.pi)
+                self.assertLessEqual(gap, math.pi / drifting.period + 1e-6)
+                expected = pygame.surfarray.array3d(make_grating_surface((30, 20), 1 / 24, 1.0, orientation, shown))
+                actual = pygame.surfarray.array3d(drifting.frame(phase))
+                self.assertLessEqual(int(np.abs(actual.astype(int) - expected.astype(int)).max()), 1)
+
+    def test_drifting_frames_are_cached_by_quantized_phase(self):
+        drifting = DriftingGrating((30, 20), 0.1, orientation=45.0)
+        self.assertIs(drifting.frame(0.0), drifting.frame(2 * math.pi))
+        self.assertEqual(drifting.frame(1.0).get_size(), (30, 20))
+        gabor = DriftingGabor((24, 24), 0.1, sigma=5.0, phase_steps=8)
+        self.assertIs(gabor.frame(0.01), gabor.frame(0.0))
+        self.assertIsNot(gabor.frame(math.pi), gabor.frame(0.0))
+
+    def test_texture_cache_reuses_grating(self):
+        cache = StimulusTextureCache()
+        target = pygame.Surface((50, 30))
+        for frame in range(20):
+            cache.blit_grating(target, (0, 0), (50, 30), 1 / 24, 0.9, 45.0, phase=frame * 0.3)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from games.common import particles
+from games.common.particles import FADE_LEVELS, ParticleSystem, fade_level
+
+
+class ParticleSystemTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        particles.clear_dot_sprites()
+        pygame.quit()
+
+    def test_spark_step_matches_scalar_physics(self):
+        system = ParticleSystem(8)
+        system.emit(10.0, 20.0, 2.0, -3.0, (200, 100, 50), 5, 4.0)
+        x, y, vx, vy, size = 10.0, 20.0, 2.0, -3.0, 4.0
+        for _ in range(3):
+            system.step()
+            x += vx
+            y += vy
+            vy += 0.16
+            vx *= 0.96
+            vy *= 0.96
+            size = max(1.0, size * 0.985)
+        self.assertAlmostEqual(float(system.x[0]), x, places=4)
+        self.assertAlmostEqual(float(system.y[0]), y, places=4)
+        self.assertAlmostEqual(float(system.size[0]), size, places=4)
+        system.step()
+        system.step()
+        self.assertEqual(len(system), 0)
+
+    def test_rings_grow_and_dead_particles_are_compacted(self):
+        system = ParticleSystem(8)
+        system.emit(0.0, 0.0, 0.0, 0.0, (255, 255, 255), [1, 3, 2], 10.0, kind="ring")
+        system.step()
+        self.assertEqual(len(system), 2)
+        self.assertEqual(system.lifetime[:2].tolist(), [2.0, 1.0])
+        self.assertAlmostEqual(float(system.size[0]), 10.9, places=4)
+
+    def test_capacity_drops_oldest_particles(self):
+        system = ParticleSystem(4)
+        system.emit([0, 1, 2], 0.0, 0.0, 0.0, (255, 0, 0), 10, 2.0)
+        system.emit([3, 4, 5], 0.0, 0.0, 0.0, [(0, 255, 0), (0, 0, 255), (0, 255, 0)], 10, 2.0)
+        self.assertEqual(len(system), 4)
+        self.assertEqual(system.x[:4].tolist(), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(len(system._palette), 3)
+
+    def test_draw_uses_quantized_cached_sprites(self):
+        self.assertEqual(fade_level(30, 30), FADE_LEVELS)
+        self.assertEqual(fade_level(0.1, 30), 1)
+        particles.clear_dot_sprites()
+        system = ParticleSystem(64)
+        system.emit(list(range(10, 50)), 20.0, 0.0, 0.0, (240, 120, 60), 30, 3.0)
+        screen = pygame.Surface((64, 40))
+        system.draw(screen)
+        self.assertEqual(len(particles._DOT_SPRITES), 1)
+        self.assertEqual(tuple(screen.get_at((20, 20)))[:3], (240, 120, 60))
+        system.lifetime[:40] = 15
+        screen.fill((0, 0, 0))
+        system.draw(screen, offset=(0, 5))
+        self.assertEqual(tuple(screen.get_at((20, 25)))[:3], (120, 60, 30))
+        self.assertEqual(len(particles._DOT_SPRITES), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
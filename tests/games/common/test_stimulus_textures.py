@@ -0,0 +1,75 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from games.common.stimulus_textures import StimulusTextureCache, scroll_area, tint_toward_white
+
+
+LIGHT = (240, 240, 240)
+DARK = (20, 20, 20)
+
+
+class StimulusTextureCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def test_scroll_area_wraps_within_period(self):
+        self.assertEqual(scroll_area(0, 36, (10, 5)).x, 0)
+        self.assertEqual(scroll_area(5, 36, (10, 5)).x, 31)
+        self.assertEqual(scroll_area(-5, 36, (10, 5)).x, 5)
+        self.assertEqual(scroll_area(41, 36, (10, 5)).x, 31)
+
+    def test_stripes_shift_right_with_offset(self):
+        cache = StimulusTextureCache()
+        target = pygame.Surface((60, 10))
+        cache.blit_stripes(target, (0, 0), (60, 10), 10, LIGHT, DARK, shift=0)
+        self.assertEqual(target.get_at((0, 0))[:3], LIGHT)
+        self.assertEqual(target.get_at((10, 0))[:3], DARK)
+        cache.blit_stripes(target, (0, 0), (60, 10), 10, LIGHT, DARK, shift=4)
+        self.assertEqual(target.get_at((3, 0))[:3], DARK)
+        self.assertEqual(target.get_at((4, 0))[:3], LIGHT)
+        self.assertEqual(target.get_at((14, 0))[:3], DARK)
+
+    def test_checker_rows_move_in_opposite_directions(self):
+        cache = StimulusTextureCache()
+        target = pygame.Surface((40, 20))
+        cache.blit_checker(target, (0, 0), (40, 20), 10, LIGHT, DARK, row_shifts=(3, -3))
+        self.assertEqual(target.get_at((3, 0))[:3], LIGHT)
+        self.assertEqual(target.get_at((2, 0))[:3], DARK)
+        self.assertEqual(target.get_at((6, 10))[:3], DARK)
+        self.assertEqual(target.get_at((7, 10))[:3], LIGHT)
+
+    def test_textures_are_reused_across_frames(self):
+        cache = StimulusTextureCache()
+        target = pygame.Surface((80, 60))
+        for shift in range(1, 40):
+            cache.blit_checker(target, (0, 0), (80, 60), 16, LIGHT, DARK, row_shifts=(shift, -shift))
+            cache.blit_stripes(target, (0, 0), (80, 60), 12, LIGHT, DARK, shift=shift)
+        self.assertEqual(len(cache), 3)
+        first = cache.rounded_mask((80, 60), 18)
+        self.assertIs(cache.rounded_mask((80, 60), 18), first)
+        self.assertEqual(first.get_at((0, 0)).a, 0)
+        self.assertEqual(first.get_at((40, 30)).a, 255)
+
+    def test_cache_is_bounded(self):
+        cache = StimulusTextureCache(max_entries=2)
+        for width in (10, 20, 30):
+            cache.stripe_texture((width, 10), 4, LIGHT, DARK)
+        self.assertEqual(len(cache), 2)
+
+    def test_tint_matches_white_panel_blend(self):
+        self.assertEqual(tint_toward_white((0, 0, 0), 0), (0, 0, 0))
+        self.assertEqual(tint_toward_white((24, 24, 24), 255), (255, 255, 255))
+        self.assertEqual(tint_toward_white((24, 24, 24), 48), (67, 67, 67))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from games.common.swept_collision import move_box, reflect, sweep_box
+
+
+class SweptCollisionTests(unittest.TestCase):
+    def test_sweep_finds_time_of_impact_and_normal(self):
+        t, normal = sweep_box((0, 0, 10, 10), 40, 0, (30, 0, 10, 10))
+        self.assertAlmostEqual(t, 0.5)
+        self.assertEqual(normal, (-1.0, 0.0))
+        self.assertIsNone(sweep_box((0, 0, 10, 10), 40, 0, (30, 20, 10, 10)))
+        self.assertIsNone(sweep_box((0, 0, 10, 10), -40, 0, (30, 0, 10, 10)))
+
+    def test_overlap_only_counts_while_approaching(self):
+        self.assertEqual(sweep_box((8, 0, 10, 10), -5, 0, (0, 0, 10, 30)), (0.0, (1.0, 0.0)))
+        self.assertIsNone(sweep_box((8, 0, 10, 10), 5, 0, (0, 0, 10, 30)))
+
+    def test_fast_box_does_not_tunnel_and_bounces_twice(self):
+        walls = [(100, -50, 10, 200), (-10, -50, 10, 200)]
+        x, y, velocity, hits = move_box((50, 0, 10, 10), (200, 0), walls)
+        self.assertEqual([hit.index for hit in hits], [0, 1])
+        self.assertAlmostEqual(hits[0].time, 40 / 200)
+        self.assertAlmostEqual(hits[1].time, 130 / 200)
+        self.assertEqual(velocity, (200, 0))
+        self.assertAlmostEqual(x, 70)
+        self.assertEqual(reflect((3, -4), (0.0, 1.0)), (3, 4))
+
+    def test_on_hit_overrides_velocity(self):
+        x, y, velocity, hits = move_box((0, 0, 10, 10), (20, 0), [(20, 0, 10, 10)], on_hit=lambda hit: (-5, 1))
+        self.assertEqual(velocity, (-5, 1))
+        self.assertAlmostEqual(x, 7.5)
+        self.assertAlmostEqual(y, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
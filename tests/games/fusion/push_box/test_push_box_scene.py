@@ -6,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.fusion.push_box.scenes.root_scene import FusionPushBoxScene
 from games.fusion.push_box.services.board_service import FusionPushBoxBoardService
 
@@ -101,7 +102,7 @@ class FusionPushBoxSceneTests(unittest.TestCase):
         scene.scoring.total_steps = 14
         scene.scoring.total_pushes = 5
         scene.scoring.best_streak = 2
-        scene.session.session_started_at = __import__("time").time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "fusion.push_box")
@@ -135,7 +136,7 @@ class FusionPushBoxSceneTests(unittest.TestCase):
         }
         scene._attempt_move("left")
         self.assertGreater(scene.restart_pending_until, 0.0)
-        with patch("time.time", return_value=scene.restart_pending_until + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.restart_pending_until + 0.01):
             scene.update()
         self.assertEqual(scene.board_state["player"], FusionPushBoxBoardService().create_level(0)["player"])
         self.assertEqual(manager.sound_manager.wrong_calls, 1)
@@ -166,7 +167,7 @@ class FusionPushBoxSceneTests(unittest.TestCase):
         self.assertFalse(scene.board_service.is_state_solvable(scene.board_state))
         scene._attempt_move("right")
         self.assertGreater(scene.restart_pending_until, 0.0)
-        with patch("time.time", return_value=scene.restart_pending_until + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.restart_pending_until + 0.01):
             scene.update()
         self.assertEqual(scene.board_state["player"], initial_player)
         self.assertEqual(manager.sound_manager.wrong_calls, 1)
@@ -194,7 +195,7 @@ class FusionPushBoxSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = FusionPushBoxScene(manager)
         scene._start_game()
-        scene.restart_pending_until = __import__("time").time() + 5.0
+        scene.restart_pending_until = frame_clock.now() + 5.0
         scene.board_state["player"] = (4, 4)
         scene.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)])
         self.assertEqual(scene.board_state["player"], (4, 4))
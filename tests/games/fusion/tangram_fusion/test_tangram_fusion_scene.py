@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.fusion.tangram_fusion.scenes.root_scene import TangramFusionScene
 from games.common.anaglyph import GLASSES_BACKGROUND
 
@@ -78,7 +78,7 @@ class TangramFusionSceneTests(unittest.TestCase):
         scene.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)])
         self.assertEqual(scene.scoring.success_count, 1)
         self.assertEqual(manager.sound_manager.correct_calls, 1)
-        scene.pending_next_round_at = time.time() - 0.01
+        scene.pending_next_round_at = frame_clock.now() - 0.01
         scene.update()
         self.assertGreater(scene.round_index, initial_round)
 
@@ -106,7 +106,7 @@ class TangramFusionSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = TangramFusionScene(manager)
         scene._start_game()
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "fusion.tangram_fusion")
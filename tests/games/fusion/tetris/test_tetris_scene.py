@@ -1,5 +1,4 @@
 import os
-import time
 import unittest
 from unittest.mock import patch
 
@@ -7,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.fusion.tetris.scenes.root_scene import FusionTetrisScene
 
 
@@ -151,7 +151,7 @@ class FusionTetrisSceneTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = FusionTetrisScene(manager)
         scene._start_game()
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "fusion.tetris")
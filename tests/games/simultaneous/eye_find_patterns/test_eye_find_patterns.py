@@ -1,5 +1,4 @@
 import os
-import time
 import unittest
 from unittest.mock import patch
 
@@ -7,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.simultaneous.eye_find_patterns.scenes.game_scene import EyeFindPatternsScene
 from games.simultaneous.eye_find_patterns.services.scoring_service import EyeFindScoringService
 
@@ -172,7 +172,7 @@ class EyeFindPatternsTests(unittest.TestCase):
         manager = _ManagerStub()
         scene = EyeFindPatternsScene(manager)
         scene._start_game()
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.sound_manager.calls["completed"], 1)
@@ -4,6 +4,7 @@ import unittest
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
+from core.asset_loader import surface_bytes
 
 from games.simultaneous.eye_find_patterns.services import EyeFindPatternService, EyeFindSessionService
 
@@ -81,6 +82,53 @@ class EyeFindServicesTests(unittest.TestCase):
         self.assertLess(pixel[2], 32)
         self.assertGreater(pixel[3], 0)
 
+    def test_patterns_and_composites_are_cached(self):
+        service = EyeFindPatternService()
+        color = service.PATTERN_COLORS[0]
+        self.assertIs(service.build_pattern_surface("leaf", 140, color), service.build_pattern_surface("leaf", 140, color))
+        left = service.filtered_pattern("leaf", 140, color, "glasses", "left_red_right_blue", "left")
+        self.assertIs(service.filtered_pattern("leaf", 140, color, "glasses", "left_red_right_blue", "left"), left)
+        composite, offset = service.composite_patterns("leaf", 140, color, "glasses", "left_red_right_blue", (30, -10))
+        self.assertEqual(composite.get_size(), (170, 150))
+        self.assertEqual(offset, (0, 10))
+        self.assertIs(service.composite_patterns("leaf", 140, color, "glasses", "left_red_right_blue", (30, -10))[0], composite)
+
+    def test_composite_matches_direct_blend(self):
+        service = EyeFindPatternService()
+        color = service.PATTERN_COLORS[2]
+        left = service.filtered_pattern("heart", 140, color, "glasses", "left_red_right_blue", "left")
+        right = service.filtered_pattern("heart", 140, color, "glasses", "left_red_right_blue", "right")
+        left_rect = left.get_rect(topleft=(20, 0))
+        right_rect = right.get_rect(topleft=(0, 12))
+        direct = service.blend_filtered_patterns((160, 152), left, left_rect, right, right_rect, use_offset_crop=False)
+        composite, offset = service.composite_patterns("heart", 140, color, "glasses", "left_red_right_blue", (-20, 12))
+        self.assertEqual(offset, (20, 0))
+        self.assertEqual(pygame.image.tobytes(composite, "RGBA"), pygame.image.tobytes(direct, "RGBA"))
+
+    def test_composite_cache_is_bounded(self):
+        service = EyeFindPatternService()
+        service.MAX_COMPOSITES = 3
+        for dx in range(6):
+            service.composite_patterns("star", 40, service.PATTERN_COLORS[0], "glasses", "left_red_right_blue", (dx, 0))
+        self.assertEqual(len(service._composites), 3)
+
+        service = EyeFindPatternService()
+        first, _offset = service.composite_patterns("star", 40, service.PATTERN_COLORS[0], "glasses", "left_red_right_blue", (0, 0))
+        service.MAX_COMPOSITE_BYTES = surface_bytes(first) * 2
+        for dx in range(1, 6):
+            service.composite_patterns("star", 40, service.PATTERN_COLORS[0], "glasses", "left_red_right_blue", (dx, 0))
+        self.assertLessEqual(service._composite_bytes, service.MAX_COMPOSITE_BYTES)
+        self.assertEqual(service._composite_bytes, sum(surface_bytes(item[0]) for item in service._composites.values()))
+        service.composite_patterns("star", 40, service.PATTERN_COLORS[0], "glasses", "left_red_right_blue", (400, 0))
+        self.assertNotIn(("star", 40, tuple(service.PATTERN_COLORS[0]), "glasses", "left_red_right_blue", (400, 0)), service._composites)
+
+    def test_prebake_covers_every_pattern_and_color(self):
+        service = EyeFindPatternService()
+        service.prebake(32, filter_directions=("left_red_right_blue",))
+        expected = len(service.PATTERN_IDS) * len(service.PATTERN_COLORS)
+        self.assertEqual(len(service._patterns), expected)
+        self.assertEqual(len(service._filtered), expected * 2)
+
 
 if __name__ == "__main__":
     unittest.main()
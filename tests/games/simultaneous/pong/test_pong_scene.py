@@ -1,5 +1,4 @@
 import os
-import time
 import unittest
 from unittest.mock import patch
 
@@ -7,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.simultaneous.pong.scenes.root_scene import PongScene
 
 
@@ -103,12 +103,28 @@ class PongSceneTests(unittest.TestCase):
         self.assertGreater(scene.ball_vx, 5.0)
         self.assertEqual(scene.player_hits, 1)
 
+    def test_fast_ball_cannot_tunnel_through_paddle(self):
+        manager = _ManagerStub()
+        manager.frame_scale = 3.0
+        scene = PongScene(manager)
+        scene._start_match()
+        scene.serve_until = 0
+        paddle = scene._player_paddle_rect()
+        scene.ball_x = paddle.right + 14
+        scene.ball_y = paddle.centery
+        scene.ball_vx = -8.6
+        scene.ball_vy = 0.0
+        scene.update()
+        self.assertEqual(scene.player_hits, 1)
+        self.assertGreater(scene.ball_vx, 0)
+        self.assertGreaterEqual(scene.ball_x - 10, paddle.right)
+
     def test_frame_scale_keeps_paddle_motion_consistent(self):
         manager = _ManagerStub()
         manager.frame_scale = 2.0
         scene = PongScene(manager)
         scene._start_match()
-        scene.serve_until = time.time() + 5
+        scene.serve_until = frame_clock.now() + 5
         initial_y = scene.player_y
         scene.player_move = 1
         scene.update()
@@ -6,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.simultaneous.spot_difference.scenes.root_scene import SpotDifferenceScene
 from games.simultaneous.spot_difference.services import SpotDifferenceBoardService
 
@@ -67,7 +68,7 @@ class SpotDifferenceSceneTests(unittest.TestCase):
         self.assertEqual(scene.state, scene.STATE_PLAY)
         scene.selected_index = scene.round_data["diff_index"]
         scene.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
-        scene.session.session_started_at = __import__("time").time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "simultaneous.spot_difference")
@@ -157,7 +158,7 @@ class SpotDifferenceSceneTests(unittest.TestCase):
         self.assertGreater(scene.round_flash_until, 0.0)
         self.assertIs(scene.round_data, original_round)
         scene.feedback_until = 0.0
-        scene.round_flash_until = __import__("time").time() - 0.1
+        scene.round_flash_until = frame_clock.now() - 0.1
         scene.update()
         self.assertIsNot(scene.round_data, original_round)
 
@@ -170,7 +171,7 @@ class SpotDifferenceSceneTests(unittest.TestCase):
         scene.scoring.score = 60
         scene.scoring.best_combo = 3
         scene.scoring.reaction_times = [1.2, 1.4]
-        scene.session.session_started_at = __import__("time").time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.final_stats["wrong"], 2)
         self.assertEqual(scene.final_stats["accuracy"], round((4 / 6) * 100, 1))
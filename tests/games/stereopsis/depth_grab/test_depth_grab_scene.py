@@ -1,6 +1,5 @@
 import math
 import os
-import time
 import unittest
 from unittest.mock import patch
 
@@ -8,6 +7,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.stereopsis.depth_grab.scenes.root_scene import DepthGrabScene
 from games.stereopsis.depth_grab.services.board_service import DepthGrabBoardService
 
@@ -86,8 +86,8 @@ class DepthGrabSceneTests(unittest.TestCase):
             "correct_index": 1,
             "stage_index": 1,
         }
-        scene.session.round_started_at = time.time() - 1.3
-        scene.session.tick(time.time())
+        scene.session.round_started_at = frame_clock.now() - 1.3
+        scene.session.tick(frame_clock.now())
         scene._resolve_click((200, 120))
         self.assertEqual(scene.scoring.success_count, 1)
         self.assertGreater(scene.scoring.score, 0)
@@ -205,7 +205,7 @@ class DepthGrabSceneTests(unittest.TestCase):
         scene.scoring.success_count = 3
         scene.scoring.failure_count = 1
         scene.scoring.score = 88
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "stereopsis.depth_grab")
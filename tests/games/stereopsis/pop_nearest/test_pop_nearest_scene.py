@@ -1,5 +1,4 @@
 import os
-import time
 import unittest
 from unittest.mock import patch
 
@@ -7,7 +6,9 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.stereopsis.pop_nearest.scenes.root_scene import PopNearestScene
+from games.common.anaglyph import FILTER_RL
 
 
 class _DataManagerStub:
@@ -80,7 +81,7 @@ class PopNearestSceneTests(unittest.TestCase):
         scene.handle_events([pygame.event.Event(pygame.MOUSEMOTION, pos=target, rel=(0, 0), buttons=(0, 0, 0))])
         scene.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(target[0], scene.play_area.bottom - 12))])
         self.assertIsNotNone(scene.active_shot)
-        with patch("time.time", return_value=scene.active_shot["started_at"] + scene.active_shot["duration"] + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.active_shot["started_at"] + scene.active_shot["duration"] + 0.01):
             scene.update()
         self.assertTrue(scene.group_data["balloons"][nearest_index]["popped"])
         self.assertEqual(manager.sound_manager.correct_calls, 1)
@@ -97,7 +98,7 @@ class PopNearestSceneTests(unittest.TestCase):
         scene.handle_events([pygame.event.Event(pygame.MOUSEMOTION, pos=target, rel=(0, 0), buttons=(0, 0, 0))])
         scene.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(target[0], scene.play_area.bottom - 12))])
         self.assertIsNotNone(scene.active_shot)
-        with patch("time.time", return_value=scene.active_shot["started_at"] + scene.active_shot["duration"] + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.active_shot["started_at"] + scene.active_shot["duration"] + 0.01):
             scene.update()
         self.assertFalse(scene.group_data["balloons"][wrong_index]["popped"])
         self.assertEqual(scene.scoring.wrong_pops, 1)
@@ -127,11 +128,11 @@ class PopNearestSceneTests(unittest.TestCase):
         nearest_index = next(i for i, b in enumerate(scene.group_data["balloons"]) if b["depth_rank"] == 0)
         target = scene._balloon_display_state(scene.group_data["balloons"][nearest_index])["center"]
         scene.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(target[0], scene.play_area.bottom - 12))])
-        with patch("time.time", return_value=scene.active_shot["started_at"] + scene.active_shot["duration"] + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.active_shot["started_at"] + scene.active_shot["duration"] + 0.01):
             scene.update()
         self.assertIs(scene.group_data, current_group)
         self.assertTrue(scene.pending_group_advance)
-        with patch("time.time", return_value=scene.impact_effect["started_at"] + scene.impact_effect["duration"] + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.impact_effect["started_at"] + scene.impact_effect["duration"] + 0.01):
             scene.update()
         self.assertIsNot(scene.group_data, current_group)
 
@@ -181,7 +182,7 @@ class PopNearestSceneTests(unittest.TestCase):
         scene = PopNearestScene(manager)
         scene._start_game()
         first_group = scene.group_data
-        scene.session.group_started_at = time.time() - scene.session.group_seconds
+        scene.session.group_started_at = frame_clock.now() - scene.session.group_seconds
         scene.update()
         self.assertIsNot(scene.group_data, first_group)
         self.assertEqual(manager.sound_manager.wrong_calls, 1)
@@ -213,3 +214,18 @@ class PopNearestSceneTests(unittest.TestCase):
             for y in range(180, 381, 40):
                 total += sum(surface.get_at((x, y))[:3])
         self.assertGreater(total, 0)
+
+    def test_stereo_composites_are_reused_across_frames(self):
+        scene = PopNearestScene(_ManagerStub())
+        scene._start_game()
+        surface = pygame.Surface((scene.width, scene.height))
+        scene.draw(surface)
+        cached = dict(scene._stereo_composites)
+        self.assertTrue(cached)
+        scene.draw(surface)
+        self.assertEqual(len(scene._stereo_composites), len(cached))
+        for key, value in cached.items():
+            self.assertIs(scene._stereo_composites[key], value)
+        scene.filter_direction = FILTER_RL
+        scene.draw(surface)
+        self.assertEqual(len(scene._stereo_composites), len(cached) * 2)
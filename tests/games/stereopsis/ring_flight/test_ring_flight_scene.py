@@ -1,5 +1,4 @@
 import os
-import time
 import unittest
 from unittest.mock import patch
 
@@ -7,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.stereopsis.ring_flight.scenes.root_scene import RingFlightScene
 from games.common.anaglyph import FILTER_LR, FILTER_RL
 
@@ -164,7 +164,7 @@ class RingFlightSceneTests(unittest.TestCase):
         scene.plane_x = scene.play_area.centerx
         scene.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
         self.assertIsNotNone(scene.fly_through)
-        with patch("time.time", return_value=scene.fly_through["started_at"] + scene.fly_through["duration"] + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.fly_through["started_at"] + scene.fly_through["duration"] + 0.01):
             scene.update()
         self.assertEqual(scene.scoring.success_count, 1)
         self.assertFalse(scene.awaiting_selection)
@@ -187,7 +187,7 @@ class RingFlightSceneTests(unittest.TestCase):
         scene.plane_x = scene.play_area.centerx
         scene.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
         self.assertIsNotNone(scene.fly_through)
-        with patch("time.time", return_value=scene.fly_through["started_at"] + scene.fly_through["duration"] + 0.01):
+        with patch("core.frame_clock.now", return_value=scene.fly_through["started_at"] + scene.fly_through["duration"] + 0.01):
             scene.update()
         self.assertEqual(scene.scoring.failure_count, 1)
         self.assertTrue(scene.awaiting_selection)
@@ -200,7 +200,7 @@ class RingFlightSceneTests(unittest.TestCase):
         scene.scoring.success_count = 4
         scene.scoring.failure_count = 2
         scene.scoring.score = 90
-        scene.session.session_started_at = time.time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "stereopsis.ring_flight")
@@ -215,6 +215,18 @@ class RingFlightSceneTests(unittest.TestCase):
         scene.update()
         self.assertAlmostEqual(scene.wave["rings"][0]["progress"], initial + scene.RING_SPEED * 2.0)
 
+    def test_drawn_rings_interpolate_between_fixed_steps(self):
+        manager = _ManagerStub()
+        scene = RingFlightScene(manager)
+        scene._start_game()
+        scene.fixed_update(1.0 / 60)
+        ring = scene.wave["rings"][0]
+        manager.interpolation_alpha = 0.5
+        drawn = scene._interpolated_display_rings()[0]
+        expected = scene.board_service.ring_display_state(scene.play_area, dict(ring, progress=ring["progress"] - scene.RING_SPEED / 2))
+        self.assertEqual(drawn["center"], expected["center"])
+        self.assertTrue(scene.FIXED_TIMESTEP)
+
     def test_play_scene_renders_after_resize(self):
         scene = RingFlightScene(_ManagerStub())
         scene._start_game()
@@ -223,6 +235,18 @@ class RingFlightSceneTests(unittest.TestCase):
         scene.draw(surface)
         self.assertGreater(sum(surface.get_at((420, 320))[:3]), 0)
 
+    def test_growing_rings_reuse_quantized_composites(self):
+        scene = RingFlightScene(_ManagerStub())
+        self.assertEqual(scene._quantized_radius(41), 42)
+        self.assertEqual(scene._quantized_radius(40), 40)
+        surface = pygame.Surface((scene.width, scene.height))
+        for radius in range(22, 69):
+            display = {"center": (450, 350), "radius": radius, "thickness": 16, "disparity": 12}
+            scene._draw_ring_sprite(surface, display)
+        self.assertEqual(len(scene._ring_composites), 24)
+        first = scene._ring_composite(40, 16, 12)
+        self.assertIs(scene._ring_composite(40, 16, 12), first)
+
     def test_filter_direction_label_uses_localized_text(self):
         scene = RingFlightScene(_ZhManagerStub())
         self.assertEqual(scene._filter_direction_label(FILTER_LR), "左红右蓝")
@@ -6,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.suppression.find_same.scenes.root_scene import FindSameScene
 from games.suppression.find_same.services import FindSameBoardService
 
@@ -74,7 +75,7 @@ class FindSameSceneTests(unittest.TestCase):
         self.assertEqual(scene.state, scene.STATE_PLAY)
         scene.pending_indices = set(scene.round_data["match_indices"])
         scene._confirm_selection()
-        scene.session.session_started_at = __import__("time").time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "suppression.find_same")
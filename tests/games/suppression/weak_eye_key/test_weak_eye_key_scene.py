@@ -6,6 +6,7 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.suppression.weak_eye_key.scenes.root_scene import WeakEyeKeyScene
 from games.suppression.weak_eye_key.services.board_service import WeakEyeKeyBoardService
 
@@ -118,7 +119,7 @@ class WeakEyeKeySceneTests(unittest.TestCase):
         scene.scoring.best_streak = 2
         scene.scoring.total_find_time = 9.0
         scene.scoring.stage_reached = 2
-        scene.session.session_started_at = __import__("time").time() - scene._session_seconds()
+        scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
         scene.update()
         self.assertEqual(scene.state, scene.STATE_RESULT)
         self.assertEqual(manager.data_manager.saved[-1]["game_id"], "suppression.weak_eye_key")
@@ -1,11 +1,11 @@
 import os
-import time
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import pygame
 
+from core import frame_clock
 from games.accommodation.catch_fruit.game import build_descriptor as build_catch_fruit_descriptor
 from games.amblyopia.precision_aim.game import build_descriptor as build_precision_aim_descriptor
 from games.stereopsis.depth_grab.game import build_descriptor as build_depth_grab_descriptor
@@ -93,7 +93,7 @@ class ProductizedGamesTests(unittest.TestCase):
             if getattr(scene, "show_filter_picker", False):
                 scene.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=scene.filter_start.center)])
             self.assertEqual(scene.state, scene.STATE_PLAY)
-            scene.session.session_started_at = time.time() - scene._session_seconds()
+            scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
             scene.update()
             self.assertEqual(scene.state, scene.STATE_RESULT)
             self.assertEqual(manager.data_manager.saved[-1]["game_id"], descriptor.game_id)
@@ -135,7 +135,7 @@ class ProductizedGamesTests(unittest.TestCase):
             scene.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=start_pos)])
             if getattr(scene, "show_filter_picker", False):
                 scene.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=scene.filter_start.center)])
-            scene.session.session_started_at = time.time() - scene._session_seconds()
+            scene.session.session_started_at = frame_clock.now() - scene._session_seconds()
             scene.update()
             self.assertTrue(scene.final_stats)
             self.assertIn("duration", scene.final_stats)
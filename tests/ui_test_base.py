@@ -7,6 +7,8 @@ import os
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.quality_governor import QualityGovernor
+
 
 class UITestCase(unittest.TestCase):
     """
@@ -259,5 +261,8 @@ class UITestCase(unittest.TestCase):
         
         # 添加apply_training_template方法
         mock_manager.apply_training_template = Mock()
+
+        # 画质档位固定为默认的最高档
+        mock_manager.quality = QualityGovernor(1.0 / 60)
         
         return mock_manager
\ No newline at end of file
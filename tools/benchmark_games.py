@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# 无窗口、无声卡运行；用户数据写到临时目录，不污染本机的训练记录。
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+_DATA_ROOT = tempfile.mkdtemp(prefix="visionseed-bench-")
+os.environ["LOCALAPPDATA"] = _DATA_ROOT
+
+import pygame
+
+from core.game_benchmark import (
+    DEFAULT_FRAMES,
+    DEFAULT_SEED,
+    DEFAULT_SIZES,
+    DEFAULT_WARMUP_FRAMES,
+    compare_reports,
+    run_benchmarks,
+    run_replay_benchmarks,
+)
+from core.input_replay import InputReplay
+from core.scene_manager import SceneManager
+from scenes.category_scene import CategoryScene
+from scenes.game_host_scene import GameHostScene
+from scenes.license_scene import LicenseScene
+from scenes.menu_scene import MenuScene
+from scenes.onboarding_scene import OnboardingScene
+from scenes.system_settings_scene import SystemSettingsScene
+
+
+def _parse_size(text):
+    width, _sep, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main():
+    try:
+        _run()
+    finally:
+        shutil.rmtree(_DATA_ROOT, ignore_errors=True)
+
+
+def _run():
+    parser = argparse.ArgumentParser(description="Benchmark per-game update/draw cost headlessly.")
+    parser.add_argument("--games", default="", help="Comma separated game ids, defaults to every registered game")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(f"{w}x{h}" for w, h in DEFAULT_SIZES),
+        help="Comma separated window sizes, e.g. 900x700,1920x1080",
+    )
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Measured frames per run")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP_FRAMES, help="Unmeasured frames before each run")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed for the global random module")
+    parser.add_argument("--output", default="", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", default="", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Relative slowdown that counts as a regression")
+    parser.add_argument(
+        "--replay",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Replay a recorded session (main.py --record) instead of the scripted runs; may be repeated",
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    manager = SceneManager()
+    manager.settings["sound_enabled"] = False
+    manager.apply_sound_preference()
+
+    if args.replay:
+        # 录像从录制时的顶层场景开始，需要与 main.py 相同的场景登记。
+        manager.register("menu", factory=MenuScene)
+        manager.register("license", factory=LicenseScene)
+        manager.register("onboarding", factory=OnboardingScene)
+        manager.register("category", factory=CategoryScene)
+        manager.register("game_host", factory=GameHostScene)
+        manager.register("system_settings", factory=SystemSettingsScene)
+        report = run_replay_benchmarks(manager, [InputReplay(path) for path in args.replay])
+    else:
+        game_ids = [item.strip() for item in args.games.split(",") if item.strip()] or None
+        sizes = [_parse_size(item) for item in args.sizes.split(",") if item.strip()]
+        report = run_benchmarks(
+            manager,
+            game_ids=game_ids,
+            sizes=sizes,
+            frames=args.frames,
+            warmup_frames=args.warmup,
+            seed=args.seed,
+        )
+    manager.asset_prefetcher.shutdown()
+    pygame.quit()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"Wrote {len(report['results'])} results to {args.output}")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, threshold=args.threshold)
+        for item in regressions:
+            size = "x".join(str(value) for value in item["size"])
+            print(
+                f"REGRESSION {item['game_id']} {size} {item['filter_direction'] or '-'} "
+                f"{item['metric']}: {item['baseline']:.3f} -> {item['current']:.3f}",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
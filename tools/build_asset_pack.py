@@ -0,0 +1,27 @@
+import argparse
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.asset_pack import PACK_FILENAME, build_asset_pack
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack VisionSeed PNG assets into one pre-decoded RGBA file.")
+    parser.add_argument(
+        "--output",
+        default=os.path.join(PROJECT_ROOT, "assets", PACK_FILENAME),
+        help="Output pack path, defaults to assets/asset_pack.bin",
+    )
+    args = parser.parse_args()
+
+    count = build_asset_pack(PROJECT_ROOT, args.output)
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"Packed {count} images into {args.output} ({size_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()